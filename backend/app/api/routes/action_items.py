@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
-from app.core.database import get_db
-from app.schemas.schemas import ActionItem as ActionItemSchema, ActionItemCreate, ActionItemUpdate
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from app.core.database import get_async_db
+from app.core.pagination import MAX_PAGE_SIZE
+from app.schemas.schemas import ActionItem as ActionItemSchema, ActionItemCreate, ActionItemUpdate, ActionItemPage
 from app.services.action_item_service import ActionItemService
 
 router = APIRouter()
@@ -10,28 +11,32 @@ router = APIRouter()
 @router.post("/", response_model=ActionItemSchema)
 async def create_action_item(
     action_item: ActionItemCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new action item"""
-    return ActionItemService.create_action_item(db, action_item)
+    return await ActionItemService.create_action_item_async(db, action_item)
 
-@router.get("/", response_model=List[ActionItemSchema])
+@router.get("/", response_model=ActionItemPage)
 async def get_action_items(
     meeting_id: int = None,
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
+    after: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get action items, optionally filtered by meeting"""
-    return ActionItemService.get_action_items(db, meeting_id=meeting_id, skip=skip, limit=limit)
+    """Get a page of action items, newest first, optionally filtered by meeting"""
+    try:
+        items, next_cursor = await ActionItemService.get_action_items_async(db, meeting_id=meeting_id, after=after, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": items, "next_cursor": next_cursor}
 
 @router.get("/{action_item_id}", response_model=ActionItemSchema)
 async def get_action_item(
     action_item_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific action item by ID"""
-    action_item = ActionItemService.get_action_item(db, action_item_id)
+    action_item = await ActionItemService.get_action_item_async(db, action_item_id)
     if not action_item:
         raise HTTPException(status_code=404, detail="Action item not found")
     return action_item
@@ -40,10 +45,10 @@ async def get_action_item(
 async def update_action_item(
     action_item_id: int,
     action_item_update: ActionItemUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update an action item"""
-    action_item = ActionItemService.update_action_item(db, action_item_id, action_item_update)
+    action_item = await ActionItemService.update_action_item_async(db, action_item_id, action_item_update)
     if not action_item:
         raise HTTPException(status_code=404, detail="Action item not found")
     return action_item
@@ -51,10 +56,10 @@ async def update_action_item(
 @router.delete("/{action_item_id}")
 async def delete_action_item(
     action_item_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete an action item"""
-    success = ActionItemService.delete_action_item(db, action_item_id)
+    success = await ActionItemService.delete_action_item_async(db, action_item_id)
     if not success:
         raise HTTPException(status_code=404, detail="Action item not found")
     return {"message": "Action item deleted successfully"} 
\ No newline at end of file
@@ -0,0 +1,63 @@
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from typing import List, Optional
+from app.core.model_registry import ModelRegistry
+from app.core.prefork import PreforkServer
+from app.services.summarization_service import SummarizationService
+from app.services.transcript_cache_service import TranscriptCacheService
+from app.services.summary_cache_service import SummaryCacheService
+from app.services.transcription_backends import TranscriptionBackends
+from app.services.direct_upload_service import DirectUploadService
+from app.services.audio_blob_service import AudioBlobService
+
+router = APIRouter()
+
+@router.post("/warmup")
+async def warmup_models(models: Optional[List[str]] = Query(None)):
+    """Load models now instead of on first use (default: all models)"""
+    unknown = [name for name in models or [] if name not in ModelRegistry.registered_models()]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown models: {', '.join(unknown)}")
+    
+    results = await run_in_threadpool(ModelRegistry.warmup, models)
+    return {"models": results, "status": ModelRegistry.status()}
+
+@router.get("/models")
+async def get_model_status():
+    """Get the load state of every model"""
+    return {
+        "models": ModelRegistry.status(),
+        "preload": ModelRegistry.preload_models(),
+        "precision_checks": SummarizationService.precision_checks()
+    }
+
+
+@router.get("/memory")
+async def get_memory():
+    """Get the RSS and PSS of this worker and, under the pre-fork launcher, of all workers together"""
+    return await run_in_threadpool(PreforkServer.memory_report)
+
+@router.get("/stats")
+async def get_stats():
+    """Get batching, transcription throughput, cache and storage statistics"""
+    return {
+        "batching": SummarizationService.batching_stats(),
+        "transcription": TranscriptionBackends.stats(),
+        "transcript_cache": await run_in_threadpool(TranscriptCacheService.stats),
+        "summary_cache": await run_in_threadpool(SummaryCacheService.stats),
+        "direct_uploads": await run_in_threadpool(DirectUploadService.stats),
+        "audio_blobs": await run_in_threadpool(AudioBlobService.stats)
+    }
+
+@router.delete("/transcript-cache")
+async def purge_transcript_cache():
+    """Delete every cached transcript"""
+    deleted = await run_in_threadpool(TranscriptCacheService.purge)
+    return {"message": "Transcript cache purged", "deleted": deleted}
+
+
+@router.delete("/summary-cache")
+async def purge_summary_cache():
+    """Delete every cached summary and extraction result"""
+    deleted = await run_in_threadpool(SummaryCacheService.purge)
+    return {"message": "Summary cache purged", "deleted": deleted}
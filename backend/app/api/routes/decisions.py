@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
-from app.core.database import get_db
-from app.schemas.schemas import Decision as DecisionSchema, DecisionCreate, DecisionUpdate
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from app.core.database import get_async_db
+from app.core.pagination import MAX_PAGE_SIZE
+from app.schemas.schemas import Decision as DecisionSchema, DecisionCreate, DecisionUpdate, DecisionPage
 from app.services.decision_service import DecisionService
 
 router = APIRouter()
@@ -10,28 +11,32 @@ router = APIRouter()
 @router.post("/", response_model=DecisionSchema)
 async def create_decision(
     decision: DecisionCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new decision"""
-    return DecisionService.create_decision(db, decision)
+    return await DecisionService.create_decision_async(db, decision)
 
-@router.get("/", response_model=List[DecisionSchema])
+@router.get("/", response_model=DecisionPage)
 async def get_decisions(
     meeting_id: int = None,
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
+    after: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get decisions, optionally filtered by meeting"""
-    return DecisionService.get_decisions(db, meeting_id=meeting_id, skip=skip, limit=limit)
+    """Get a page of decisions, newest first, optionally filtered by meeting"""
+    try:
+        items, next_cursor = await DecisionService.get_decisions_async(db, meeting_id=meeting_id, after=after, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": items, "next_cursor": next_cursor}
 
 @router.get("/{decision_id}", response_model=DecisionSchema)
 async def get_decision(
     decision_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific decision by ID"""
-    decision = DecisionService.get_decision(db, decision_id)
+    decision = await DecisionService.get_decision_async(db, decision_id)
     if not decision:
         raise HTTPException(status_code=404, detail="Decision not found")
     return decision
@@ -40,10 +45,10 @@ async def get_decision(
 async def update_decision(
     decision_id: int,
     decision_update: DecisionUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a decision"""
-    decision = DecisionService.update_decision(db, decision_id, decision_update)
+    decision = await DecisionService.update_decision_async(db, decision_id, decision_update)
     if not decision:
         raise HTTPException(status_code=404, detail="Decision not found")
     return decision
@@ -51,10 +56,10 @@ async def update_decision(
 @router.delete("/{decision_id}")
 async def delete_decision(
     decision_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a decision"""
-    success = DecisionService.delete_decision(db, decision_id)
+    success = await DecisionService.delete_decision_async(db, decision_id)
     if not success:
         raise HTTPException(status_code=404, detail="Decision not found")
     return {"message": "Decision deleted successfully"} 
\ No newline at end of file
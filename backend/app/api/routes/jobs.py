@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from app.core.database import get_db
+from app.schemas.schemas import Job as JobSchema
+from app.services.job_service import JobService
+from app.core.process_manager import ProcessManager
+
+router = APIRouter()
+
+@router.get("/{job_id}", response_model=JobSchema)
+def get_job(
+    job_id: str,
+    db: Session = Depends(get_db)
+):
+    """Get the status and result of a background job"""
+    job = JobService.get_job(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    response = JobService.serialize_job(job)
+    # This process may hold a stale copy of the progress of a job that runs in another one
+    response["progress"] = ProcessManager.newest_progress(response["progress"], ProcessManager.get_progress(job_id))
+    return response
@@ -1,29 +1,44 @@
-from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Form, Body
+from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Form, Body, Query, Request
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional, Dict
-from app.core.database import get_db
+from app.core.database import get_async_db, SessionLocal
 from app.models.models import Meeting
-from app.schemas.schemas import Meeting as MeetingSchema, MeetingCreate, MeetingUpdate
+from app.schemas.schemas import (
+    Meeting as MeetingSchema, MeetingCreate, MeetingUpdate, MeetingDetail, MeetingPage,
+    ActionItem as ActionItemSchema, ActionItemCreate,
+    Decision as DecisionSchema, DecisionCreate
+)
 from app.services.meeting_service import MeetingService
 from app.services.transcription_service import TranscriptionService
+from app.services.transcription_backends import TranscriptionBackends
 from app.services.summarization_service import SummarizationService
 from app.services.calendar_service import CalendarService
 from app.services.action_item_service import ActionItemService
 from app.services.decision_service import DecisionService
+from app.services.job_service import JobService
+from app.services.audio_blob_service import AudioBlobService
+from app.services.direct_upload_service import DirectUploadService
 from app.core.process_manager import ProcessManager
+from app.core.job_worker import JobWorker
+from app.core.pagination import MAX_PAGE_SIZE
+import asyncio
 import json
 import os
-import shutil
 from datetime import datetime, timedelta
 import uuid
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
 
 # Create uploads directory if it doesn't exist
 os.makedirs("uploads", exist_ok=True)
 
-# Temporary storage for uploaded files (in a real app, use a database or proper file storage)
-TEMP_FILES = {}
+# Seconds between checks for new events in the progress stream
+PROGRESS_POLL_INTERVAL = 0.5
+# Comment line sent when nothing happened for this many seconds, to keep proxies from closing the stream
+PROGRESS_KEEPALIVE_SECONDS = 15
 
 router = APIRouter()
 
@@ -34,17 +49,26 @@ class DirectScheduleRequest(BaseModel):
     end_time: datetime
     attendees: Optional[List[Dict[str, str]]] = None
 
+def _meeting_detail(meeting: Meeting, expand: List[str]) -> MeetingDetail:
+    """Response for a meeting with the relationships in ``expand``, which must already be loaded"""
+    # Only the expanded relationships are read: touching another one would lazy load it,
+    # which an AsyncSession cannot do
+    schemas = {"action_items": ActionItemSchema, "decisions": DecisionSchema}
+    expanded = {name: [schemas[name].from_orm(item) for item in getattr(meeting, name)] for name in expand}
+    return MeetingDetail(**MeetingSchema.from_orm(meeting).dict(), **expanded)
+
 @router.post("/", response_model=MeetingSchema)
 async def create_meeting(
     meeting: MeetingCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new meeting with all available fields"""
-    created_meeting = MeetingService.create_meeting(db, meeting)
+    created_meeting = await MeetingService.create_meeting_async(db, meeting)
 
     if meeting.start_time and meeting.end_time:
         try:
-            calendar_event = CalendarService.create_meeting_event(
+            calendar_event = await run_in_threadpool(
+                CalendarService.create_meeting_event,
                 summary=meeting.title,
                 description=meeting.description or "",
                 start_time=meeting.start_time,
@@ -53,9 +77,9 @@ async def create_meeting(
             )
             # Update the meeting with the calendar event ID
             meeting_update_payload = MeetingUpdate(calendar_event_id=calendar_event['event_id'])
-            MeetingService.update_meeting(db, created_meeting.id, meeting_update_payload)
+            await MeetingService.update_meeting_async(db, created_meeting.id, meeting_update_payload)
             # Refresh the created_meeting to include the calendar_event_id
-            created_meeting = MeetingService.get_meeting(db, created_meeting.id) 
+            created_meeting = await MeetingService.get_meeting_async(db, created_meeting.id) 
         except Exception as e:
             # Log the error, but don't fail the meeting creation
             print(f"Failed to schedule meeting {created_meeting.id} on calendar: {e}")
@@ -64,44 +88,69 @@ async def create_meeting(
 
     return created_meeting
 
-@router.get("/", response_model=List[MeetingSchema])
+@router.get("/", response_model=MeetingPage, response_model_exclude_unset=True)
 async def get_meetings(
-    skip: int = 0,
-    limit: int = 100,
+    after: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
     status: Optional[str] = None,
     date_from: Optional[datetime] = None,
     date_to: Optional[datetime] = None,
-    db: Session = Depends(get_db)
+    participant: Optional[str] = None,
+    expand: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all meetings with optional filtering"""
-    return MeetingService.get_meetings(
-        db, 
-        skip=skip, 
-        limit=limit,
-        status=status,
-        date_from=date_from,
-        date_to=date_to
-    )
+    """Get a page of meetings, newest first, with optional filtering.
+
+    ``expand=action_items,decisions`` includes each meeting's action items
+    and/or decisions, fetched for the whole page in one query each.
+    """
+    try:
+        expand_names = MeetingService.parse_expand(expand)
+        meetings, next_cursor = await MeetingService.get_meetings_async(
+            db, 
+            after=after, 
+            limit=limit,
+            status=status,
+            date_from=date_from,
+            date_to=date_to,
+            participant=participant,
+            expand=expand_names
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {
+        "items": [_meeting_detail(meeting, expand_names) for meeting in meetings],
+        "next_cursor": next_cursor
+    }
 
-@router.get("/{meeting_id}", response_model=MeetingSchema)
+@router.get("/{meeting_id}", response_model=MeetingDetail, response_model_exclude_unset=True)
 async def get_meeting(
     meeting_id: int,
-    db: Session = Depends(get_db)
+    expand: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get a specific meeting by ID with all details"""
-    meeting = MeetingService.get_meeting(db, meeting_id)
+    """Get a specific meeting by ID with all details.
+
+    ``expand=action_items,decisions`` includes its action items and/or
+    decisions in the same response.
+    """
+    try:
+        expand_names = MeetingService.parse_expand(expand)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    meeting = await MeetingService.get_meeting_async(db, meeting_id, expand=expand_names)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
-    return meeting
+    return _meeting_detail(meeting, expand_names)
 
 @router.put("/{meeting_id}", response_model=MeetingSchema)
 async def update_meeting(
     meeting_id: int,
     meeting_update: MeetingUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a meeting"""
-    meeting = MeetingService.update_meeting(db, meeting_id, meeting_update)
+    meeting = await MeetingService.update_meeting_async(db, meeting_id, meeting_update)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     return meeting
@@ -109,12 +158,12 @@ async def update_meeting(
 @router.delete("/{meeting_id}")
 async def delete_meeting(
     meeting_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a meeting and its associated calendar event"""
     try:
         # First check if meeting exists
-        meeting = MeetingService.get_meeting(db, meeting_id)
+        meeting = await MeetingService.get_meeting_async(db, meeting_id)
         if not meeting:
             raise HTTPException(status_code=404, detail="Meeting not found")
         
@@ -125,7 +174,7 @@ async def delete_meeting(
             
             if meeting.calendar_event_id:
                 print(f"Deleting calendar event with ID: {meeting.calendar_event_id}")
-                CalendarService.delete_meeting_event(meeting.calendar_event_id)
+                await run_in_threadpool(CalendarService.delete_meeting_event, meeting.calendar_event_id)
                 print("Calendar event deleted successfully")
             else:
                 print("No calendar event ID found for this meeting")
@@ -134,7 +183,7 @@ async def delete_meeting(
             # Continue with database deletion even if calendar deletion fails
         
         # Delete the meeting from database
-        success = MeetingService.delete_meeting(db, meeting_id)
+        success = await MeetingService.delete_meeting_async(db, meeting_id)
         if not success:
             raise HTTPException(status_code=500, detail="Failed to delete meeting")
         
@@ -153,35 +202,35 @@ async def delete_meeting(
 async def upload_audio(
     meeting_id: int,
     file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Upload audio file for a meeting"""
-    meeting = MeetingService.get_meeting(db, meeting_id)
+    meeting = await MeetingService.get_meeting_async(db, meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
-    # Create meeting directory if it doesn't exist
-    meeting_dir = f"uploads/meeting_{meeting_id}"
-    os.makedirs(meeting_dir, exist_ok=True)
-    
-    # Save file
-    file_path = f"{meeting_dir}/{file.filename}"
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-    
-    # Update meeting with audio file path
-    meeting_update = MeetingUpdate(audio_file_path=file_path)
-    updated_meeting = MeetingService.update_meeting(db, meeting_id, meeting_update)
+    # Stream file to disk; a recording that is already stored is reused
+    blob = await AudioBlobService.store_upload_async(db, file)
+    try:
+        await MeetingService.attach_audio_async(db, meeting_id, blob)
+    except Exception:
+        await db.rollback()
+        await db.run_sync(AudioBlobService.release, blob.sha256)
+        raise
     
-    return {"message": f"Audio file {file.filename} uploaded for meeting {meeting_id}", "file_path": file_path}
+    return {
+        "message": f"Audio file {file.filename} uploaded for meeting {meeting_id}",
+        "file_path": blob.path,
+        "audio_sha256": blob.sha256
+    }
 
 @router.get("/{meeting_id}/transcript")
 async def get_transcript(
     meeting_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get transcript for a meeting"""
-    meeting = MeetingService.get_meeting(db, meeting_id)
+    meeting = await MeetingService.get_meeting_async(db, meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
@@ -193,37 +242,45 @@ async def get_transcript(
 @router.get("/{meeting_id}/action-items")
 async def get_meeting_action_items(
     meeting_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get all action items for a meeting"""
-    meeting = MeetingService.get_meeting(db, meeting_id)
+    meeting = await MeetingService.get_meeting_async(db, meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
-    action_items = ActionItemService.get_meeting_action_items(db, meeting_id)
+    action_items = await ActionItemService.get_meeting_action_items_async(db, meeting_id)
     return action_items
 
 @router.get("/{meeting_id}/decisions")
 async def get_meeting_decisions(
     meeting_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get all decisions for a meeting"""
-    meeting = MeetingService.get_meeting(db, meeting_id)
+    meeting = await MeetingService.get_meeting_async(db, meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
-    decisions = DecisionService.get_meeting_decisions(db, meeting_id)
+    decisions = await DecisionService.get_meeting_decisions_async(db, meeting_id)
     return decisions
 
-@router.post("/{meeting_id}/transcribe")
+def _enqueue_job(db: Session, kind: str, payload: Dict, job_id: Optional[str] = None):
+    """Persist a job, make it cancellable and wake a worker"""
+    job = JobService.create_job(db, kind, payload, job_id=job_id)
+    ProcessManager.register_process(job.id)
+    ProcessManager.update_progress(job.id, stage="queued")
+    JobWorker.notify()
+    return job
+
+@router.post("/{meeting_id}/transcribe", status_code=202)
 async def transcribe_meeting(
     meeting_id: int,
-    provider: str = "huggingface",
-    db: Session = Depends(get_db)
+    provider: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Transcribe audio for a meeting"""
-    meeting = MeetingService.get_meeting(db, meeting_id)
+    """Queue transcription of the audio for a meeting (provider defaults to TRANSCRIPTION_PROVIDER)"""
+    meeting = await MeetingService.get_meeting_async(db, meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
@@ -235,39 +292,70 @@ async def transcribe_meeting(
         raise HTTPException(status_code=404, detail="Audio file not found")
     
     try:
-        # Create UploadFile from file path for transcription
-        with open(meeting.audio_file_path, "rb") as audio_file:
-            file_content = audio_file.read()
-        
-        upload_file = UploadFile(
-            filename=os.path.basename(meeting.audio_file_path),
-            file=None
-        )
-        upload_file.file = open(meeting.audio_file_path, "rb")
-        
-        # Transcribe audio with selected provider
-        transcript = await TranscriptionService.transcribe_audio(upload_file, provider)
-        
-        # Update meeting with transcript
-        meeting_update = MeetingUpdate(transcript=transcript)
-        updated_meeting = MeetingService.update_meeting(db, meeting_id, meeting_update)
-        
-        return {
-            "message": f"Transcription completed for meeting {meeting_id}",
-            "transcript": transcript
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Transcription error: {str(e)}")
-    finally:
-        if upload_file and upload_file.file:
-            upload_file.file.close()
+        provider = TranscriptionBackends.resolve(provider)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    job = await db.run_sync(_enqueue_job, "transcribe_meeting", {"meeting_id": meeting_id, "provider": provider})
+    return {
+        "message": f"Transcription queued for meeting {meeting_id}",
+        "job_id": job.id,
+        "status": job.status
+    }
 
-@router.post("/{meeting_id}/summarize")
+@JobWorker.handler("transcribe_meeting")
+def run_transcription_job(db: Session, job_id: str, payload: Dict):
+    """Transcribe the audio for a meeting (runs on a job worker)"""
+    meeting_id = payload["meeting_id"]
+    meeting = MeetingService.get_meeting(db, meeting_id)
+    if not meeting:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    
+    if not meeting.audio_file_path or not os.path.exists(meeting.audio_file_path):
+        raise HTTPException(status_code=404, detail="Audio file not found")
+    
+    # Transcribe audio with selected provider
+    transcript = TranscriptionService.transcribe_file(
+        meeting.audio_file_path,
+        payload.get("provider"),
+        process_id=job_id,
+        audio_sha256=meeting.audio_sha256
+    )
+    
+    # Update meeting with transcript
+    meeting_update = MeetingUpdate(transcript=transcript)
+    MeetingService.update_meeting(db, meeting_id, meeting_update)
+    
+    return {
+        "message": f"Transcription completed for meeting {meeting_id}",
+        "meeting_id": meeting_id,
+        "transcript": transcript
+    }
+
+@router.post("/{meeting_id}/summarize", status_code=202)
 async def summarize_meeting(
     meeting_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Generate summary, extract action items and decisions for a meeting"""
+    """Queue summary generation and action item / decision extraction for a meeting"""
+    meeting = await MeetingService.get_meeting_async(db, meeting_id)
+    if not meeting:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    
+    if not meeting.transcript:
+        raise HTTPException(status_code=400, detail="No transcript available for this meeting. Please transcribe first.")
+    
+    job = await db.run_sync(_enqueue_job, "summarize_meeting", {"meeting_id": meeting_id})
+    return {
+        "message": f"Summarization queued for meeting {meeting_id}",
+        "job_id": job.id,
+        "status": job.status
+    }
+
+@JobWorker.handler("summarize_meeting")
+def run_summarization_job(db: Session, job_id: str, payload: Dict):
+    """Generate summary, extract action items and decisions for a meeting (runs on a job worker)"""
+    meeting_id = payload["meeting_id"]
     meeting = MeetingService.get_meeting(db, meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
@@ -275,62 +363,34 @@ async def summarize_meeting(
     if not meeting.transcript:
         raise HTTPException(status_code=400, detail="No transcript available for this meeting. Please transcribe first.")
     
-    try:
-        # Generate summary
-        summary = SummarizationService.summarize_text(meeting.transcript)
-        # Extract action items and decisions from transcript (not summary)
-        action_items = SummarizationService.extract_action_items(meeting.transcript)
-        decisions = SummarizationService.extract_decisions(meeting.transcript)
-        # Ensure action_items and decisions are lists
-        if action_items is None:
-            action_items = []
-        if decisions is None:
-            decisions = []
-        # Update meeting with summary
-        meeting_update = MeetingUpdate(summary=summary)
-        updated_meeting = MeetingService.update_meeting(db, meeting_id, meeting_update)
-        # Save action items
-        saved_action_items = []
-        for item in action_items:
-            if not item.get('title'):
-                continue
-            action_item = ActionItemCreate(
-                meeting_id=meeting_id,
-                title=item.get('title', ''),
-                description=item.get('description', ''),
-                assignee=item.get('assignee', ''),
-                due_date=item.get('due_date')
-            )
-            saved_item = ActionItemService.create_action_item(db, action_item)
-            saved_action_items.append(saved_item)
-        # Save decisions
-        saved_decisions = []
-        for decision in decisions:
-            if not decision.get('title'):
-                continue
-            decision_item = DecisionCreate(
-                meeting_id=meeting_id,
-                title=decision.get('title', ''),
-                description=decision.get('description', ''),
-                decision_maker=decision.get('decision_maker', ''),
-                rationale=decision.get('rationale', '')
-            )
-            saved_decision = DecisionService.create_decision(db, decision_item)
-            saved_decisions.append(saved_decision)
-        return {
-            "message": f"Summarization completed for meeting {meeting_id}",
-            "summary": summary,
-            "action_items": saved_action_items if saved_action_items else [],
-            "decisions": saved_decisions if saved_decisions else []
-        }
-    except Exception as e:
-        print(f"Error during summarization: {str(e)}")
-        return {
-            "message": f"Summarization completed for meeting {meeting_id}",
-            "summary": summary if 'summary' in locals() else "",
-            "action_items": [],
-            "decisions": []
-        }
+    # Generate summary
+    ProcessManager.update_progress(job_id, stage="summarizing")
+    summary = SummarizationService.summarize_text(meeting.transcript)
+    if ProcessManager.is_cancelled(job_id):
+        raise HTTPException(status_code=499, detail="Summarization cancelled by user")
+    # Extract action items and decisions from transcript (not summary) in one pass
+    items = SummarizationService.extract_meeting_items(meeting.transcript)
+    # Update meeting with summary
+    meeting_update = MeetingUpdate(summary=summary)
+    updated_meeting = MeetingService.update_meeting(db, meeting_id, meeting_update)
+    # Save action items
+    saved_action_items = []
+    for item in items["action_items"]:
+        action_item = ActionItemCreate(meeting_id=meeting_id, **item)
+        saved_item = ActionItemService.create_action_item(db, action_item)
+        saved_action_items.append(ActionItemSchema.model_validate(saved_item))
+    # Save decisions
+    saved_decisions = []
+    for decision in items["decisions"]:
+        decision_item = DecisionCreate(meeting_id=meeting_id, **decision)
+        saved_decision = DecisionService.create_decision(db, decision_item)
+        saved_decisions.append(DecisionSchema.model_validate(saved_decision))
+    return {
+        "message": f"Summarization completed for meeting {meeting_id}",
+        "summary": summary,
+        "action_items": saved_action_items if saved_action_items else [],
+        "decisions": saved_decisions if saved_decisions else []
+    }
 
 @router.post("/{meeting_id}/schedule")
 async def schedule_meeting(
@@ -338,10 +398,10 @@ async def schedule_meeting(
     start_time: datetime = Body(...),
     end_time: datetime = Body(...),
     attendees: Optional[List[Dict[str, str]]] = Body(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Schedule meeting in calendar"""
-    meeting = MeetingService.get_meeting(db, meeting_id)
+    meeting = await MeetingService.get_meeting_async(db, meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
@@ -354,7 +414,8 @@ async def schedule_meeting(
             description += f"Summary: {meeting.summary}\n\n"
         
         # Schedule in calendar
-        event = CalendarService.create_meeting_event(
+        event = await run_in_threadpool(
+            CalendarService.create_meeting_event,
             summary=meeting.title,
             description=description,
             start_time=start_time,
@@ -364,7 +425,7 @@ async def schedule_meeting(
         
         # Update meeting with calendar event ID
         meeting_update = MeetingUpdate(calendar_event_id=event.get("event_id"))
-        MeetingService.update_meeting(db, meeting_id, meeting_update)
+        await MeetingService.update_meeting_async(db, meeting_id, meeting_update)
         
         return {
             "message": "Meeting scheduled successfully",
@@ -385,13 +446,10 @@ async def schedule_meeting(
         raise HTTPException(status_code=500, detail=f"Error scheduling meeting: {str(e)}")
 
 @router.get("/calendar/upcoming")
-async def get_upcoming_meetings(
-    max_results: int = 10,
-    db: Session = Depends(get_db)
-):
+async def get_upcoming_meetings(max_results: int = 10):
     """Get upcoming calendar events"""
     try:
-        events = CalendarService.get_upcoming_meetings(max_results=max_results)
+        events = await run_in_threadpool(CalendarService.get_upcoming_meetings, max_results=max_results)
         return {"events": events}
     except HTTPException as e:
         # Re-raise HTTPExceptions from the service
@@ -405,24 +463,35 @@ async def upload_audio_direct(
     file: UploadFile = File(...),
     transcribe: bool = Form(False),
     summarize: bool = Form(False),
-    process_id: str = Form(None)  # Accept process_id
+    process_id: str = Form(None),  # Accept process_id
+    provider: str = Form(None),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Upload audio file directly and optionally transcribe and summarize."""
+    """Upload audio file directly and optionally queue transcription and summarization."""
+    if transcribe or summarize:
+        try:
+            provider = TranscriptionBackends.resolve(provider)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    # A client-chosen ID must be new: it becomes the key of the upload and of its job
+    if process_id and (
+        ProcessManager.is_active(process_id)
+        or await db.run_sync(JobService.get_job, process_id)
+        or await db.run_sync(DirectUploadService.exists, process_id)
+    ):
+        raise HTTPException(status_code=409, detail=f"Process ID {process_id} is already in use")
+    
+    file_id = process_id if process_id else str(uuid.uuid4())
+    registered = False
+    queued = False
     try:
-        file_id = process_id if process_id else str(uuid.uuid4())
-        file_path = f"uploads/{file_id}_{file.filename}"
-        
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        
-        TEMP_FILES[file_id] = {
-            "file_path": file_path,
-            "original_filename": file.filename,
-            "transcript": None,
-            "summary": None,
-            "action_items": None,
-            "decisions": None
-        }
+        # Lets a client that chose the process ID follow the upload on the progress stream
+        ProcessManager.register_process(file_id)
+        registered = True
+        ProcessManager.update_progress(file_id, stage="uploading")
+        blob = await AudioBlobService.store_upload_async(db, file)
+        await db.run_sync(DirectUploadService.create, file_id, blob, file.filename)
         
         response_data = {
             "file_id": file_id,
@@ -431,106 +500,151 @@ async def upload_audio_direct(
         }
 
         if transcribe or summarize:
-            try:
-                print(f"Transcribing file_id: {file_id}")
-                with open(file_path, "rb") as audio_file_for_transcription:
-                    upload_file_for_transcription = UploadFile(
-                        filename=file.filename, 
-                        file=audio_file_for_transcription
-                    )
-                    transcript_text = await TranscriptionService.transcribe_audio(
-                        upload_file_for_transcription, 
-                        "huggingface",
-                        process_id=file_id
-                    )
-                TEMP_FILES[file_id]["transcript"] = transcript_text
-                response_data["transcript"] = transcript_text
-                response_data["message"] += " Transcription completed."
-                print(f"Transcription successful for file_id: {file_id}")
-            except HTTPException as e:
-                if e.status_code == 499:  # Cancelled
-                    return JSONResponse(
-                        status_code=499,
-                        content={"message": "Process cancelled by user", "file_id": file_id}
-                    )
-                print(f"Error during transcription for file_id {file_id}: {str(e)}")
-                TEMP_FILES[file_id]["transcription_error"] = str(e)
-                response_data["transcription_error"] = str(e)
-                response_data["message"] += " Transcription failed."
-                if summarize:
-                    response_data["summary_error"] = "Summarization skipped due to transcription failure."
-                return JSONResponse(status_code=500, content=response_data)
-
-        if summarize:
-            if not TEMP_FILES[file_id]["transcript"]:
-                print(f"Summarization skipped for file_id {file_id}: transcript not available.")
-                response_data["summary_error"] = "Summarization skipped: transcript not available or transcription failed."
-                return JSONResponse(status_code=400, content=response_data)
-            try:
-                print(f"Summarizing transcript for file_id: {file_id}")
-                summary = SummarizationService.summarize_text(TEMP_FILES[file_id]["transcript"])
-                action_items = SummarizationService.extract_action_items(TEMP_FILES[file_id]["transcript"])
-                decisions = SummarizationService.extract_decisions(TEMP_FILES[file_id]["transcript"])
-                TEMP_FILES[file_id]["summary"] = summary
-                TEMP_FILES[file_id]["action_items"] = action_items
-                TEMP_FILES[file_id]["decisions"] = decisions
-                response_data["summary"] = summary
-                response_data["action_items"] = action_items
-                response_data["decisions"] = decisions
-                response_data["message"] += " Summarization completed."
-                print(f"Summarization successful for file_id: {file_id}")
-            except Exception as e:
-                print(f"Error during summarization for file_id {file_id}: {str(e)}")
-                TEMP_FILES[file_id]["summary_error"] = str(e)
-                response_data["summary_error"] = str(e)
-                response_data["message"] += " Summarization failed."
-                return JSONResponse(status_code=500, content=response_data)
+            job = await db.run_sync(
+                _enqueue_job,
+                "process_direct_upload",
+                {
+                    "file_id": file_id,
+                    "file_path": blob.path,
+                    "original_filename": file.filename,
+                    "audio_sha256": blob.sha256,
+                    "transcribe": transcribe,
+                    "summarize": summarize,
+                    "provider": provider
+                },
+                job_id=file_id
+            )
+            queued = True
+            response_data["job_id"] = job.id
+            response_data["status"] = job.status
+            response_data["message"] += " Processing queued."
+            return JSONResponse(status_code=202, content=response_data)
         return response_data
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error in upload_audio_direct: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error uploading audio: {str(e)}")
+    finally:
+        if registered and not queued:
+            ProcessManager.remove_process(file_id)
+
+@JobWorker.handler("process_direct_upload")
+def run_direct_upload_job(db: Session, job_id: str, payload: Dict):
+    """Transcribe and optionally summarize a direct upload (runs on a job worker)"""
+    file_id = payload["file_id"]
+    # Uploads with a pending job are never swept, but recreate the record if it was purged
+    if DirectUploadService.get(db, file_id) is None:
+        blob = AudioBlobService.acquire(db, payload.get("audio_sha256") or "")
+        if blob is None:
+            raise HTTPException(status_code=404, detail="Uploaded file no longer exists")
+        DirectUploadService.create(db, file_id, blob, payload["original_filename"])
+    result = {
+        "file_id": file_id,
+        "filename": payload["original_filename"],
+        "message": "File uploaded successfully."
+    }
+
+    try:
+        print(f"Transcribing file_id: {file_id}")
+        transcript_text = TranscriptionService.transcribe_file(
+            payload["file_path"],
+            payload.get("provider"),
+            process_id=job_id,
+            audio_sha256=payload.get("audio_sha256")
+        )
+        DirectUploadService.update(db, file_id, transcript=transcript_text, transcription_error=None)
+        result["transcript"] = transcript_text
+        result["message"] += " Transcription completed."
+        print(f"Transcription successful for file_id: {file_id}")
+    except HTTPException as e:
+        if e.status_code == 499:  # Cancelled
+            raise
+        print(f"Error during transcription for file_id {file_id}: {str(e.detail)}")
+        DirectUploadService.update(db, file_id, transcription_error=str(e.detail))
+        raise
+
+    if payload.get("summarize"):
+        if ProcessManager.is_cancelled(job_id):
+            raise HTTPException(status_code=499, detail="Summarization cancelled by user")
+        try:
+            print(f"Summarizing transcript for file_id: {file_id}")
+            ProcessManager.update_progress(job_id, stage="summarizing")
+            summary = SummarizationService.summarize_text(transcript_text)
+            items = SummarizationService.extract_meeting_items(transcript_text)
+            DirectUploadService.update(
+                db, file_id,
+                summary=summary,
+                action_items=items["action_items"],
+                decisions=items["decisions"],
+                summary_error=None
+            )
+            result["summary"] = summary
+            result["action_items"] = items["action_items"]
+            result["decisions"] = items["decisions"]
+            result["message"] += " Summarization completed."
+            print(f"Summarization successful for file_id: {file_id}")
+        except Exception as e:
+            print(f"Error during summarization for file_id {file_id}: {str(e)}")
+            db.rollback()
+            DirectUploadService.update(db, file_id, summary_error=str(e))
+            raise
+    return result
 
 @router.post("/transcribe-direct/{file_id}")
-async def transcribe_audio_direct_separate(file_id: str):
+async def transcribe_audio_direct_separate(
+    file_id: str,
+    provider: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
     """Transcribe audio using file ID from direct upload (separate endpoint)."""
-    if file_id not in TEMP_FILES:
+    upload = await db.run_sync(DirectUploadService.get, file_id)
+    if not upload:
         raise HTTPException(status_code=404, detail="File not found")
     
-    file_path = TEMP_FILES[file_id]["file_path"]
-    
     try:
-        with open(file_path, "rb") as audio_file:
-            upload_file = UploadFile(filename=TEMP_FILES[file_id]["original_filename"], file=audio_file)
-            transcript = await TranscriptionService.transcribe_audio(upload_file, "huggingface")
-        TEMP_FILES[file_id]["transcript"] = transcript
+        transcript = await run_in_threadpool(
+            TranscriptionService.transcribe_file,
+            upload.file_path,
+            provider,
+            audio_sha256=upload.audio_sha256
+        )
+        await db.run_sync(DirectUploadService.update, file_id, transcript=transcript, transcription_error=None)
         return {"message": "Transcription completed", "file_id": file_id, "transcript": transcript}
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error in transcribe_audio_direct_separate: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Transcription error: {str(e)}")
 
 @router.post("/summarize-direct/{file_id}")
-async def summarize_transcript_direct_separate(file_id: str):
+async def summarize_transcript_direct_separate(file_id: str, db: AsyncSession = Depends(get_async_db)):
     """Summarize transcript using file ID (separate endpoint)."""
-    if file_id not in TEMP_FILES:
+    upload = await db.run_sync(DirectUploadService.get, file_id)
+    if not upload:
         raise HTTPException(status_code=404, detail="File not found")
     
-    if not TEMP_FILES[file_id].get("transcript"):
+    if not upload.transcript:
         raise HTTPException(status_code=404, detail="Transcript not found for this file ID")
     
     try:
-        transcript = TEMP_FILES[file_id]["transcript"]
-        summary = SummarizationService.summarize_text(transcript)
-        action_items = SummarizationService.extract_action_items(transcript)
-        decisions = SummarizationService.extract_decisions(transcript)
-        TEMP_FILES[file_id]["summary"] = summary
-        TEMP_FILES[file_id]["action_items"] = action_items
-        TEMP_FILES[file_id]["decisions"] = decisions
+        transcript = upload.transcript
+        # Inference runs on the model pools; keep the event loop free while waiting
+        summary = await run_in_threadpool(SummarizationService.summarize_text, transcript)
+        items = await run_in_threadpool(SummarizationService.extract_meeting_items, transcript)
+        await db.run_sync(
+            DirectUploadService.update, file_id,
+            summary=summary,
+            action_items=items["action_items"],
+            decisions=items["decisions"],
+            summary_error=None
+        )
         return {
             "message": "Summarization completed",
             "file_id": file_id,
             "summary": summary,
-            "action_items": action_items,
-            "decisions": decisions
+            "action_items": items["action_items"],
+            "decisions": items["decisions"]
         }
     except Exception as e:
         print(f"Error in summarize_transcript_direct_separate: {str(e)}")
@@ -540,7 +654,8 @@ async def summarize_transcript_direct_separate(file_id: str):
 async def schedule_meeting_direct(payload: DirectScheduleRequest):
     """Schedule a meeting directly on Google Calendar (no meeting ID required)"""
     try:
-        event = CalendarService.create_meeting_event(
+        event = await run_in_threadpool(
+            CalendarService.create_meeting_event,
             summary=payload.title,
             description=payload.description,
             start_time=payload.start_time,
@@ -560,10 +675,10 @@ async def schedule_meeting_direct(payload: DirectScheduleRequest):
 @router.post("/schedule")
 async def schedule_and_create_meeting(
     meeting: MeetingCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # 1. Create the meeting in the database
-    created_meeting = MeetingService.create_meeting(db, meeting)
+    created_meeting = await MeetingService.create_meeting_async(db, meeting)
 
     calendar_link = None
     meet_link = None
@@ -572,7 +687,8 @@ async def schedule_and_create_meeting(
     # 2. Schedule on Google Calendar
     if meeting.start_time and meeting.end_time:
         try:
-            event = CalendarService.create_meeting_event(
+            event = await run_in_threadpool(
+                CalendarService.create_meeting_event,
                 summary=meeting.title,
                 description=meeting.description or "",
                 start_time=meeting.start_time,
@@ -584,7 +700,7 @@ async def schedule_and_create_meeting(
             meet_link = event.get("meet_link")
             # 3. Store the calendar event ID in the meeting record
             meeting_update = MeetingUpdate(calendar_event_id=event_id)
-            MeetingService.update_meeting(db, created_meeting.id, meeting_update)
+            await MeetingService.update_meeting_async(db, created_meeting.id, meeting_update)
         except Exception as e:
             print(f"Failed to schedule meeting {created_meeting.id} on calendar: {e}")
 
@@ -601,8 +717,107 @@ async def schedule_and_create_meeting(
     }
 
 @router.post("/cancel/{process_id}")
-async def cancel_process(process_id: str):
-    """Cancel an ongoing transcription or summarization process"""
-    if ProcessManager.cancel_process(process_id):
+async def cancel_process(
+    process_id: str,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Cancel a queued or ongoing transcription or summarization process"""
+    cancelled = ProcessManager.cancel_process(process_id)
+    # Jobs may be queued, or running in another worker process
+    if await db.run_sync(JobService.cancel_job, process_id):
+        cancelled = True
+    if cancelled:
         return {"message": "Process cancellation requested", "process_id": process_id}
-    raise HTTPException(status_code=404, detail="Process not found")
\ No newline at end of file
+    raise HTTPException(status_code=404, detail="Process not found")
+
+def _load_job(process_id: str):
+    db = SessionLocal()
+    try:
+        job = JobService.get_job(db, process_id)
+        return JobService.serialize_job(job) if job else None
+    finally:
+        db.close()
+
+def _format_sse(event: str, data, event_id: Optional[int] = None) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(jsonable_encoder(data))}")
+    return "\n".join(lines) + "\n\n"
+
+@router.get("/progress/{process_id}")
+async def stream_progress(process_id: str, request: Request):
+    """Stream the progress of a job as server-sent events.
+
+    Emits ``progress`` events on stage changes (queued, transcribing,
+    summarizing) and as audio is processed, ``segment`` events with partial
+    transcript segments, and a final ``completed``, ``failed`` or
+    ``cancelled`` event carrying the job result. Live events are only
+    available in the process running the job; the job table is polled as
+    well, and its progress is sent whenever it is newer than the last
+    progress event, so a stream served by another process still advances.
+    """
+    initial_job = await run_in_threadpool(_load_job, process_id)
+    if initial_job is None and not ProcessManager.has_events(process_id):
+        raise HTTPException(status_code=404, detail="Process not found")
+
+    # Resume after the last event the client saw when it reconnects
+    try:
+        last_id = int(request.headers.get("last-event-id", 0))
+    except ValueError:
+        last_id = 0
+
+    async def event_stream():
+        nonlocal last_id
+        job = initial_job
+        # When the progress sent last was updated; a reconnecting client has seen the events up to last_id
+        last_progress_at = max(
+            (event["data"].get("updated_at", 0) for event in ProcessManager.get_events(process_id)[:last_id]
+             if event["event"] == "progress"),
+            default=-1
+        )
+        idle = 0.0
+        while True:
+            # Checked before draining the log so no event published before the process ended is missed
+            untracked = job is None and not ProcessManager.is_active(process_id)
+            sent = False
+            for event in ProcessManager.get_events(process_id, after=last_id):
+                last_id = event["id"]
+                if event["event"] == "progress":
+                    last_progress_at = max(last_progress_at, event["data"].get("updated_at", 0))
+                yield _format_sse(event["event"], event["data"], event_id=event["id"])
+                sent = True
+
+            if job is not None:
+                # The job may run in another process, leaving the events here stuck at an earlier stage
+                progress = job["progress"]
+                if progress and progress.get("updated_at", 0) > last_progress_at:
+                    last_progress_at = progress.get("updated_at", 0)
+                    yield _format_sse("progress", progress)
+                    sent = True
+                if job["status"] in JobService.FINISHED_STATUSES:
+                    yield _format_sse(job["status"], {
+                        "result": job["result"],
+                        "error": job["error"]
+                    })
+                    return
+            elif untracked:
+                # A process without a job row (e.g. a synchronous transcription) has no stored result
+                yield _format_sse("completed", {"result": None, "error": None})
+                return
+
+            if await request.is_disconnected():
+                return
+            idle = 0.0 if sent else idle + PROGRESS_POLL_INTERVAL
+            if idle >= PROGRESS_KEEPALIVE_SECONDS:
+                idle = 0.0
+                yield ": keep-alive\n\n"
+            await asyncio.sleep(PROGRESS_POLL_INTERVAL)
+            job = await run_in_threadpool(_load_job, process_id)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+from app.core.database import get_async_db
+from app.schemas.schemas import SearchResult
+from app.services.search_service import MAX_SEARCH_RESULTS, SearchService
+
+router = APIRouter()
+
+@router.get("/", response_model=List[SearchResult])
+async def search(
+    q: str,
+    limit: int = Query(20, ge=1, le=MAX_SEARCH_RESULTS),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Search meeting titles, descriptions, transcripts and summaries, action items and decisions"""
+    try:
+        return await SearchService.search_async(db, q, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,156 @@
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import queue
+import threading
+import time
+
+class MicroBatcher:
+    """Groups concurrent requests for one model into batches.
+
+    Callers ``submit`` single inputs and get a Future back. A dispatcher
+    thread waits up to ``max_wait_ms`` after the first queued input for more
+    to arrive, then runs ``batch_fn`` once on up to ``max_batch_size`` inputs
+    and routes each output back to its caller. Only inputs with identical
+    generation parameters share a batch. A batch that fails, for any
+    reason, fails the futures of its callers; the dispatcher keeps running.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        batch_fn: Callable[..., List[Any]],
+        max_batch_size: int,
+        max_wait_ms: float,
+        dispatchers: int = 1
+    ):
+        self.name = name
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.dispatchers = max(1, dispatchers)
+        self._queue: "queue.Queue[Tuple[Any, Dict[str, Any], float, Future]]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._batches = 0
+        self._requests = 0
+        self._total_delay = 0.0
+        self._max_delay = 0.0
+
+    def submit(self, item: Any, **params) -> Future:
+        """Queue one input and return a Future for its output"""
+        # Parameters are the key of a batch group; reject what cannot be grouped before it reaches the dispatcher
+        try:
+            hash(tuple(sorted(params.items())))
+        except TypeError as e:
+            raise TypeError(f"Parameters for {self.name} must be hashable: {e}") from e
+        self._ensure_started()
+        future: Future = Future()
+        self._queue.put((item, params, time.perf_counter(), future))
+        return future
+
+    def wait(self, futures: List[Future], timeout: Optional[float] = None) -> List[Any]:
+        """Outputs of ``futures`` in order, waiting at most ``timeout`` seconds for all of them.
+
+        On timeout the inputs that have not been dispatched yet are dropped
+        and TimeoutError is raised.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            return [
+                future.result(timeout=None if deadline is None else max(0.0, deadline - time.monotonic()))
+                for future in futures
+            ]
+        except TimeoutError:
+            for future in futures:
+                future.cancel()
+            raise TimeoutError(f"{self.name} returned no result within {timeout} s")
+
+    def _ensure_started(self) -> None:
+        # Threads start on first use so importing the service (or forking) does not spawn them
+        if self._threads:
+            return
+        with self._lock:
+            if self._threads:
+                return
+            for index in range(self.dispatchers):
+                thread = threading.Thread(
+                    target=self._run, name=f"batcher-{self.name}-{index}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def _collect(self) -> List[Tuple[Any, Dict[str, Any], float, Future]]:
+        batch = [self._queue.get()]
+        deadline = batch[0][2] + self.max_wait
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.perf_counter()
+            try:
+                batch.append(self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch: List[Tuple[Any, Dict[str, Any], float, Future]] = []
+            try:
+                batch = self._collect()
+                self._dispatch(batch)
+            except Exception as e:
+                # An exception escaping here would end the thread and leave every later caller waiting
+                for entry in batch:
+                    if not entry[3].done():
+                        entry[3].set_exception(e)
+
+    def _dispatch(self, batch: List[Tuple[Any, Dict[str, Any], float, Future]]) -> None:
+        dispatched_at = time.perf_counter()
+
+        groups: Dict[Tuple, List[Tuple[Any, Dict[str, Any], float, Future]]] = {}
+        for entry in batch:
+            # Inputs whose caller gave up waiting are not run
+            if not entry[3].set_running_or_notify_cancel():
+                continue
+            key = tuple(sorted(entry[1].items()))
+            groups.setdefault(key, []).append(entry)
+
+        for entries in groups.values():
+            self._record(entries, dispatched_at)
+            try:
+                outputs = list(self.batch_fn([entry[0] for entry in entries], **entries[0][1]))
+                # Outputs are matched to callers by position; a short batch would leave futures pending forever
+                if len(outputs) != len(entries):
+                    raise ValueError(
+                        f"Batch function for {self.name} returned {len(outputs)} outputs for {len(entries)} inputs"
+                    )
+            except Exception as e:
+                for entry in entries:
+                    if not entry[3].done():
+                        entry[3].set_exception(e)
+                continue
+            for entry, output in zip(entries, outputs):
+                entry[3].set_result(output)
+
+    def _record(self, entries: List[Tuple[Any, Dict[str, Any], float, Future]], dispatched_at: float) -> None:
+        with self._lock:
+            self._batches += 1
+            self._requests += len(entries)
+            for entry in entries:
+                delay = dispatched_at - entry[2]
+                self._total_delay += delay
+                self._max_delay = max(self._max_delay, delay)
+
+    def stats(self) -> Dict[str, Any]:
+        """Batch fill rate and queueing delay since startup"""
+        with self._lock:
+            batches = self._batches
+            requests = self._requests
+            return {
+                "batches": batches,
+                "requests": requests,
+                "queued": self._queue.qsize(),
+                "max_batch_size": self.max_batch_size,
+                "mean_batch_size": round(requests / batches, 2) if batches else 0.0,
+                "fill_rate": round(requests / (batches * self.max_batch_size), 3) if batches else 0.0,
+                "mean_queue_delay_ms": round(1000 * self._total_delay / requests, 2) if requests else 0.0,
+                "max_queue_delay_ms": round(1000 * self._max_delay, 2)
+            }
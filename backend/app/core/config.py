@@ -4,9 +4,28 @@ import os
 from pathlib import Path
 
 class Settings(BaseSettings):
+    # Server settings
+    API_HOST: str = "0.0.0.0"
+    API_PORT: int = 8000
+    # More than one worker starts the pre-fork launcher: models are loaded once and shared copy-on-write
+    API_WORKERS: int = 1
+    
     # Database settings
     DATABASE_URL: str = "sqlite:///./app.db"
     TEST_DATABASE_URL: str = "sqlite:///./test.db"
+    # Connection pool (SQLite files and server databases such as PostgreSQL)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a server connection is replaced
+    DB_POOL_PRE_PING: bool = True  # Check server connections before use
+    # SQLite pragmas applied to every connection; set SQLITE_PRAGMAS_ENABLED=false for SQLite defaults
+    SQLITE_PRAGMAS_ENABLED: bool = True
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_CACHE_SIZE_KB: int = 64 * 1024
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
     
     # Hugging Face settings
     HUGGINGFACE_CACHE_DIR: str = str(Path.home() / ".cache" / "huggingface")
@@ -22,8 +41,76 @@ class Settings(BaseSettings):
     # Security settings
     SECRET_KEY: str = "your-secret-key-here"
     
+    # Upload settings
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024  # Bytes read and written per chunk
+    MAX_UPLOAD_BYTES: int = 1024 * 1024 * 1024
+    # Uploaded audio is stored once per content hash, in AUDIO_BLOB_DIR/ab/cd/<sha256>
+    AUDIO_BLOB_DIR: str = "uploads/blobs"
+    # Direct uploads (upload-direct) expire after the TTL; least recently used ones are evicted above the limits
+    DIRECT_UPLOAD_TTL_SECONDS: int = 24 * 60 * 60
+    DIRECT_UPLOAD_MAX_ENTRIES: int = 1000
+    DIRECT_UPLOAD_MAX_BYTES: int = 10 * 1024 * 1024 * 1024
+    DIRECT_UPLOAD_SWEEP_INTERVAL: float = 300.0  # Seconds between sweeps that delete expired uploads and files
+    
     # Transcription settings
-    TRANSCRIPTION_PROVIDER: str = "huggingface"  # Default to huggingface
+    # Default transcription backend: whisper (huggingface is an alias), whisper-int8 or faster-whisper
+    TRANSCRIPTION_PROVIDER: str = "huggingface"
+    WHISPER_MODEL: str = "base"
+    # Audio is transcribed window by window; cancellation is checked and progress published between windows
+    TRANSCRIPTION_WINDOW_SECONDS: float = 30.0
+    TRANSCRIPT_CACHE_ENABLED: bool = True
+    TRANSCRIPT_CACHE_MAX_BYTES: int = 256 * 1024 * 1024  # Least recently used transcripts are evicted above this
+    # Voice activity detection: only audio with speech is sent to Whisper (opt-in, it changes transcripts)
+    VAD_ENABLED: bool = False
+    VAD_FRAME_MS: int = 30
+    VAD_THRESHOLD_DB: float = 12.0  # Above the recording's noise floor
+    VAD_MIN_ENERGY_DB: float = -60.0  # Frames quieter than this are never speech
+    VAD_MIN_SPEECH_MS: int = 250
+    VAD_MIN_SILENCE_MS: int = 1000
+    VAD_PADDING_MS: int = 300
+    # Long recordings are split into chunks transcribed by a pool of worker processes (0 disables)
+    PARALLEL_TRANSCRIPTION_WORKERS: int = 0
+    PARALLEL_CHUNK_SECONDS: float = 300.0
+    PARALLEL_OVERLAP_SECONDS: float = 2.0  # Only used when a chunk has to be cut inside speech
+    PARALLEL_MIN_AUDIO_SECONDS: float = 600.0
+    
+    # Summarization settings
+    SUMMARIZATION_MODEL: str = "facebook/bart-large-cnn"
+    EXTRACTION_MODEL: str = "google/flan-t5-base"
+    # CPU inference precision of both models: fp32, int8 (dynamic quantization) or bf16
+    SUMMARIZATION_PRECISION: str = "fp32"
+    # Compare reduced-precision output with fp32 on a sample when a model loads; keep fp32 below the score
+    PRECISION_SELF_CHECK: bool = True
+    PRECISION_SELF_CHECK_MIN_SCORE: float = 0.6
+    # Transcripts longer than one chunk are summarized map-reduce style
+    SUMMARY_CHUNK_TOKENS: int = 900
+    SUMMARY_CHUNK_OVERLAP: int = 100
+    SUMMARY_BATCH_SIZE: int = 4
+    # Action items and decisions are extracted in one pass over chunks of the transcript
+    EXTRACTION_CHUNK_TOKENS: int = 400
+    EXTRACTION_CHUNK_OVERLAP: int = 50
+    EXTRACTION_BATCH_SIZE: int = 4
+    # Summaries and extracted items are cached by transcript digest, in memory and in the database
+    SUMMARY_CACHE_ENABLED: bool = True
+    SUMMARY_CACHE_MEMORY_ENTRIES: int = 256
+    SUMMARY_CACHE_MAX_ENTRIES: int = 10000
+    
+    # Comma-separated models to load at startup ("whisper,summarizer,extractor").
+    # Models not listed are loaded on first use.
+    PRELOAD_MODELS: str = ""
+    
+    # Background job settings
+    JOB_WORKER_COUNT: int = 1
+    JOB_POLL_INTERVAL: float = 1.0  # Seconds between queue polls when idle
+    
+    # Inference settings (threads per model pool, i.e. concurrent calls per model)
+    WHISPER_MAX_CONCURRENCY: int = 1
+    SUMMARIZER_MAX_CONCURRENCY: int = 1
+    EXTRACTOR_MAX_CONCURRENCY: int = 1
+    # How long the first request waits for others to share its summarizer/extractor batch
+    BATCH_WINDOW_MS: float = 20.0
+    # Longest a request waits for its batched summarizer/extractor outputs, queueing included
+    BATCH_RESULT_TIMEOUT_SECONDS: float = 600.0
     
     class Config:
         env_file = ".env"
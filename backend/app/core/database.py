@@ -1,15 +1,104 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
+from typing import List, Optional
+import os
 
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
+# Alembic migrations (backend/migrations)
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "migrations")
+# Async drivers for the API routes: aiosqlite for SQLite, asyncpg for PostgreSQL
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+def sqlite_pragmas() -> List[str]:
+    """PRAGMA statements run on every new SQLite connection.
+
+    WAL lets readers proceed while a write is in progress, and with
+    synchronous=NORMAL a commit only appends to the log instead of syncing
+    the database file (the database stays consistent; only the last
+    commits can be lost if the machine loses power). The busy timeout makes
+    a writer wait for the lock instead of failing with "database is locked".
+    """
+    return [
+        f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}",
+        f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}",
+        # A negative cache size is in KiB rather than pages
+        f"PRAGMA cache_size=-{settings.SQLITE_CACHE_SIZE_KB}",
+        f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}",
+        f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}",
+        "PRAGMA temp_store=MEMORY"
+    ]
+
+def engine_options(url: str) -> dict:
+    """Connection and pool arguments for ``create_engine`` for a database URL"""
+    database_url = make_url(url)
+    if database_url.get_backend_name() == "sqlite":
+        options = {"connect_args": {"check_same_thread": False}}
+        # In-memory databases live in a single connection and cannot be pooled
+        if database_url.database not in (None, "", ":memory:"):
+            options.update(
+                pool_size=settings.DB_POOL_SIZE,
+                max_overflow=settings.DB_MAX_OVERFLOW,
+                pool_timeout=settings.DB_POOL_TIMEOUT
+            )
+        return options
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING
+    }
+
+def _apply_sqlite_tuning(sync_engine, sqlite_tuning: Optional[bool]) -> None:
+    if sqlite_tuning is None:
+        sqlite_tuning = settings.SQLITE_PRAGMAS_ENABLED
+    if sync_engine.dialect.name == "sqlite" and sqlite_tuning:
+        @event.listens_for(sync_engine, "connect")
+        def apply_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for pragma in sqlite_pragmas():
+                    cursor.execute(pragma)
+            finally:
+                cursor.close()
+
+def create_db_engine(url: str, sqlite_tuning: Optional[bool] = None):
+    """Create an engine with the pool settings and, for SQLite, the pragmas from the settings"""
+    db_engine = create_engine(url, **engine_options(url))
+    _apply_sqlite_tuning(db_engine, sqlite_tuning)
+    return db_engine
+
+def async_database_url(url: str) -> str:
+    """The DATABASE_URL with its driver replaced by the matching asyncio driver"""
+    database_url = make_url(url)
+    backend = database_url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No asyncio driver configured for '{backend}' databases")
+    return database_url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+def create_async_db_engine(url: str, sqlite_tuning: Optional[bool] = None):
+    """Create an asyncio engine with the same pool settings and SQLite pragmas as the sync engine"""
+    options = engine_options(url)
+    if "pool_size" in options:
+        options["poolclass"] = AsyncAdaptedQueuePool
+    db_engine = create_async_engine(async_database_url(url), **options)
+    _apply_sqlite_tuning(db_engine.sync_engine, sqlite_tuning)
+    return db_engine
+
+# Sync engine for job workers and scripts such as create_db.py
+engine = create_db_engine(SQLALCHEMY_DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Asyncio engine for the API routes, so queries do not block the event loop
+async_engine = create_async_db_engine(SQLALCHEMY_DATABASE_URL)
+# Objects stay usable after commit: reloading expired attributes would need another await
+AsyncSessionLocal = sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 def get_db():
@@ -19,12 +108,27 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
 def recreate_tables():
     """Drop and recreate all tables"""
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
 
 
+def upgrade_db():
+    """Apply pending migrations; create_all never adds columns to tables that already exist"""
+    from alembic import command
+    from alembic.config import Config
+
+    # No alembic.ini, so the migrations leave the application's logging configuration alone
+    config = Config()
+    config.set_main_option("script_location", MIGRATIONS_DIR)
+    command.upgrade(config, "head")
+
 def init_db():
-    """Initialize the database and create tables"""
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+    """Initialize the database: create missing tables and bring existing ones up to date"""
+    Base.metadata.create_all(bind=engine)
+    upgrade_db()
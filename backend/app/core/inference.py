@@ -0,0 +1,54 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict
+from app.core.config import settings
+import threading
+
+class InferenceExecutor:
+    """Dedicated thread pools for blocking model inference.
+
+    Each model gets its own pool, sized by its ``*_MAX_CONCURRENCY`` setting,
+    so a long Whisper run can never occupy the threads needed by the
+    summarizer and none of the work runs on the asyncio event loop.
+    """
+    _executors: Dict[str, ThreadPoolExecutor] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _max_concurrency(model: str) -> int:
+        limits = {
+            "whisper": settings.WHISPER_MAX_CONCURRENCY,
+            "summarizer": settings.SUMMARIZER_MAX_CONCURRENCY,
+            "extractor": settings.EXTRACTOR_MAX_CONCURRENCY
+        }
+        if model not in limits:
+            raise ValueError(f"Unknown inference model '{model}'")
+        return max(1, limits[model])
+
+    @classmethod
+    def _get_executor(cls, model: str) -> ThreadPoolExecutor:
+        with cls._lock:
+            if model not in cls._executors:
+                cls._executors[model] = ThreadPoolExecutor(
+                    max_workers=cls._max_concurrency(model),
+                    thread_name_prefix=f"inference-{model}"
+                )
+            return cls._executors[model]
+
+    @classmethod
+    def submit(cls, model: str, fn: Callable, *args, **kwargs) -> Future:
+        """Schedule a blocking model call on the pool for ``model``"""
+        return cls._get_executor(model).submit(fn, *args, **kwargs)
+
+    @classmethod
+    def call(cls, model: str, fn: Callable, *args, **kwargs):
+        """Run a blocking model call on the pool for ``model`` and wait for it"""
+        return cls.submit(model, fn, *args, **kwargs).result()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Stop all inference pools"""
+        with cls._lock:
+            executors = list(cls._executors.values())
+            cls._executors = {}
+        for executor in executors:
+            executor.shutdown(wait=False)
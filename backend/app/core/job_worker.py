@@ -0,0 +1,166 @@
+from typing import Callable, Dict, List, Set
+from fastapi import HTTPException
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.process_manager import ProcessManager
+from app.services.job_service import JobService
+import threading
+
+class JobWorker:
+    """Background threads that drain the persistent job queue"""
+    _handlers: Dict[str, Callable] = {}
+    _threads: List[threading.Thread] = []
+    _running_jobs: Set[str] = set()
+    _lock = threading.Lock()
+    _stop_event = threading.Event()
+    _wake_event = threading.Event()
+    _recovered = False
+
+    @classmethod
+    def handler(cls, kind: str):
+        """Register a function as the handler for a job kind.
+
+        Handlers are called as ``handler(db, job_id, payload)`` from a worker
+        thread and return a JSON-serializable result.
+        """
+        def decorator(fn: Callable) -> Callable:
+            cls._handlers[kind] = fn
+            return fn
+        return decorator
+
+    @classmethod
+    def recover(cls) -> None:
+        """Requeue jobs interrupted by a previous run.
+
+        Runs once per process tree: a pre-fork parent recovers before forking,
+        and its workers must not requeue jobs their siblings are running.
+        """
+        if cls._recovered:
+            return
+        cls._recovered = True
+        db = SessionLocal()
+        try:
+            requeued = JobService.requeue_interrupted_jobs(db)
+            if requeued:
+                print(f"Requeued {requeued} interrupted job(s)")
+            # Queued jobs must be cancellable through ProcessManager after a restart
+            for job_id in JobService.get_queued_job_ids(db):
+                ProcessManager.register_process(job_id)
+        finally:
+            db.close()
+
+    @classmethod
+    def start(cls, worker_count: int = None, recover: bool = True) -> None:
+        """Recover interrupted jobs and start the worker threads"""
+        if cls._threads:
+            return
+
+        if recover:
+            cls.recover()
+
+        cls._stop_event.clear()
+        worker_count = worker_count or settings.JOB_WORKER_COUNT
+        for index in range(worker_count):
+            thread = threading.Thread(target=cls._run, name=f"job-worker-{index}", daemon=True)
+            thread.start()
+            cls._threads.append(thread)
+
+        watcher = threading.Thread(target=cls._watch_cancellations, name="job-cancel-watcher", daemon=True)
+        watcher.start()
+        cls._threads.append(watcher)
+
+    @classmethod
+    def stop(cls, timeout: float = 5.0) -> None:
+        """Signal the worker threads to exit and wait for them"""
+        cls._stop_event.set()
+        cls._wake_event.set()
+        for thread in cls._threads:
+            thread.join(timeout=timeout)
+        cls._threads = []
+
+    @classmethod
+    def notify(cls) -> None:
+        """Wake an idle worker because a new job was enqueued"""
+        cls._wake_event.set()
+
+    @classmethod
+    def _run(cls) -> None:
+        while not cls._stop_event.is_set():
+            try:
+                processed = cls._process_next()
+            except Exception as e:
+                print(f"Job worker error: {str(e)}")
+                processed = False
+            if not processed:
+                cls._wake_event.wait(settings.JOB_POLL_INTERVAL)
+                cls._wake_event.clear()
+
+    @classmethod
+    def _process_next(cls) -> bool:
+        db = SessionLocal()
+        try:
+            job = JobService.claim_next_job(db)
+            if not job:
+                return False
+
+            if job.cancel_requested or ProcessManager.is_cancelled(job.id):
+                JobService.mark_cancelled(db, job.id)
+                ProcessManager.remove_process(job.id)
+                return True
+
+            handler = cls._handlers.get(job.kind)
+            if handler is None:
+                JobService.fail_job(db, job.id, f"No handler registered for job kind '{job.kind}'")
+                ProcessManager.remove_process(job.id)
+                return True
+
+            ProcessManager.register_process(job.id)
+            with cls._lock:
+                cls._running_jobs.add(job.id)
+            try:
+                result = handler(db, job.id, JobService.get_payload(job))
+                JobService.complete_job(db, job.id, result)
+            except HTTPException as e:
+                db.rollback()
+                if e.status_code == 499:
+                    JobService.mark_cancelled(db, job.id)
+                else:
+                    JobService.fail_job(db, job.id, str(e.detail))
+            except Exception as e:
+                db.rollback()
+                print(f"Error running job {job.id}: {str(e)}")
+                JobService.fail_job(db, job.id, str(e))
+            finally:
+                with cls._lock:
+                    cls._running_jobs.discard(job.id)
+                ProcessManager.remove_process(job.id)
+            return True
+        finally:
+            db.close()
+
+    @classmethod
+    def _watch_cancellations(cls) -> None:
+        """Sync running jobs with the job table.
+
+        A cancel request may be handled by a different process than the one
+        running the job, so the database flag is mirrored into ProcessManager;
+        in the other direction, in-memory progress is persisted so any process
+        can report it.
+        """
+        while not cls._stop_event.wait(settings.JOB_POLL_INTERVAL):
+            with cls._lock:
+                running = list(cls._running_jobs)
+            if not running:
+                continue
+            db = SessionLocal()
+            try:
+                for job_id in JobService.get_cancel_requested_ids(db, running):
+                    ProcessManager.cancel_process(job_id)
+                for job_id in running:
+                    progress = ProcessManager.get_progress(job_id)
+                    if progress:
+                        JobService.update_progress(db, job_id, progress)
+            except Exception as e:
+                print(f"Job cancel watcher error: {str(e)}")
+            finally:
+                db.close()
@@ -0,0 +1,105 @@
+from typing import Any, Callable, Dict, List, Optional, Set
+from app.core.config import settings
+import threading
+import time
+
+class ModelRegistry:
+    """Thread-safe registry that loads models on first use.
+
+    Services register a loader per model name at import time; nothing is
+    loaded until ``get`` (or a warmup) asks for it, so processes that never
+    run inference never pay for the weights.
+    """
+    _loaders: Dict[str, Callable[[], Any]] = {}
+    _models: Dict[str, Any] = {}
+    _load_locks: Dict[str, threading.Lock] = {}
+    _loading: Set[str] = set()
+    _errors: Dict[str, str] = {}
+    _load_seconds: Dict[str, float] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def register(cls, name: str, loader: Callable[[], Any]) -> None:
+        """Register the loader for a model name"""
+        with cls._lock:
+            cls._loaders[name] = loader
+            cls._load_locks.setdefault(name, threading.Lock())
+
+    @classmethod
+    def get(cls, name: str) -> Any:
+        """Return the model, loading it on first use"""
+        model = cls._models.get(name)
+        if model is not None:
+            return model
+
+        if name not in cls._loaders:
+            raise KeyError(f"Unknown model '{name}'")
+
+        # One lock per model so loading BART does not block a Whisper caller
+        with cls._load_locks[name]:
+            model = cls._models.get(name)
+            if model is None:
+                cls._loading.add(name)
+                started = time.perf_counter()
+                try:
+                    model = cls._loaders[name]()
+                except Exception as e:
+                    cls._errors[name] = str(e)
+                    raise
+                finally:
+                    cls._loading.discard(name)
+                cls._load_seconds[name] = round(time.perf_counter() - started, 2)
+                cls._models[name] = model
+                cls._errors.pop(name, None)
+        return model
+
+    @classmethod
+    def is_loaded(cls, name: str) -> bool:
+        return name in cls._models
+
+    @classmethod
+    def registered_models(cls) -> List[str]:
+        return list(cls._loaders)
+
+    @classmethod
+    def preload_models(cls) -> List[str]:
+        """Models this process should load at startup (``PRELOAD_MODELS``)"""
+        return [name.strip() for name in settings.PRELOAD_MODELS.split(",") if name.strip()]
+
+    @classmethod
+    def warmup(cls, names: Optional[List[str]] = None) -> Dict[str, str]:
+        """Load the given models (default: all registered) and report the outcome of each"""
+        results = {}
+        for name in names or cls.registered_models():
+            try:
+                cls.get(name)
+                results[name] = "loaded"
+            except Exception as e:
+                print(f"Error warming up model {name}: {str(e)}")
+                results[name] = f"error: {str(e)}"
+        return results
+
+    @classmethod
+    def status(cls) -> Dict[str, Dict[str, Any]]:
+        """Load state of every registered model"""
+        status = {}
+        for name in cls.registered_models():
+            if name in cls._models:
+                state = "loaded"
+            elif name in cls._loading:
+                state = "loading"
+            elif name in cls._errors:
+                state = "error"
+            else:
+                state = "not_loaded"
+            status[name] = {
+                "state": state,
+                "load_seconds": cls._load_seconds.get(name),
+                "error": cls._errors.get(name)
+            }
+        return status
+
+    @classmethod
+    def is_ready(cls) -> bool:
+        """True once every model in ``PRELOAD_MODELS`` is loaded"""
+        return all(cls.is_loaded(name) for name in cls.preload_models())
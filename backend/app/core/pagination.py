@@ -0,0 +1,81 @@
+from sqlalchemy import String, tuple_, type_coerce
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+import base64
+import binascii
+import json
+
+# Largest page the listing endpoints return
+MAX_PAGE_SIZE = 1000
+# Cursors are short; anything longer was not issued by encode
+MAX_CURSOR_LENGTH = 256
+
+class Keyset:
+    """Cursor (keyset) pagination on ``(created_at, id)``, newest first.
+
+    A page is selected with ``WHERE (created_at, id) < (cursor values)``
+    instead of an OFFSET, so every page is an index range read no matter
+    how deep it is, and rows inserted meanwhile do not shift later pages.
+    Cursors are opaque to clients: base64url-encoded JSON of the sort key
+    of the last row on the page.
+    """
+
+    @staticmethod
+    def sort_key(model, dialect_name: str):
+        """The created_at expression to sort and compare on"""
+        # SQLite stores datetimes as text, with microseconds when SQLAlchemy writes them and
+        # without when CURRENT_TIMESTAMP does; compare the stored text as-is so a bound
+        # datetime in the other format does not skip or repeat rows from the same second
+        if dialect_name == "sqlite":
+            return type_coerce(model.created_at, String)
+        return model.created_at
+
+    @staticmethod
+    def encode(created_at: Any, row_id: int) -> str:
+        if isinstance(created_at, datetime):
+            created_at = created_at.isoformat()
+        payload = json.dumps([created_at, row_id], separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+    @staticmethod
+    def decode(cursor: str, dialect_name: str) -> Tuple[Any, int]:
+        """Sort key encoded in a cursor; ValueError if the cursor is malformed"""
+        try:
+            if len(cursor) > MAX_CURSOR_LENGTH:
+                raise ValueError(cursor)
+            padded = cursor + "=" * (-len(cursor) % 4)
+            key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            # Values end up as bound parameters; anything the database driver rejects would be a 500
+            if not isinstance(key, list) or len(key) != 2:
+                raise ValueError(key)
+            created_at, row_id = key
+            if created_at is not None and not isinstance(created_at, str):
+                raise ValueError(key)
+            if isinstance(row_id, bool) or not isinstance(row_id, int) or not -2 ** 63 <= row_id < 2 ** 63:
+                raise ValueError(key)
+            if created_at is not None and dialect_name != "sqlite":
+                created_at = datetime.fromisoformat(created_at)
+        except (binascii.Error, TypeError, ValueError, UnicodeDecodeError):
+            raise ValueError("Invalid pagination cursor")
+        return created_at, row_id
+
+    @staticmethod
+    def page_query(query, model, dialect_name: str, after: Optional[str], limit: int):
+        """Restrict a select to the page after ``after``, with one extra row to detect the next page"""
+        key = Keyset.sort_key(model, dialect_name)
+        query = query.add_columns(key.label("page_key"))
+        if after:
+            created_at, row_id = Keyset.decode(after, dialect_name)
+            query = query.where(tuple_(key, model.id) < tuple_(created_at, row_id))
+        return query.order_by(key.desc(), model.id.desc()).limit(limit + 1)
+
+    @staticmethod
+    def page(rows, limit: int) -> Tuple[List[Any], Optional[str]]:
+        """Split ``(object, page_key)`` rows into the page and the cursor of the next one"""
+        rows = list(rows)
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last, page_key = rows[-1]
+            next_cursor = Keyset.encode(page_key, last.id)
+        return [row[0] for row in rows], next_cursor
@@ -0,0 +1,199 @@
+from typing import Any, Dict, List, Optional
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+
+def read_memory(pid: int) -> Dict[str, int]:
+    """Memory of a process in bytes from /proc (Linux).
+
+    ``pss`` (proportional set size) divides every shared page between the
+    processes mapping it, so summing it over a process group gives the real
+    memory footprint, unlike ``rss`` which counts shared pages once per process.
+    """
+    fields = {"Rss": "rss", "Pss": "pss", "Shared_Clean": "shared", "Shared_Dirty": "shared",
+              "Private_Clean": "private", "Private_Dirty": "private"}
+    usage = {"rss": 0, "pss": 0, "shared": 0, "private": 0}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as smaps:
+            for line in smaps:
+                name, _, value = line.partition(":")
+                if name in fields:
+                    usage[fields[name]] += int(value.split()[0]) * 1024
+    except (FileNotFoundError, PermissionError):
+        # Kernels before 4.14 have no smaps_rollup; fall back to the resident size
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    usage["rss"] = usage["pss"] = int(line.split()[1]) * 1024
+    return usage
+
+def child_pids(pid: int) -> List[int]:
+    """Direct children of a process (Linux)"""
+    pids = []
+    for task in os.listdir(f"/proc/{pid}/task"):
+        try:
+            with open(f"/proc/{pid}/task/{task}/children") as children:
+                pids.extend(int(child) for child in children.read().split())
+        except FileNotFoundError:
+            continue
+    return pids
+
+class PreforkServer:
+    """Multi-process launcher that shares model weights between API workers.
+
+    The parent recovers interrupted jobs, loads every model in
+    PRELOAD_MODELS, binds the listening socket and then forks API_WORKERS
+    uvicorn workers. The weights live in memory the children inherit
+    copy-on-write; since inference never writes to them they stay shared, so
+    N workers cost roughly one copy of the models plus each worker's own
+    activations. Children that die are replaced.
+    """
+    # Set in forked workers; used to report memory for the whole group
+    parent_pid: Optional[int] = None
+
+    def __init__(self, app: Any, host: str, port: int, workers: int):
+        self.app = app
+        self.host = host
+        self.port = port
+        self.workers = max(1, workers)
+        self.children: Dict[int, int] = {}
+        self.stopping = False
+
+    def _preload(self) -> None:
+        from app.core.database import engine, init_db
+        from app.core.job_worker import JobWorker
+        from app.core.model_registry import ModelRegistry
+
+        init_db()
+        JobWorker.recover()
+
+        try:
+            import torch
+            # A single intra-op thread keeps torch from starting a thread pool that
+            # forked children would inherit in a broken state
+            torch.set_num_threads(1)
+        except ImportError:
+            pass
+
+        models = ModelRegistry.preload_models()
+        if not models:
+            print("PRELOAD_MODELS is empty: every worker will load its own copy of the models on first use")
+        else:
+            for name, result in ModelRegistry.warmup(models).items():
+                print(f"Preloaded {name}: {result}")
+
+        # Connections must not be shared across fork
+        engine.dispose()
+        # Keep the garbage collector from writing to the inherited objects (and unsharing their pages)
+        gc.collect()
+        gc.freeze()
+
+    def _bind(self) -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(2048)
+        sock.set_inheritable(True)
+        return sock
+
+    def _spawn(self, sock: socket.socket, index: int) -> None:
+        pid = os.fork()
+        if pid:
+            self.children[pid] = index
+            return
+
+        # Child: run one uvicorn server on the shared socket and never return
+        exit_code = 0
+        try:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            PreforkServer.parent_pid = os.getppid()
+            if "torch" in sys.modules:
+                sys.modules["torch"].set_num_threads(max(1, (os.cpu_count() or 1) // self.workers))
+
+            import uvicorn
+            config = uvicorn.Config(self.app, host=self.host, port=self.port)
+            uvicorn.Server(config).run(sockets=[sock])
+        except BaseException as e:
+            print(f"API worker {index} exited with error: {str(e)}")
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def _requeue_jobs(self, pid: int) -> None:
+        """Put the jobs a dead worker had claimed back on the queue for the others"""
+        from app.core.database import SessionLocal, engine
+        from app.services.job_service import JobService
+
+        db = SessionLocal()
+        try:
+            requeued = JobService.requeue_interrupted_jobs(db, worker_pid=pid)
+            if requeued:
+                print(f"Requeued {requeued} job(s) left running by PID {pid}")
+        except Exception as e:
+            print(f"Error requeueing jobs of PID {pid}: {str(e)}")
+        finally:
+            db.close()
+            # Connections must not be shared across fork
+            engine.dispose()
+
+    def _handle_stop(self, signum, frame) -> None:
+        self.stopping = True
+
+    def run(self) -> None:
+        """Preload, fork the workers and supervise them until SIGINT/SIGTERM"""
+        self._preload()
+        sock = self._bind()
+        print(f"Starting {self.workers} API workers on http://{self.host}:{self.port} (parent PID {os.getpid()})")
+
+        signal.signal(signal.SIGINT, self._handle_stop)
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        for index in range(self.workers):
+            self._spawn(sock, index)
+
+        while not self.stopping:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                time.sleep(0.5)
+                continue
+            index = self.children.pop(pid, None)
+            if index is not None and not self.stopping:
+                print(f"API worker {index} (PID {pid}) exited with status {status}; restarting")
+                self._requeue_jobs(pid)
+                self._spawn(sock, index)
+
+        for pid in self.children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        deadline = time.monotonic() + 30
+        while self.children and time.monotonic() < deadline:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+            if pid:
+                self.children.pop(pid, None)
+            else:
+                time.sleep(0.1)
+        for pid in self.children:
+            os.kill(pid, signal.SIGKILL)
+        sock.close()
+
+    @staticmethod
+    def memory_report() -> Dict[str, Any]:
+        """Memory of this process and, in a pre-fork worker, of the whole worker group"""
+        report: Dict[str, Any] = {"pid": os.getpid(), "process": read_memory(os.getpid())}
+        if PreforkServer.parent_pid is not None:
+            pids = [PreforkServer.parent_pid] + child_pids(PreforkServer.parent_pid)
+            usages = [read_memory(pid) for pid in pids]
+            report["group"] = {
+                "processes": len(pids),
+                "pss": sum(usage["pss"] for usage in usages),
+                "rss": sum(usage["rss"] for usage in usages)
+            }
+        return report
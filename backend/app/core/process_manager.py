@@ -1,8 +1,14 @@
-from typing import Dict
+from typing import Any, Dict, List, Optional
+from collections import OrderedDict
 import threading
+import time
 
 class ProcessManager:
     _active_processes: Dict[str, bool] = {}
+    _progress: Dict[str, Dict[str, Any]] = {}
+    # Event logs outlive their process so late subscribers can still replay them
+    _events: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+    MAX_EVENT_LOGS = 100
     _lock = threading.Lock()
 
     @classmethod
@@ -26,8 +32,67 @@ class ProcessManager:
         with cls._lock:
             return process_id in cls._active_processes and not cls._active_processes[process_id]
 
+    @classmethod
+    def is_active(cls, process_id: str) -> bool:
+        """Check if a process is still tracked"""
+        with cls._lock:
+            return process_id in cls._active_processes
+
+    @classmethod
+    def update_progress(cls, process_id: str, **progress: Any) -> None:
+        """Merge progress fields (stage, seconds processed, ...) into a process's progress"""
+        with cls._lock:
+            merged = cls._progress.setdefault(process_id, {})
+            # Lets readers tell this copy from the persisted one written by another process
+            merged.update(progress, updated_at=time.time())
+            cls._append_event(process_id, "progress", dict(merged))
+
+    @classmethod
+    def publish_event(cls, process_id: str, event: str, data: Dict[str, Any]) -> None:
+        """Append an event (stage change, transcript segment, ...) to a process's event log"""
+        with cls._lock:
+            cls._append_event(process_id, event, data)
+
+    @classmethod
+    def _append_event(cls, process_id: str, event: str, data: Dict[str, Any]) -> None:
+        log = cls._events.get(process_id)
+        if log is None:
+            log = cls._events[process_id] = []
+            while len(cls._events) > cls.MAX_EVENT_LOGS:
+                cls._events.popitem(last=False)
+        log.append({"id": len(log) + 1, "event": event, "data": data})
+
+    @classmethod
+    def get_events(cls, process_id: str, after: int = 0) -> List[Dict[str, Any]]:
+        """Get the events of a process with an ID greater than ``after``"""
+        with cls._lock:
+            return list(cls._events.get(process_id, [])[after:])
+
+    @classmethod
+    def has_events(cls, process_id: str) -> bool:
+        """Check whether this process has seen any event for a process"""
+        with cls._lock:
+            return process_id in cls._events
+
+    @classmethod
+    def get_progress(cls, process_id: str) -> Optional[Dict[str, Any]]:
+        """Get the latest progress of a process"""
+        with cls._lock:
+            progress = cls._progress.get(process_id)
+            return dict(progress) if progress is not None else None
+
+    @staticmethod
+    def newest_progress(*candidates: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """The most recently updated of several copies of a progress (e.g. in memory and persisted)"""
+        candidates = [progress for progress in candidates if progress]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda progress: progress.get("updated_at", 0))
+
     @classmethod
     def remove_process(cls, process_id: str) -> None:
         """Remove a process from tracking"""
         with cls._lock:
-            cls._active_processes.pop(process_id, None) 
\ No newline at end of file
+            cls._active_processes.pop(process_id, None)
+            cls._progress.pop(process_id, None)
+ 
\ No newline at end of file
@@ -0,0 +1,85 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from app.core.config import settings
+import multiprocessing
+import os
+import threading
+import time
+
+# Transcription model of the current pool worker process, loaded once by the initializer
+_worker_model = None
+
+def _init_worker(backend: str, threads: int) -> None:
+    global _worker_model
+    import torch
+    from app.services.transcription_backends import TranscriptionBackends
+
+    # Split the cores between workers instead of letting each one claim all of them
+    torch.set_num_threads(threads)
+    _worker_model = TranscriptionBackends.load(backend)
+
+def _ping(delay: float) -> int:
+    time.sleep(delay)
+    return os.getpid()
+
+def _transcribe_chunk(
+    audio, windows: List[Tuple[int, int]], sample_rate: int, decode_options: Dict[str, Any]
+) -> List[Tuple[List[Dict[str, Any]], str]]:
+    from app.services.transcription_service import TranscriptionService
+
+    return [
+        (segments, text)
+        for _, segments, text in TranscriptionService._iter_windows(
+            _worker_model.transcribe, audio, windows, sample_rate, decode_options
+        )
+    ]
+
+class TranscriptionPool:
+    """Worker processes that each hold their own transcription model.
+
+    Used to transcribe chunks of long recordings in parallel on CPU. There is
+    one pool per transcription backend; workers are spawned (not forked) on
+    first use and load the model in their initializer, so each costs one
+    model's worth of memory.
+    """
+    _executors: Dict[str, ProcessPoolExecutor] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def _get_executor(cls, backend: str) -> ProcessPoolExecutor:
+        with cls._lock:
+            if backend not in cls._executors:
+                workers = max(1, settings.PARALLEL_TRANSCRIPTION_WORKERS)
+                cls._executors[backend] = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(backend, max(1, (os.cpu_count() or 1) // workers))
+                )
+            return cls._executors[backend]
+
+    @classmethod
+    def submit_chunk(
+        cls, backend: str, audio, windows: List[Tuple[int, int]], sample_rate: int, decode_options: Dict[str, Any]
+    ) -> Future:
+        """Transcribe the given windows of an audio chunk in a worker process"""
+        return cls._get_executor(backend).submit(_transcribe_chunk, audio, windows, sample_rate, decode_options)
+
+    @classmethod
+    def warmup(cls, backend: str = "whisper") -> List[int]:
+        """Start every worker and wait for their models to load; returns the worker PIDs"""
+        executor = cls._get_executor(backend)
+        futures = [executor.submit(_ping, 0.2) for _ in range(executor._max_workers)]
+        return sorted({future.result() for future in futures})
+
+    @classmethod
+    def shutdown(cls, backend: Optional[str] = None) -> None:
+        """Stop the worker processes of one backend (default: all)"""
+        with cls._lock:
+            if backend is None:
+                executors = list(cls._executors.values())
+                cls._executors = {}
+            else:
+                executors = [cls._executors.pop(backend)] if backend in cls._executors else []
+        for executor in executors:
+            executor.shutdown(wait=False, cancel_futures=True)
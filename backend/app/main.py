@@ -1,7 +1,15 @@
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.routes import meetings, action_items, decisions
+from app.api.routes import meetings, action_items, decisions, jobs, admin, search
 from app.core.config import settings
+from app.core.database import async_engine, init_db
+from app.core.job_worker import JobWorker
+from app.core.inference import InferenceExecutor
+from app.core.transcription_pool import TranscriptionPool
+from app.core.model_registry import ModelRegistry
+from app.services.direct_upload_service import DirectUploadService
+import threading
 
 app = FastAPI(
     title="AI Meeting Summarizer API",
@@ -22,6 +30,37 @@ app.add_middleware(
 app.include_router(meetings.router, prefix="/api/meetings", tags=["meetings"])
 app.include_router(action_items.router, prefix="/api/action-items", tags=["action-items"])
 app.include_router(decisions.router, prefix="/api/decisions", tags=["decisions"])
+app.include_router(search.router, prefix="/api/search", tags=["search"])
+app.include_router(jobs.router, prefix="/api/jobs", tags=["jobs"])
+app.include_router(admin.router, prefix="/admin", tags=["admin"])
+
+@app.on_event("startup")
+async def start_job_worker():
+    init_db()
+    JobWorker.start()
+    DirectUploadService.start_sweeper()
+
+@app.on_event("startup")
+async def preload_models():
+    # Load in the background so the API is up while weights are read; /ready reports progress
+    if ModelRegistry.preload_models():
+        threading.Thread(
+            target=ModelRegistry.warmup,
+            args=(ModelRegistry.preload_models(),),
+            name="model-preload",
+            daemon=True
+        ).start()
+
+@app.on_event("shutdown")
+async def stop_job_worker():
+    JobWorker.stop()
+    DirectUploadService.stop_sweeper()
+    InferenceExecutor.shutdown()
+    TranscriptionPool.shutdown()
+
+@app.on_event("shutdown")
+async def close_database():
+    await async_engine.dispose()
 
 @app.get("/")
 async def root():
@@ -31,6 +70,19 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/ready")
+async def readiness_check():
+    """Ready once every model in PRELOAD_MODELS is loaded"""
+    content = {
+        "status": "ready" if ModelRegistry.is_ready() else "loading",
+        "models": ModelRegistry.status()
+    }
+    return JSONResponse(status_code=200 if ModelRegistry.is_ready() else 503, content=content)
+
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    if settings.API_WORKERS > 1:
+        from app.core.prefork import PreforkServer
+        PreforkServer(app, settings.API_HOST, settings.API_PORT, settings.API_WORKERS).run()
+    else:
+        import uvicorn
+        uvicorn.run(app, host=settings.API_HOST, port=settings.API_PORT) 
\ No newline at end of file
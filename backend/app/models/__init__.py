@@ -1,3 +1,4 @@
-from .models import Meeting, ActionItem, Decision
+from .models import Meeting, MeetingParticipant, ActionItem, Decision, Job, TranscriptCacheEntry, SummaryCacheEntry, DirectUpload, AudioBlob
+from . import search_index  # Registers the full-text search DDL with the metadata
 
-__all__ = ['Meeting', 'ActionItem', 'Decision'] 
\ No newline at end of file
+__all__ = ['Meeting', 'MeetingParticipant', 'ActionItem', 'Decision', 'Job', 'TranscriptCacheEntry', 'SummaryCacheEntry', 'DirectUpload', 'AudioBlob'] 
\ No newline at end of file
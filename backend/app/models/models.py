@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, ARRAY
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, ARRAY, Index, JSON
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -10,19 +10,38 @@ class Meeting(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
     description = Column(Text)
-    date = Column(DateTime, nullable=True)
+    date = Column(DateTime, nullable=True, index=True)
     duration = Column(Integer, nullable=True)
-    participants = Column(Text, nullable=True)  # Store as JSON string
+    participants = Column(JSON, nullable=True)  # List of participants, as given
     status = Column(String, nullable=True)
     audio_file_path = Column(String)
+    audio_sha256 = Column(String, ForeignKey("audio_blobs.sha256"), nullable=True)
     transcript = Column(Text)
     summary = Column(Text)
     calendar_event_id = Column(String, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     action_items = relationship("ActionItem", back_populates="meeting")
     decisions = relationship("Decision", back_populates="meeting")
+    # Normalized copy of participants, kept in sync by MeetingService for the ?participant= filter
+    participant_rows = relationship("MeetingParticipant", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # Listing filtered by status, newest first
+        Index("ix_meetings_status_created_at", "status", "created_at"),
+    )
+
+class MeetingParticipant(Base):
+    __tablename__ = "meeting_participants"
+    
+    meeting_id = Column(Integer, ForeignKey("meetings.id", ondelete="CASCADE"), primary_key=True)
+    participant = Column(String(255), primary_key=True)  # Stripped and lowercased
+    
+    __table_args__ = (
+        # Meetings of a participant
+        Index("ix_meeting_participants_participant_meeting_id", "participant", "meeting_id"),
+    )
 
 class ActionItem(Base):
     __tablename__ = "action_items"
@@ -33,10 +52,15 @@ class ActionItem(Base):
     description = Column(Text, nullable=False)
     assignee = Column(String(255), nullable=False)
     due_date = Column(DateTime, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     meeting = relationship("Meeting", back_populates="action_items")
+    
+    __table_args__ = (
+        # Action items of a meeting, newest first (also serves the foreign key)
+        Index("ix_action_items_meeting_id_created_at", "meeting_id", "created_at"),
+    )
 
 class Decision(Base):
     __tablename__ = "decisions"
@@ -47,7 +71,77 @@ class Decision(Base):
     description = Column(Text, nullable=False)
     decision_maker = Column(String(255), nullable=False)
     rationale = Column(Text, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
-    meeting = relationship("Meeting", back_populates="decisions") 
\ No newline at end of file
+    meeting = relationship("Meeting", back_populates="decisions")
+    
+    __table_args__ = (
+        # Decisions of a meeting, newest first (also serves the foreign key)
+        Index("ix_decisions_meeting_id_created_at", "meeting_id", "created_at"),
+    )
+
+class Job(Base):
+    __tablename__ = "jobs"
+    
+    id = Column(String, primary_key=True, index=True)
+    kind = Column(String, nullable=False)
+    status = Column(String, nullable=False, default="queued", index=True)
+    payload = Column(Text, nullable=True)  # Store as JSON string
+    result = Column(Text, nullable=True)  # Store as JSON string
+    progress = Column(Text, nullable=True)  # Store as JSON string
+    error = Column(Text, nullable=True)
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    worker_pid = Column(Integer, nullable=True)  # Process running the job, so a dead worker's jobs can be requeued
+
+class TranscriptCacheEntry(Base):
+    __tablename__ = "transcript_cache"
+    
+    key = Column(String, primary_key=True)
+    audio_sha256 = Column(String, nullable=False, index=True)
+    model = Column(String, nullable=False)
+    options = Column(Text, nullable=True)  # Store as JSON string
+    transcript = Column(Text, nullable=False)
+    size_bytes = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    last_accessed_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+class SummaryCacheEntry(Base):
+    __tablename__ = "summary_cache"
+    
+    key = Column(String, primary_key=True)
+    kind = Column(String, nullable=False)
+    model = Column(String, nullable=False)
+    value = Column(Text, nullable=False)  # Store as JSON string
+    created_at = Column(DateTime, default=datetime.utcnow)
+    last_accessed_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+class DirectUpload(Base):
+    __tablename__ = "direct_uploads"
+    
+    id = Column(String, primary_key=True)
+    file_path = Column(String, nullable=False)
+    original_filename = Column(String, nullable=True)
+    audio_sha256 = Column(String, nullable=True)
+    size_bytes = Column(Integer, nullable=False, default=0)
+    transcript = Column(Text, nullable=True)
+    summary = Column(Text, nullable=True)
+    action_items = Column(Text, nullable=True)  # Store as JSON string
+    decisions = Column(Text, nullable=True)  # Store as JSON string
+    transcription_error = Column(Text, nullable=True)
+    summary_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    last_accessed_at = Column(DateTime, default=datetime.utcnow, index=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+class AudioBlob(Base):
+    __tablename__ = "audio_blobs"
+    
+    sha256 = Column(String, primary_key=True)
+    path = Column(String, nullable=False)
+    size_bytes = Column(Integer, nullable=False)
+    ref_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,83 @@
+"""Full-text search indexes over meeting content, created and dropped with the tables.
+
+On SQLite every searchable table gets an FTS5 table that uses it as external
+content, so the text is not stored twice, and triggers that update the FTS
+table on every insert, update and delete, whichever code path writes the row.
+On PostgreSQL a GIN index on a ``to_tsvector`` expression of the same
+columns serves the search, and PostgreSQL keeps it current itself.
+"""
+from sqlalchemy import event
+from app.core.database import Base
+from typing import List
+
+# Searchable tables and their text columns, most important first
+SEARCH_SOURCES = {
+    "meetings": ["title", "description", "transcript", "summary"],
+    "action_items": ["title", "description", "assignee"],
+    "decisions": ["title", "description", "decision_maker", "rationale"]
+}
+# Text search configuration for PostgreSQL; Porter stemming matches it on SQLite
+POSTGRESQL_TEXT_SEARCH_CONFIG = "english"
+
+def fts_table(table: str) -> str:
+    return f"{table}_fts"
+
+def tsvector_expression(table: str) -> str:
+    """The indexed tsvector of a row; queries must use the same expression to use the index"""
+    document = " || ' ' || ".join(f"coalesce({column}, '')" for column in SEARCH_SOURCES[table])
+    return f"to_tsvector('{POSTGRESQL_TEXT_SEARCH_CONFIG}', {document})"
+
+def _sqlite_ddl(table: str, columns: List[str]) -> List[str]:
+    fts = fts_table(table)
+    names = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    insert_new = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new_values});"
+    delete_old = f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old_values});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{names}, content='{table}', content_rowid='id', tokenize='porter unicode61')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN {delete_old} END",
+        # Only changes to indexed columns touch the index, not status or timestamp updates
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {names} ON {table} BEGIN {delete_old} {insert_new} END"
+    ]
+
+def search_index_ddl(dialect_name: str) -> List[str]:
+    """Statements creating the search index; each can be run again on a database that has it"""
+    statements = []
+    for table, columns in SEARCH_SOURCES.items():
+        if dialect_name == "sqlite":
+            statements += _sqlite_ddl(table, columns)
+        elif dialect_name == "postgresql":
+            statements.append(
+                f"CREATE INDEX IF NOT EXISTS ix_{table}_search ON {table} USING GIN ({tsvector_expression(table)})"
+            )
+    return statements
+
+def drop_search_index_ddl(dialect_name: str) -> List[str]:
+    statements = []
+    for table in SEARCH_SOURCES:
+        fts = fts_table(table)
+        if dialect_name == "sqlite":
+            statements += [f"DROP TRIGGER IF EXISTS {fts}_{suffix}" for suffix in ("ai", "ad", "au")]
+            statements.append(f"DROP TABLE IF EXISTS {fts}")
+        elif dialect_name == "postgresql":
+            statements.append(f"DROP INDEX IF EXISTS ix_{table}_search")
+    return statements
+
+def rebuild_search_index_ddl(dialect_name: str) -> List[str]:
+    """Statements that index the rows already in the tables (only SQLite needs them)"""
+    if dialect_name != "sqlite":
+        return []
+    return [f"INSERT INTO {fts_table(table)}({fts_table(table)}) VALUES ('rebuild')" for table in SEARCH_SOURCES]
+
+@event.listens_for(Base.metadata, "after_create")
+def create_search_index(target, connection, **kw):
+    for statement in search_index_ddl(connection.dialect.name):
+        connection.exec_driver_sql(statement)
+
+@event.listens_for(Base.metadata, "before_drop")
+def drop_search_index(target, connection, **kw):
+    for statement in drop_search_index_ddl(connection.dialect.name):
+        connection.exec_driver_sql(statement)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Any
 from datetime import datetime
 
 # Meeting schemas
@@ -31,6 +31,7 @@ class MeetingUpdate(BaseModel):
 class Meeting(MeetingBase):
     id: int
     audio_file_path: Optional[str] = None
+    audio_sha256: Optional[str] = None
     transcript: Optional[str] = None
     summary: Optional[str] = None
     calendar_event_id: Optional[str] = None
@@ -60,7 +61,11 @@ class ActionItem(ActionItemBase):
     updated_at: datetime
 
     class Config:
-        orm_mode = True
+        from_attributes = True
+
+class ActionItemPage(BaseModel):
+    items: List[ActionItem]
+    next_cursor: Optional[str] = None
 
 # Decision schemas
 class DecisionBase(BaseModel):
@@ -82,4 +87,38 @@ class Decision(DecisionBase):
     updated_at: datetime
 
     class Config:
-        orm_mode = True 
\ No newline at end of file
+        from_attributes = True 
+
+class DecisionPage(BaseModel):
+    items: List[Decision]
+    next_cursor: Optional[str] = None
+
+# Meeting with the relationships requested with ?expand=; fields that were not expanded are left out
+class MeetingDetail(Meeting):
+    action_items: Optional[List[ActionItem]] = None
+    decisions: Optional[List[Decision]] = None
+
+class MeetingPage(BaseModel):
+    items: List[MeetingDetail]
+    next_cursor: Optional[str] = None  # Pass as ?after= for the next page; None on the last page
+
+# Job schemas
+class Job(BaseModel):
+    id: str
+    kind: str
+    status: str
+    progress: Optional[Dict[str, Any]] = None
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+# Search schemas
+class SearchResult(BaseModel):
+    type: str  # "meeting", "action_item" or "decision"
+    id: int
+    meeting_id: Optional[int] = None
+    title: Optional[str] = None
+    snippet: str  # Best matching passage, matched terms wrapped in <mark></mark>
+    score: float  # Higher is more relevant
@@ -1,7 +1,11 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.core.pagination import Keyset
 from app.models.models import ActionItem
 from app.schemas.schemas import ActionItemCreate, ActionItemUpdate
 from fastapi import HTTPException
+from typing import Optional, Tuple
 
 class ActionItemService:
     @staticmethod
@@ -46,4 +50,67 @@ class ActionItemService:
         
         db.delete(db_action_item)
         db.commit()
-        return True 
\ No newline at end of file
+        return True 
+    
+    @staticmethod
+    async def create_action_item_async(db: AsyncSession, action_item: ActionItemCreate) -> ActionItem:
+        """Create a new action item"""
+        db_action_item = ActionItem(**action_item.dict())
+        db.add(db_action_item)
+        await db.commit()
+        await db.refresh(db_action_item)
+        return db_action_item
+    
+    @staticmethod
+    async def get_action_item_async(db: AsyncSession, action_item_id: int) -> ActionItem:
+        """Get an action item by ID"""
+        return await db.get(ActionItem, action_item_id)
+    
+    @staticmethod
+    def _page_query(dialect_name: str, meeting_id: Optional[int] = None, after: Optional[str] = None, limit: int = 100):
+        query = select(ActionItem)
+        if meeting_id is not None:
+            query = query.where(ActionItem.meeting_id == meeting_id)
+        return Keyset.page_query(query, ActionItem, dialect_name, after, limit)
+    
+    @staticmethod
+    async def get_action_items_async(
+        db: AsyncSession,
+        meeting_id: Optional[int] = None,
+        after: Optional[str] = None,
+        limit: int = 100
+    ) -> Tuple[list[ActionItem], Optional[str]]:
+        """Get a page of action items, newest first, optionally filtered by meeting, and the next page's cursor"""
+        query = ActionItemService._page_query(db.bind.dialect.name, meeting_id, after, limit)
+        return Keyset.page((await db.execute(query)).all(), limit)
+    
+    @staticmethod
+    async def get_meeting_action_items_async(db: AsyncSession, meeting_id: int) -> list[ActionItem]:
+        """Get all action items for a meeting"""
+        query = select(ActionItem).where(ActionItem.meeting_id == meeting_id)
+        return (await db.execute(query)).scalars().all()
+    
+    @staticmethod
+    async def update_action_item_async(db: AsyncSession, action_item_id: int, action_item: ActionItemUpdate) -> ActionItem:
+        """Update an action item"""
+        db_action_item = await db.get(ActionItem, action_item_id)
+        if not db_action_item:
+            raise HTTPException(status_code=404, detail="Action item not found")
+        
+        for key, value in action_item.dict(exclude_unset=True).items():
+            setattr(db_action_item, key, value)
+        
+        await db.commit()
+        await db.refresh(db_action_item)
+        return db_action_item
+    
+    @staticmethod
+    async def delete_action_item_async(db: AsyncSession, action_item_id: int) -> bool:
+        """Delete an action item"""
+        db_action_item = await db.get(ActionItem, action_item_id)
+        if not db_action_item:
+            raise HTTPException(status_code=404, detail="Action item not found")
+        
+        await db.delete(db_action_item)
+        await db.commit()
+        return True
@@ -0,0 +1,135 @@
+from fastapi import UploadFile
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.models import AudioBlob
+from app.services.upload_service import UploadService
+from typing import Any, Dict, Optional
+import os
+import uuid
+
+class AudioBlobService:
+    """Content-addressed, reference-counted storage for uploaded audio.
+
+    Each distinct recording is stored once, at
+    ``AUDIO_BLOB_DIR/<sha[:2]>/<sha[2:4]>/<sha>``; the two levels of
+    sharding keep every directory small however many recordings there are.
+    Meetings and direct uploads hold a reference to the blob by its SHA-256,
+    and the file is deleted when the last reference is released.
+    """
+
+    @staticmethod
+    def blob_path(sha256: str) -> str:
+        return os.path.join(settings.AUDIO_BLOB_DIR, sha256[:2], sha256[2:4], sha256)
+
+    @staticmethod
+    def acquire(db: Session, sha256: str) -> Optional[AudioBlob]:
+        """Add a reference to an existing blob; None if there is no such blob"""
+        updated = db.query(AudioBlob).filter(AudioBlob.sha256 == sha256).update(
+            {AudioBlob.ref_count: AudioBlob.ref_count + 1},
+            synchronize_session=False
+        )
+        db.commit()
+        if not updated:
+            return None
+        return db.query(AudioBlob).filter(AudioBlob.sha256 == sha256).first()
+
+    @staticmethod
+    def _add_file(db: Session, temp_path: str, sha256: str, size_bytes: int) -> AudioBlob:
+        """Take a reference to the blob with this content, moving ``temp_path`` into place if it is new"""
+        db_blob = AudioBlobService.acquire(db, sha256)
+        if db_blob:
+            if os.path.exists(db_blob.path):
+                os.remove(temp_path)
+            else:
+                # Restore a blob whose file was removed from disk
+                os.makedirs(os.path.dirname(db_blob.path), exist_ok=True)
+                os.replace(temp_path, db_blob.path)
+            return db_blob
+
+        path = AudioBlobService.blob_path(sha256)
+        try:
+            db.add(AudioBlob(sha256=sha256, path=path, size_bytes=size_bytes, ref_count=1))
+            db.flush()
+        except IntegrityError:
+            # Another request stored the same recording first
+            db.rollback()
+            return AudioBlobService._add_file(db, temp_path, sha256, size_bytes)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(temp_path, path)
+        db.commit()
+        return db.query(AudioBlob).filter(AudioBlob.sha256 == sha256).first()
+
+    @staticmethod
+    async def _save_temp(file: UploadFile) -> Dict[str, Any]:
+        temp_dir = os.path.join(settings.AUDIO_BLOB_DIR, "tmp")
+        os.makedirs(temp_dir, exist_ok=True)
+        return await UploadService.save_upload(file, os.path.join(temp_dir, str(uuid.uuid4())))
+
+    @staticmethod
+    def _add_saved(db: Session, saved: Dict[str, Any]) -> AudioBlob:
+        try:
+            return AudioBlobService._add_file(db, saved["path"], saved["sha256"], saved["size"])
+        except BaseException:
+            if os.path.exists(saved["path"]):
+                os.remove(saved["path"])
+            raise
+
+    @staticmethod
+    async def store_upload_async(db: AsyncSession, file: UploadFile) -> AudioBlob:
+        """Stream an upload into the store and return its blob, holding one new reference"""
+        saved = await AudioBlobService._save_temp(file)
+        return await db.run_sync(AudioBlobService._add_saved, saved)
+
+    @staticmethod
+    def release(db: Session, sha256: Optional[str]) -> bool:
+        """Drop one reference to a blob, deleting it and its file when none are left.
+
+        Returns False if there is no blob with this hash. Commits the session.
+        """
+        if not sha256:
+            return False
+        updated = db.query(AudioBlob).filter(AudioBlob.sha256 == sha256).update(
+            {AudioBlob.ref_count: AudioBlob.ref_count - 1},
+            synchronize_session=False
+        )
+        if not updated:
+            db.commit()
+            return False
+
+        db_blob = db.query(AudioBlob).filter(AudioBlob.sha256 == sha256, AudioBlob.ref_count <= 0).first()
+        if db_blob:
+            db.delete(db_blob)
+            db.flush()
+            # Removed while the transaction still holds the row, so a concurrent upload
+            # of the same recording waits and then stores the file again
+            if os.path.exists(db_blob.path):
+                try:
+                    os.remove(db_blob.path)
+                except OSError as e:
+                    print(f"Error deleting audio blob {db_blob.path}: {str(e)}")
+        db.commit()
+        return True
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """Number of blobs, their size on disk and the bytes saved by deduplication"""
+        db = SessionLocal()
+        try:
+            blobs, references, total_bytes, deduplicated_bytes = db.query(
+                func.count(AudioBlob.sha256),
+                func.coalesce(func.sum(AudioBlob.ref_count), 0),
+                func.coalesce(func.sum(AudioBlob.size_bytes), 0),
+                func.coalesce(func.sum(AudioBlob.size_bytes * (AudioBlob.ref_count - 1)), 0)
+            ).one()
+        finally:
+            db.close()
+        return {
+            "blobs": blobs,
+            "references": references,
+            "total_bytes": total_bytes,
+            "deduplicated_bytes": deduplicated_bytes
+        }
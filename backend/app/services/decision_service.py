@@ -1,7 +1,11 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.core.pagination import Keyset
 from app.models.models import Decision
 from app.schemas.schemas import DecisionCreate, DecisionUpdate
 from fastapi import HTTPException
+from typing import Optional, Tuple
 
 class DecisionService:
     @staticmethod
@@ -46,4 +50,67 @@ class DecisionService:
         
         db.delete(db_decision)
         db.commit()
-        return True 
\ No newline at end of file
+        return True 
+    
+    @staticmethod
+    async def create_decision_async(db: AsyncSession, decision: DecisionCreate) -> Decision:
+        """Create a new decision"""
+        db_decision = Decision(**decision.dict())
+        db.add(db_decision)
+        await db.commit()
+        await db.refresh(db_decision)
+        return db_decision
+    
+    @staticmethod
+    async def get_decision_async(db: AsyncSession, decision_id: int) -> Decision:
+        """Get a decision by ID"""
+        return await db.get(Decision, decision_id)
+    
+    @staticmethod
+    def _page_query(dialect_name: str, meeting_id: Optional[int] = None, after: Optional[str] = None, limit: int = 100):
+        query = select(Decision)
+        if meeting_id is not None:
+            query = query.where(Decision.meeting_id == meeting_id)
+        return Keyset.page_query(query, Decision, dialect_name, after, limit)
+    
+    @staticmethod
+    async def get_decisions_async(
+        db: AsyncSession,
+        meeting_id: Optional[int] = None,
+        after: Optional[str] = None,
+        limit: int = 100
+    ) -> Tuple[list[Decision], Optional[str]]:
+        """Get a page of decisions, newest first, optionally filtered by meeting, and the next page's cursor"""
+        query = DecisionService._page_query(db.bind.dialect.name, meeting_id, after, limit)
+        return Keyset.page((await db.execute(query)).all(), limit)
+    
+    @staticmethod
+    async def get_meeting_decisions_async(db: AsyncSession, meeting_id: int) -> list[Decision]:
+        """Get all decisions for a meeting"""
+        query = select(Decision).where(Decision.meeting_id == meeting_id)
+        return (await db.execute(query)).scalars().all()
+    
+    @staticmethod
+    async def update_decision_async(db: AsyncSession, decision_id: int, decision: DecisionUpdate) -> Decision:
+        """Update a decision"""
+        db_decision = await db.get(Decision, decision_id)
+        if not db_decision:
+            raise HTTPException(status_code=404, detail="Decision not found")
+        
+        for key, value in decision.dict(exclude_unset=True).items():
+            setattr(db_decision, key, value)
+        
+        await db.commit()
+        await db.refresh(db_decision)
+        return db_decision
+    
+    @staticmethod
+    async def delete_decision_async(db: AsyncSession, decision_id: int) -> bool:
+        """Delete a decision"""
+        db_decision = await db.get(Decision, decision_id)
+        if not db_decision:
+            raise HTTPException(status_code=404, detail="Decision not found")
+        
+        await db.delete(db_decision)
+        await db.commit()
+        return True
@@ -0,0 +1,194 @@
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from fastapi.encoders import jsonable_encoder
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.models import AudioBlob, DirectUpload, Job
+from app.services.audio_blob_service import AudioBlobService
+from app.services.job_service import JobService
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+import json
+import threading
+
+class DirectUploadService:
+    """Persistent store for files uploaded through ``upload-direct``.
+
+    Entries live in the ``direct_uploads`` table so every worker process
+    sees them and they survive a restart. They expire after
+    DIRECT_UPLOAD_TTL_SECONDS, and the least recently used entries are
+    evicted above DIRECT_UPLOAD_MAX_ENTRIES or DIRECT_UPLOAD_MAX_BYTES.
+    Each entry holds a reference to its audio in AudioBlobService, released
+    when the entry is deleted; uploads with a queued or running job are
+    never deleted.
+    """
+    JSON_FIELDS = ("action_items", "decisions")
+
+    _sweeper: Optional[threading.Thread] = None
+    _stop_event = threading.Event()
+
+    @staticmethod
+    def create(db: Session, file_id: str, blob: AudioBlob, original_filename: str) -> DirectUpload:
+        """Record an upload that takes over a reference to ``blob``, and evict old uploads above the limits"""
+        now = datetime.utcnow()
+        previous_sha256 = None
+        db_upload = db.query(DirectUpload).filter(DirectUpload.id == file_id).first()
+        if db_upload is None:
+            db_upload = DirectUpload(id=file_id)
+            db.add(db_upload)
+        else:
+            # The file ID was reused; the new upload replaces the old one
+            previous_sha256 = db_upload.audio_sha256
+        db_upload.file_path = blob.path
+        db_upload.original_filename = original_filename
+        db_upload.audio_sha256 = blob.sha256
+        db_upload.size_bytes = blob.size_bytes
+        for name in ("transcript", "summary", "action_items", "decisions", "transcription_error", "summary_error"):
+            setattr(db_upload, name, None)
+        db_upload.created_at = now
+        db_upload.last_accessed_at = now
+        db_upload.expires_at = now + timedelta(seconds=settings.DIRECT_UPLOAD_TTL_SECONDS)
+        db.commit()
+        AudioBlobService.release(db, previous_sha256)
+        db.refresh(db_upload)
+        DirectUploadService._evict(db, keep=file_id)
+        return db_upload
+
+    @staticmethod
+    def exists(db: Session, file_id: str) -> bool:
+        """Whether an upload with this ID is stored, expired or not"""
+        return db.query(DirectUpload.id).filter(DirectUpload.id == file_id).first() is not None
+
+    @staticmethod
+    def get(db: Session, file_id: str) -> Optional[DirectUpload]:
+        """Get an unexpired upload and mark it as recently used"""
+        db_upload = db.query(DirectUpload).filter(
+            DirectUpload.id == file_id,
+            DirectUpload.expires_at > datetime.utcnow()
+        ).first()
+        if db_upload:
+            db_upload.last_accessed_at = datetime.utcnow()
+            db.commit()
+        return db_upload
+
+    @staticmethod
+    def update(db: Session, file_id: str, **fields: Any) -> None:
+        """Store results (transcript, summary, items, errors) for an upload"""
+        for name in DirectUploadService.JSON_FIELDS:
+            if name in fields and fields[name] is not None:
+                fields[name] = json.dumps(jsonable_encoder(fields[name]))
+        db.query(DirectUpload).filter(DirectUpload.id == file_id).update(fields, synchronize_session=False)
+        db.commit()
+
+    @staticmethod
+    def to_dict(db_upload: DirectUpload) -> Dict[str, Any]:
+        """Convert an upload into a dict with its JSON fields decoded"""
+        return {
+            "file_id": db_upload.id,
+            "file_path": db_upload.file_path,
+            "original_filename": db_upload.original_filename,
+            "audio_sha256": db_upload.audio_sha256,
+            "transcript": db_upload.transcript,
+            "summary": db_upload.summary,
+            "action_items": json.loads(db_upload.action_items) if db_upload.action_items else None,
+            "decisions": json.loads(db_upload.decisions) if db_upload.decisions else None,
+            "transcription_error": db_upload.transcription_error,
+            "summary_error": db_upload.summary_error,
+            "expires_at": db_upload.expires_at
+        }
+
+    @staticmethod
+    def _active_ids(db: Session) -> List[str]:
+        # Direct upload jobs use the file ID as their job ID
+        rows = db.query(Job.id).filter(Job.status.in_([JobService.QUEUED, JobService.RUNNING])).all()
+        return [row.id for row in rows]
+
+    @staticmethod
+    def _delete(db: Session, uploads: List[DirectUpload]) -> int:
+        for db_upload in uploads:
+            audio_sha256 = db_upload.audio_sha256
+            db.delete(db_upload)
+            db.commit()
+            AudioBlobService.release(db, audio_sha256)
+        return len(uploads)
+
+    @staticmethod
+    def _evict(db: Session, keep: Optional[str] = None) -> int:
+        """Delete least recently used uploads until both limits are met"""
+        entries, total_bytes = db.query(
+            func.count(DirectUpload.id),
+            func.coalesce(func.sum(DirectUpload.size_bytes), 0)
+        ).one()
+        if entries <= settings.DIRECT_UPLOAD_MAX_ENTRIES and total_bytes <= settings.DIRECT_UPLOAD_MAX_BYTES:
+            return 0
+
+        protected = set(DirectUploadService._active_ids(db))
+        if keep:
+            protected.add(keep)
+        evicted = []
+        for db_upload in db.query(DirectUpload).order_by(DirectUpload.last_accessed_at.asc()).all():
+            if entries <= settings.DIRECT_UPLOAD_MAX_ENTRIES and total_bytes <= settings.DIRECT_UPLOAD_MAX_BYTES:
+                break
+            if db_upload.id in protected:
+                continue
+            evicted.append(db_upload)
+            entries -= 1
+            total_bytes -= db_upload.size_bytes
+        return DirectUploadService._delete(db, evicted)
+
+    @staticmethod
+    def sweep(db: Session) -> int:
+        """Delete expired uploads and their files, then enforce the size limits"""
+        expired = db.query(DirectUpload).filter(DirectUpload.expires_at <= datetime.utcnow()).all()
+        protected = set(DirectUploadService._active_ids(db))
+        deleted = DirectUploadService._delete(db, [db_upload for db_upload in expired if db_upload.id not in protected])
+        return deleted + DirectUploadService._evict(db)
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """Number and total size of stored direct uploads"""
+        db = SessionLocal()
+        try:
+            entries, total_bytes = db.query(
+                func.count(DirectUpload.id),
+                func.coalesce(func.sum(DirectUpload.size_bytes), 0)
+            ).one()
+        finally:
+            db.close()
+        return {
+            "entries": entries,
+            "total_bytes": total_bytes,
+            "max_entries": settings.DIRECT_UPLOAD_MAX_ENTRIES,
+            "max_bytes": settings.DIRECT_UPLOAD_MAX_BYTES
+        }
+
+    @classmethod
+    def start_sweeper(cls) -> None:
+        """Start the background thread that deletes expired uploads"""
+        if cls._sweeper is not None:
+            return
+        cls._stop_event.clear()
+        cls._sweeper = threading.Thread(target=cls._run_sweeper, name="direct-upload-sweeper", daemon=True)
+        cls._sweeper.start()
+
+    @classmethod
+    def stop_sweeper(cls, timeout: float = 5.0) -> None:
+        """Stop the sweeper thread"""
+        cls._stop_event.set()
+        if cls._sweeper is not None:
+            cls._sweeper.join(timeout=timeout)
+            cls._sweeper = None
+
+    @classmethod
+    def _run_sweeper(cls) -> None:
+        while not cls._stop_event.wait(settings.DIRECT_UPLOAD_SWEEP_INTERVAL):
+            db = SessionLocal()
+            try:
+                deleted = cls.sweep(db)
+                if deleted:
+                    print(f"Deleted {deleted} expired or evicted direct upload(s)")
+            except Exception as e:
+                db.rollback()
+                print(f"Direct upload sweeper error: {str(e)}")
+            finally:
+                db.close()
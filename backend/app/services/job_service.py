@@ -0,0 +1,163 @@
+from sqlalchemy.orm import Session
+from fastapi.encoders import jsonable_encoder
+from app.models.models import Job
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import json
+import os
+import uuid
+
+class JobService:
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    FINISHED_STATUSES = (COMPLETED, FAILED, CANCELLED)
+
+    @staticmethod
+    def create_job(db: Session, kind: str, payload: Dict[str, Any], job_id: Optional[str] = None) -> Job:
+        """Persist a new queued job"""
+        db_job = Job(
+            id=job_id or str(uuid.uuid4()),
+            kind=kind,
+            status=JobService.QUEUED,
+            payload=json.dumps(jsonable_encoder(payload))
+        )
+        db.add(db_job)
+        db.commit()
+        db.refresh(db_job)
+        return db_job
+
+    @staticmethod
+    def get_job(db: Session, job_id: str) -> Optional[Job]:
+        """Get a job by ID"""
+        return db.query(Job).filter(Job.id == job_id).first()
+
+    @staticmethod
+    def get_payload(job: Job) -> Dict[str, Any]:
+        """Decode the JSON payload of a job"""
+        return json.loads(job.payload) if job.payload else {}
+
+    @staticmethod
+    def serialize_job(job: Job) -> Dict[str, Any]:
+        """Convert a job into a response dict with its result decoded"""
+        return {
+            "id": job.id,
+            "kind": job.kind,
+            "status": job.status,
+            "progress": json.loads(job.progress) if job.progress else None,
+            "result": json.loads(job.result) if job.result else None,
+            "error": job.error,
+            "created_at": job.created_at,
+            "started_at": job.started_at,
+            "finished_at": job.finished_at
+        }
+
+    @staticmethod
+    def claim_next_job(db: Session) -> Optional[Job]:
+        """Atomically move the oldest queued job to running and return it"""
+        while True:
+            candidate = (
+                db.query(Job.id)
+                .filter(Job.status == JobService.QUEUED)
+                .order_by(Job.created_at.asc())
+                .first()
+            )
+            if not candidate:
+                return None
+
+            # The status guard makes the claim safe when several workers poll the same table
+            claimed = (
+                db.query(Job)
+                .filter(Job.id == candidate.id, Job.status == JobService.QUEUED)
+                .update(
+                    {"status": JobService.RUNNING, "started_at": datetime.utcnow(), "worker_pid": os.getpid()},
+                    synchronize_session=False
+                )
+            )
+            db.commit()
+            if claimed:
+                return JobService.get_job(db, candidate.id)
+
+    @staticmethod
+    def complete_job(db: Session, job_id: str, result: Optional[Dict[str, Any]]) -> None:
+        """Mark a job as completed and store its result"""
+        JobService._finish(db, job_id, JobService.COMPLETED, result=result)
+
+    @staticmethod
+    def fail_job(db: Session, job_id: str, error: str, result: Optional[Dict[str, Any]] = None) -> None:
+        """Mark a job as failed"""
+        JobService._finish(db, job_id, JobService.FAILED, result=result, error=error)
+
+    @staticmethod
+    def mark_cancelled(db: Session, job_id: str) -> None:
+        """Mark a job as cancelled"""
+        JobService._finish(db, job_id, JobService.CANCELLED, error="Process cancelled by user")
+
+    @staticmethod
+    def _finish(db: Session, job_id: str, status: str, result: Optional[Dict[str, Any]] = None, error: Optional[str] = None) -> None:
+        db_job = JobService.get_job(db, job_id)
+        if not db_job:
+            return
+        db_job.status = status
+        if result is not None:
+            db_job.result = json.dumps(jsonable_encoder(result))
+        db_job.error = error
+        db_job.finished_at = datetime.utcnow()
+        db.commit()
+
+    @staticmethod
+    def update_progress(db: Session, job_id: str, progress: Dict[str, Any]) -> None:
+        """Persist the latest progress of a running job"""
+        db.query(Job).filter(Job.id == job_id).update(
+            {"progress": json.dumps(jsonable_encoder(progress))}, synchronize_session=False
+        )
+        db.commit()
+
+    @staticmethod
+    def cancel_job(db: Session, job_id: str) -> bool:
+        """Request cancellation of a queued or running job"""
+        db_job = JobService.get_job(db, job_id)
+        if not db_job or db_job.status in JobService.FINISHED_STATUSES:
+            return False
+
+        db_job.cancel_requested = True
+        if db_job.status == JobService.QUEUED:
+            db_job.status = JobService.CANCELLED
+            db_job.error = "Process cancelled by user"
+            db_job.finished_at = datetime.utcnow()
+        db.commit()
+        return True
+
+    @staticmethod
+    def get_cancel_requested_ids(db: Session, job_ids: List[str]) -> List[str]:
+        """Return the subset of the given jobs that have a pending cancellation request"""
+        if not job_ids:
+            return []
+        rows = (
+            db.query(Job.id)
+            .filter(Job.id.in_(job_ids), Job.cancel_requested == True)
+            .all()
+        )
+        return [row.id for row in rows]
+
+    @staticmethod
+    def requeue_interrupted_jobs(db: Session, worker_pid: Optional[int] = None) -> int:
+        """Put jobs left running by a previous process (or by the worker ``worker_pid``) back on the queue"""
+        query = db.query(Job).filter(Job.status == JobService.RUNNING)
+        if worker_pid is not None:
+            query = query.filter(Job.worker_pid == worker_pid)
+        count = query.update(
+            {"status": JobService.QUEUED, "started_at": None, "worker_pid": None},
+            synchronize_session=False
+        )
+        db.commit()
+        return count
+
+    @staticmethod
+    def get_queued_job_ids(db: Session) -> List[str]:
+        """Get the IDs of all jobs waiting to run"""
+        rows = db.query(Job.id).filter(Job.status == JobService.QUEUED).all()
+        return [row.id for row in rows]
@@ -1,25 +1,110 @@
-from sqlalchemy.orm import Session
-from app.models.models import Meeting
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+from app.models.models import AudioBlob, Meeting, MeetingParticipant
+from app.core.pagination import Keyset
 from app.schemas.schemas import MeetingCreate, MeetingUpdate
+from app.services.audio_blob_service import AudioBlobService
 from datetime import datetime
-from typing import Optional
-import json
+from typing import List, Optional, Sequence, Tuple
+
+# Relationships a meeting can be returned with, via ?expand= on the meeting routes
+EXPANDABLE_RELATIONSHIPS = ("action_items", "decisions")
 
 class MeetingService:
+    """Meeting CRUD.
+
+    The ``*_async`` methods take an AsyncSession and are used by the API
+    routes; the sync methods are used by job workers and scripts.
+    """
     @staticmethod
-    def create_meeting(db: Session, meeting: MeetingCreate):
+    def _new_meeting(meeting: MeetingCreate) -> Meeting:
         # Explicitly pick fields that exist in the Meeting SQLAlchemy model
         meeting_model_data = {
             "title": meeting.title,
             "description": meeting.description,
             "date": meeting.date,
             "duration": meeting.duration,
-            "status": meeting.status
+            "status": meeting.status,
+            "participants": meeting.participants or None
         }
-        if meeting.participants:
-            meeting_model_data['participants'] = json.dumps(meeting.participants)
-        
         db_meeting = Meeting(**meeting_model_data)
+        MeetingService._set_participant_rows(db_meeting, meeting.participants)
+        return db_meeting
+    
+    @staticmethod
+    def _normalize_participant(participant: str) -> str:
+        return participant.strip().lower()
+    
+    @staticmethod
+    def _set_participant_rows(db_meeting: Meeting, participants: Optional[List[str]]) -> None:
+        """Make the meeting_participants rows match ``participants``, keeping rows that did not change"""
+        names = dict.fromkeys(MeetingService._normalize_participant(p) for p in participants or [])
+        names.pop("", None)
+        current = {row.participant: row for row in db_meeting.participant_rows}
+        db_meeting.participant_rows = [current.get(name) or MeetingParticipant(participant=name) for name in names]
+    
+    @staticmethod
+    def parse_expand(expand: Optional[str]) -> List[str]:
+        """Relationship names from a comma-separated ?expand= value; ValueError for unknown names"""
+        if not expand:
+            return []
+        names = list(dict.fromkeys(name.strip() for name in expand.split(",") if name.strip()))
+        unknown = [name for name in names if name not in EXPANDABLE_RELATIONSHIPS]
+        if unknown:
+            raise ValueError(
+                f"Cannot expand {', '.join(unknown)}; expected any of {', '.join(EXPANDABLE_RELATIONSHIPS)}"
+            )
+        return names
+    
+    @staticmethod
+    def _expand_options(expand: Sequence[str]) -> list:
+        # selectinload fetches a relationship for every loaded meeting with one IN query,
+        # so a page of meetings costs one query per expanded relationship rather than one per meeting
+        return [selectinload(getattr(Meeting, name)) for name in expand]
+    
+    @staticmethod
+    def _filtered_query(
+        query,
+        status: Optional[str],
+        date_from: Optional[datetime],
+        date_to: Optional[datetime],
+        participant: Optional[str] = None
+    ):
+        # Apply filters if provided
+        if participant:
+            # Answered from the participant index of meeting_participants rather than by decoding participants
+            query = query.filter(Meeting.id.in_(
+                select(MeetingParticipant.meeting_id).where(
+                    MeetingParticipant.participant == MeetingService._normalize_participant(participant)
+                )
+            ))
+        if status:
+            query = query.filter(Meeting.status == status)
+        if date_from:
+            query = query.filter(Meeting.date >= date_from)
+        if date_to:
+            query = query.filter(Meeting.date <= date_to)
+        return query
+    
+    @staticmethod
+    def _apply_update(db_meeting: Meeting, meeting_update: MeetingUpdate) -> None:
+        # Get update data, excluding unset fields
+        update_data = meeting_update.dict(exclude_unset=True)
+        
+        if 'participants' in update_data:
+            MeetingService._set_participant_rows(db_meeting, update_data['participants'])
+        
+        # Update each field if it's provided
+        for field, value in update_data.items():
+            setattr(db_meeting, field, value)
+        
+        # Update the updated_at timestamp
+        db_meeting.updated_at = datetime.utcnow()
+    
+    @staticmethod
+    def create_meeting(db: Session, meeting: MeetingCreate):
+        db_meeting = MeetingService._new_meeting(meeting)
         db.add(db_meeting)
         db.commit()
         db.refresh(db_meeting)
@@ -27,16 +112,7 @@ class MeetingService:
     
     @staticmethod
     def get_meeting(db: Session, meeting_id: int):
-        db_meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
-        
-        # Convert participants from JSON string back to list if present
-        if db_meeting and db_meeting.participants:
-            try:
-                db_meeting.participants = json.loads(db_meeting.participants)
-            except:
-                db_meeting.participants = []
-                
-        return db_meeting
+        return db.query(Meeting).filter(Meeting.id == meeting_id).first()
     
     @staticmethod
     def get_meetings(
@@ -45,67 +121,118 @@ class MeetingService:
         limit: int = 100,
         status: Optional[str] = None,
         date_from: Optional[datetime] = None,
-        date_to: Optional[datetime] = None
+        date_to: Optional[datetime] = None,
+        participant: Optional[str] = None
     ):
-        query = db.query(Meeting)
-        
-        # Apply filters if provided
-        if status:
-            query = query.filter(Meeting.status == status)
-        if date_from:
-            query = query.filter(Meeting.date >= date_from)
-        if date_to:
-            query = query.filter(Meeting.date <= date_to)
+        query = MeetingService._filtered_query(db.query(Meeting), status, date_from, date_to, participant)
         
         # Apply pagination and order by date if available, otherwise by created_at
         query = query.order_by(Meeting.created_at.desc())
-        meetings = query.offset(skip).limit(limit).all()
-        
-        # Convert participants from JSON string back to list for each meeting
-        for meeting in meetings:
-            if meeting.participants:
-                try:
-                    meeting.participants = json.loads(meeting.participants)
-                except:
-                    meeting.participants = []
-        
-        return meetings
+        return query.offset(skip).limit(limit).all()
     
     @staticmethod
     def update_meeting(db: Session, meeting_id: int, meeting_update: MeetingUpdate):
         db_meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
         if db_meeting:
-            # Get update data, excluding unset fields
-            update_data = meeting_update.dict(exclude_unset=True)
-            
-            # Convert participants list to JSON string if present
-            if 'participants' in update_data and update_data['participants'] is not None:
-                update_data['participants'] = json.dumps(update_data['participants'])
-            
-            # Update each field if it's provided
-            for field, value in update_data.items():
-                setattr(db_meeting, field, value)
-            
-            # Update the updated_at timestamp
-            db_meeting.updated_at = datetime.utcnow()
-            
+            MeetingService._apply_update(db_meeting, meeting_update)
             db.commit()
             db.refresh(db_meeting)
-            
-            # Convert participants back to a list for the returned object
-            if db_meeting.participants:
-                try:
-                    db_meeting.participants = json.loads(db_meeting.participants)
-                except:
-                    db_meeting.participants = []
         
         return db_meeting
     
+    @staticmethod
+    def attach_audio(db: Session, meeting_id: int, blob: AudioBlob):
+        """Point a meeting at an audio blob, releasing the blob it referenced before"""
+        previous_sha256 = db.query(Meeting.audio_sha256).filter(Meeting.id == meeting_id).scalar()
+        db.query(Meeting).filter(Meeting.id == meeting_id).update(
+            {
+                Meeting.audio_file_path: blob.path,
+                Meeting.audio_sha256: blob.sha256,
+                Meeting.updated_at: datetime.utcnow()
+            },
+            synchronize_session=False
+        )
+        db.commit()
+        AudioBlobService.release(db, previous_sha256)
+    
     @staticmethod
     def delete_meeting(db: Session, meeting_id: int):
         db_meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
         if db_meeting:
+            audio_sha256 = db_meeting.audio_sha256
             db.delete(db_meeting)
             db.commit()
+            # Deletes the audio file when no other meeting or upload shares the recording
+            AudioBlobService.release(db, audio_sha256)
+            return True
+        return False 
+    
+    @staticmethod
+    async def create_meeting_async(db: AsyncSession, meeting: MeetingCreate):
+        db_meeting = MeetingService._new_meeting(meeting)
+        db.add(db_meeting)
+        await db.commit()
+        await db.refresh(db_meeting)
+        return db_meeting
+    
+    @staticmethod
+    async def get_meeting_async(db: AsyncSession, meeting_id: int, expand: Sequence[str] = ()):
+        return await db.get(Meeting, meeting_id, options=MeetingService._expand_options(expand))
+    
+    @staticmethod
+    def _page_query(
+        dialect_name: str,
+        after: Optional[str] = None,
+        limit: int = 100,
+        status: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        participant: Optional[str] = None,
+        expand: Sequence[str] = ()
+    ):
+        query = MeetingService._filtered_query(select(Meeting), status, date_from, date_to, participant)
+        query = query.options(*MeetingService._expand_options(expand))
+        return Keyset.page_query(query, Meeting, dialect_name, after, limit)
+    
+    @staticmethod
+    async def get_meetings_async(
+        db: AsyncSession,
+        after: Optional[str] = None,
+        limit: int = 100,
+        status: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        participant: Optional[str] = None,
+        expand: Sequence[str] = ()
+    ) -> Tuple[List[Meeting], Optional[str]]:
+        """A page of meetings, newest first, and the cursor of the next page (None on the last)"""
+        query = MeetingService._page_query(
+            db.bind.dialect.name, after, limit, status, date_from, date_to, participant, expand
+        )
+        return Keyset.page((await db.execute(query)).all(), limit)
+    
+    @staticmethod
+    async def update_meeting_async(db: AsyncSession, meeting_id: int, meeting_update: MeetingUpdate):
+        # participant_rows is loaded up front: replacing it cannot lazy load on an AsyncSession
+        db_meeting = await db.get(Meeting, meeting_id, options=[selectinload(Meeting.participant_rows)])
+        if db_meeting:
+            MeetingService._apply_update(db_meeting, meeting_update)
+            await db.commit()
+            await db.refresh(db_meeting)
+        return db_meeting
+    
+    @staticmethod
+    async def attach_audio_async(db: AsyncSession, meeting_id: int, blob: AudioBlob):
+        await db.run_sync(MeetingService.attach_audio, meeting_id, blob)
+    
+    @staticmethod
+    async def delete_meeting_async(db: AsyncSession, meeting_id: int):
+        db_meeting = await db.get(Meeting, meeting_id)
+        if db_meeting:
+            audio_sha256 = db_meeting.audio_sha256
+            await db.delete(db_meeting)
+            await db.commit()
+            # Deletes the audio file when no other meeting or upload shares the recording
+            await db.run_sync(AudioBlobService.release, audio_sha256)
             return True
-        return False 
\ No newline at end of file
+        return False
@@ -0,0 +1,99 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.search_index import POSTGRESQL_TEXT_SEARCH_CONFIG, SEARCH_SOURCES, fts_table, tsvector_expression
+from typing import Any, Dict, List
+import re
+
+# Largest number of results a search returns
+MAX_SEARCH_RESULTS = 100
+
+# Result type, and for each searchable table the expressions for the meeting and title of a row
+RESULT_TYPES = {
+    "meetings": ("meeting", "src.id", "src.title"),
+    "action_items": ("action_item", "src.meeting_id", "src.title"),
+    "decisions": ("decision", "src.meeting_id", "src.title")
+}
+# bm25 weight of each column in SEARCH_SOURCES: titles count most, then descriptions and summaries
+SQLITE_COLUMN_WEIGHTS = {
+    "meetings": [4.0, 2.0, 1.0, 2.0],
+    "action_items": [4.0, 2.0, 1.0],
+    "decisions": [4.0, 2.0, 1.0, 1.0]
+}
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+# Approximate length of a snippet in words
+SNIPPET_WORDS = 16
+
+class SearchService:
+    """Ranked full-text search over meetings, action items and decisions.
+
+    Uses the indexes from ``app.models.search_index``: FTS5 with bm25
+    ranking on SQLite, tsvector with ts_rank_cd on PostgreSQL. Each table
+    contributes at most ``limit`` best matches before they are merged, so
+    the cost depends on the number of matches, not the size of the tables.
+    """
+
+    @staticmethod
+    def _terms(query: str) -> List[str]:
+        terms = re.findall(r"\w+", query)
+        if not terms:
+            raise ValueError("Search query must contain at least one word")
+        return terms
+
+    @staticmethod
+    def _sqlite_match(terms: List[str]) -> str:
+        # Every word quoted, so input is never parsed as FTS5 query syntax; all words must match
+        return " ".join(f'"{term}"' for term in terms)
+
+    @staticmethod
+    def _sqlite_query() -> str:
+        branches = []
+        for table, (result_type, meeting_id, title) in RESULT_TYPES.items():
+            fts = fts_table(table)
+            weights = ", ".join(str(weight) for weight in SQLITE_COLUMN_WEIGHTS[table])
+            # The best rows are picked first, so snippets are only built for them and not for every match
+            best = f"SELECT rowid FROM {fts} WHERE {fts} MATCH :match ORDER BY bm25({fts}, {weights}) LIMIT :limit"
+            branches.append(
+                f"SELECT '{result_type}' AS type, src.id AS id, {meeting_id} AS meeting_id, "
+                f"{title} AS title, "
+                f"snippet({fts}, -1, '{HIGHLIGHT_START}', '{HIGHLIGHT_END}', '…', {SNIPPET_WORDS}) AS snippet, "
+                f"-bm25({fts}, {weights}) AS score "
+                f"FROM {fts} JOIN {table} AS src ON src.id = {fts}.rowid "
+                f"WHERE {fts} MATCH :match AND {fts}.rowid IN ({best})"
+            )
+        return " UNION ALL ".join(branches) + " ORDER BY score DESC LIMIT :limit"
+
+    @staticmethod
+    def _postgresql_query() -> str:
+        tsquery = f"plainto_tsquery('{POSTGRESQL_TEXT_SEARCH_CONFIG}', :query)"
+        branches = []
+        for table, (result_type, meeting_id, title) in RESULT_TYPES.items():
+            document = ", ".join(f"src.{column}" for column in SEARCH_SOURCES[table])
+            # The tsvector expression is written exactly as indexed, unqualified, so the GIN index is used
+            branches.append(
+                f"(SELECT '{result_type}' AS type, src.id AS id, {meeting_id} AS meeting_id, {title} AS title, "
+                f"concat_ws(' ', {document}) AS document, "
+                f"ts_rank_cd({tsvector_expression(table)}, {tsquery}) AS score "
+                f"FROM {table} AS src WHERE {tsvector_expression(table)} @@ {tsquery} "
+                f"ORDER BY score DESC LIMIT :limit)"
+            )
+        options = f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_END}, MaxWords={SNIPPET_WORDS}, MinWords={SNIPPET_WORDS // 2}"
+        # Headlines are only built for the results that are returned
+        return (
+            f"SELECT type, id, meeting_id, title, "
+            f"ts_headline('{POSTGRESQL_TEXT_SEARCH_CONFIG}', document, {tsquery}, '{options}') AS snippet, score "
+            f"FROM ({' UNION ALL '.join(branches)}) AS matches ORDER BY score DESC LIMIT :limit"
+        )
+
+    @staticmethod
+    async def search_async(db: AsyncSession, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Best matches for ``query``, most relevant first; ValueError if it has no words"""
+        terms = SearchService._terms(query)
+        if db.bind.dialect.name == "sqlite":
+            statement = text(SearchService._sqlite_query())
+            params = {"match": SearchService._sqlite_match(terms), "limit": limit}
+        else:
+            statement = text(SearchService._postgresql_query())
+            params = {"query": " ".join(terms), "limit": limit}
+        result = await db.execute(statement, params)
+        return [dict(row) for row in result.mappings()]
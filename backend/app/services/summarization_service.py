@@ -1,33 +1,376 @@
-from transformers import pipeline
+from app.core.config import settings
+from app.core.inference import InferenceExecutor
+from app.core.model_registry import ModelRegistry
+from app.core.batching import MicroBatcher
+from app.services.summary_cache_service import SummaryCacheService
+from typing import Any, Dict, Iterator, List, Optional
+from datetime import datetime
+import functools
 import os
+import re
+import threading
 
 class SummarizationService:
-    _summarizer = pipeline("summarization", model="facebook/bart-large-cnn")
-    _extractor = pipeline("text2text-generation", model="google/flan-t5-base")
+    _batchers: Dict[str, MicroBatcher] = {}
+    _batchers_lock = threading.Lock()
+
+    SUMMARY_MAX_LENGTH = 130
+    SUMMARY_MIN_LENGTH = 30
+    EXTRACTION_PROMPT = (
+        "Extract every action item and every decision from the following meeting transcript. "
+        "Write one item per line using exactly these formats:\n"
+        "ACTION: <task> | <person responsible> | <due date as YYYY-MM-DD or none>\n"
+        "DECISION: <decision> | <person who decided> | <reason>\n\n"
+        "{transcript}\n\nItems:"
+    )
+    EXTRACTION_LINE_PATTERN = re.compile(
+        r"\b(ACTION|DECISION)\s*:\s*(.*?)(?=\b(?:ACTION|DECISION)\s*:|$)",
+        re.IGNORECASE | re.DOTALL
+    )
+
+    PRECISIONS = ("fp32", "int8", "bf16")
+    # Fixed input for comparing reduced-precision output with fp32 when a model loads
+    SELF_CHECK_TRANSCRIPT = (
+        "Alice: Thanks for joining. The main topic today is the launch date for the mobile app. "
+        "Bob: Testing found two crash bugs in the payment screen, so I think we need another week. "
+        "Alice: Agreed, we will move the launch from March 3rd to March 10th. "
+        "Carol: I will update the release notes and tell the marketing team about the new date. "
+        "Bob: I will fix both crash bugs by Friday and ask QA to run the full regression suite again."
+    )
+    _precision_checks: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def _load_summarizer():
+        """Build the BART summarization pipeline"""
+        from transformers import pipeline
+        summarizer = pipeline("summarization", model=settings.SUMMARIZATION_MODEL)
+        return SummarizationService._apply_precision(
+            "summarizer",
+            summarizer,
+            SummarizationService.SELF_CHECK_TRANSCRIPT,
+            max_length=SummarizationService.SUMMARY_MAX_LENGTH,
+            min_length=SummarizationService.SUMMARY_MIN_LENGTH,
+            do_sample=False
+        )
+
+    @staticmethod
+    def _load_extractor():
+        """Build the flan-t5 extraction pipeline"""
+        from transformers import pipeline
+        extractor = pipeline("text2text-generation", model=settings.EXTRACTION_MODEL)
+        return SummarizationService._apply_precision(
+            "extractor",
+            extractor,
+            SummarizationService.EXTRACTION_PROMPT.format(transcript=SummarizationService.SELF_CHECK_TRANSCRIPT),
+            max_length=256,
+            do_sample=False
+        )
+
+    @staticmethod
+    def _bf16_supported() -> bool:
+        import torch
+        # Without native bf16 instructions the CPU emulates it, which is slower than fp32
+        check = getattr(torch.ops.mkldnn, "_is_mkldnn_bf16_supported", None)
+        return bool(check and check())
+
+    @staticmethod
+    def _generate(pipe, text: str, **params) -> str:
+        output = pipe(text, **params)[0]
+        return output.get("summary_text", output.get("generated_text", ""))
+
+    @staticmethod
+    def _token_f1(reference: str, candidate: str) -> float:
+        """Token-overlap F1 between two outputs; 1.0 means the same words"""
+        reference_tokens = reference.lower().split()
+        candidate_tokens = candidate.lower().split()
+        if not reference_tokens or not candidate_tokens:
+            return float(reference_tokens == candidate_tokens)
+        remaining = list(reference_tokens)
+        common = 0
+        for token in candidate_tokens:
+            if token in remaining:
+                remaining.remove(token)
+                common += 1
+        if not common:
+            return 0.0
+        precision = common / len(candidate_tokens)
+        recall = common / len(reference_tokens)
+        return 2 * precision * recall / (precision + recall)
+
+    @staticmethod
+    def _apply_precision(name: str, pipe, sample: str, **params):
+        """Convert a CPU pipeline's model to SUMMARIZATION_PRECISION.
+
+        ``int8`` applies dynamic int8 quantization to the Linear layers and
+        ``bf16`` casts the weights to bfloat16 when the CPU supports it. With
+        PRECISION_SELF_CHECK, the converted model's output on a fixed sample is
+        compared with fp32; if their token-overlap F1 is below
+        PRECISION_SELF_CHECK_MIN_SCORE the fp32 model is kept.
+        """
+        precision = settings.SUMMARIZATION_PRECISION
+        if precision not in SummarizationService.PRECISIONS:
+            raise ValueError(f"Unknown SUMMARIZATION_PRECISION '{precision}'. Use one of: {', '.join(SummarizationService.PRECISIONS)}")
+        if precision == "fp32" or pipe.device.type != "cpu":
+            return pipe
+        
+        import copy
+        import time
+        import torch
+        
+        if precision == "bf16" and not SummarizationService._bf16_supported():
+            print(f"bf16 is not supported on this CPU; keeping {name} in fp32")
+            return pipe
+        
+        fp32_model = pipe.model
+        if precision == "int8":
+            converted = torch.quantization.quantize_dynamic(fp32_model, {torch.nn.Linear}, dtype=torch.qint8)
+        else:
+            converted = copy.deepcopy(fp32_model).to(torch.bfloat16)
+        
+        if settings.PRECISION_SELF_CHECK:
+            started = time.perf_counter()
+            reference = SummarizationService._generate(pipe, sample, **params)
+            fp32_seconds = time.perf_counter() - started
+            
+            pipe.model = converted
+            started = time.perf_counter()
+            candidate = SummarizationService._generate(pipe, sample, **params)
+            converted_seconds = time.perf_counter() - started
+            
+            score = SummarizationService._token_f1(reference, candidate)
+            passed = score >= settings.PRECISION_SELF_CHECK_MIN_SCORE
+            SummarizationService._precision_checks[name] = {
+                "precision": precision,
+                "score": round(score, 3),
+                "passed": passed,
+                "fp32_seconds": round(fp32_seconds, 2),
+                f"{precision}_seconds": round(converted_seconds, 2)
+            }
+            if not passed:
+                print(
+                    f"{precision} self-check failed for {name} (token F1 {score:.2f} < "
+                    f"{settings.PRECISION_SELF_CHECK_MIN_SCORE}); keeping fp32"
+                )
+                pipe.model = fp32_model
+                return pipe
+            print(f"{precision} self-check passed for {name} (token F1 {score:.2f})")
+        
+        pipe.model = converted
+        return pipe
+
+    @staticmethod
+    def precision_checks() -> Dict[str, Dict[str, Any]]:
+        """Outcome of the precision self-check of each loaded model"""
+        return dict(SummarizationService._precision_checks)
+
+    @staticmethod
+    def _iter_chunks(text: str, tokenizer, chunk_tokens: int, overlap: int) -> Iterator[str]:
+        """Yield overlapping windows of ``text`` that each fit in ``chunk_tokens`` model tokens"""
+        token_ids = tokenizer.encode(text, add_special_tokens=False)
+        step = max(1, chunk_tokens - overlap)
+        for start in range(0, len(token_ids), step):
+            yield tokenizer.decode(token_ids[start:start + chunk_tokens], skip_special_tokens=True)
+            if start + chunk_tokens >= len(token_ids):
+                break
+
+    @staticmethod
+    def _run_pipeline(model: str, inputs: List[str], **params) -> List[Dict[str, Any]]:
+        """Run one padded batch through a pipeline on its inference pool"""
+        return InferenceExecutor.call(
+            model, ModelRegistry.get(model), inputs, batch_size=len(inputs), **params
+        )
+
+    @staticmethod
+    def _get_batcher(model: str) -> MicroBatcher:
+        """Shared batcher that merges concurrent requests to ``model`` into one batch"""
+        with SummarizationService._batchers_lock:
+            if model not in SummarizationService._batchers:
+                if model == "summarizer":
+                    max_batch_size = settings.SUMMARY_BATCH_SIZE
+                    dispatchers = settings.SUMMARIZER_MAX_CONCURRENCY
+                else:
+                    max_batch_size = settings.EXTRACTION_BATCH_SIZE
+                    dispatchers = settings.EXTRACTOR_MAX_CONCURRENCY
+                SummarizationService._batchers[model] = MicroBatcher(
+                    model,
+                    functools.partial(SummarizationService._run_pipeline, model),
+                    max_batch_size=max_batch_size,
+                    max_wait_ms=settings.BATCH_WINDOW_MS,
+                    dispatchers=dispatchers
+                )
+            return SummarizationService._batchers[model]
+
+    @staticmethod
+    def batching_stats() -> Dict[str, Dict[str, Any]]:
+        """Fill rate and queueing delay of each batcher"""
+        return {model: batcher.stats() for model, batcher in SummarizationService._batchers.items()}
+
+    @staticmethod
+    def _summarize_batch(chunks: List[str]) -> List[str]:
+        batcher = SummarizationService._get_batcher("summarizer")
+        futures = [
+            batcher.submit(
+                chunk,
+                max_length=SummarizationService.SUMMARY_MAX_LENGTH,
+                min_length=SummarizationService.SUMMARY_MIN_LENGTH,
+                do_sample=False,
+                truncation=True
+            )
+            for chunk in chunks
+        ]
+        outputs = batcher.wait(futures, timeout=settings.BATCH_RESULT_TIMEOUT_SECONDS)
+        return [output['summary_text'] for output in outputs]
 
     @staticmethod
     def summarize_text(text: str) -> str:
+        """Summarize text of any length, reusing the cached summary of an unchanged transcript"""
         if not text or not text.strip():
             return ""
-        summary = SummarizationService._summarizer(text, max_length=130, min_length=30, do_sample=False)
-        return summary[0]['summary_text']
+        params = {
+            "chunk_tokens": settings.SUMMARY_CHUNK_TOKENS,
+            "chunk_overlap": settings.SUMMARY_CHUNK_OVERLAP,
+            "max_length": SummarizationService.SUMMARY_MAX_LENGTH,
+            "min_length": SummarizationService.SUMMARY_MIN_LENGTH,
+            "precision": settings.SUMMARIZATION_PRECISION
+        }
+        return SummaryCacheService.get_or_compute(
+            "summary", text, settings.SUMMARIZATION_MODEL, params,
+            lambda: SummarizationService._summarize_uncached(text)
+        )
 
     @staticmethod
-    def extract_action_items(text: str):
-        prompt = (
-            "Extract all action items from the following meeting transcript. "
-            "List each action item as a bullet point:\n\n"
-            f"{text}\n\nAction Items:"
+    def _summarize_uncached(text: str) -> str:
+        """Summarize text of any length.
+
+        Text that fits in one chunk is summarized directly. Longer text is
+        split into overlapping token windows that are summarized in batches
+        (map), and the joined partial summaries are summarized again until a
+        single summary remains (reduce). Only one batch of chunks is in
+        flight at a time, so model memory does not grow with meeting length.
+        If a pass fails to shorten the text, only its first chunk is
+        summarized, so the reduce always ends.
+        """
+        tokenizer = ModelRegistry.get("summarizer").tokenizer
+        # Leave room for special tokens and make sure every level actually shrinks the text
+        chunk_tokens = min(settings.SUMMARY_CHUNK_TOKENS, tokenizer.model_max_length - 2)
+        chunk_tokens = max(chunk_tokens, 2 * SummarizationService.SUMMARY_MAX_LENGTH)
+        # Each window advances by at least 3/4 of a chunk, so summaries of at most half a chunk shrink the text
+        overlap = min(settings.SUMMARY_CHUNK_OVERLAP, chunk_tokens // 4)
+        batch_size = max(1, settings.SUMMARY_BATCH_SIZE)
+        text_tokens = len(tokenizer.encode(text, add_special_tokens=False))
+        
+        while True:
+            partial_summaries = []
+            batch = []
+            for chunk in SummarizationService._iter_chunks(text, tokenizer, chunk_tokens, overlap):
+                batch.append(chunk)
+                if len(batch) == batch_size:
+                    partial_summaries.extend(SummarizationService._summarize_batch(batch))
+                    batch = []
+            if batch:
+                partial_summaries.extend(SummarizationService._summarize_batch(batch))
+            
+            if len(partial_summaries) <= 1:
+                return partial_summaries[0] if partial_summaries else ""
+            text = " ".join(partial_summaries)
+            reduced_tokens = len(tokenizer.encode(text, add_special_tokens=False))
+            if reduced_tokens >= text_tokens:
+                first_chunk = next(SummarizationService._iter_chunks(text, tokenizer, chunk_tokens, overlap))
+                return SummarizationService._summarize_batch([first_chunk])[0]
+            text_tokens = reduced_tokens
+
+    @staticmethod
+    def _parse_extraction(output: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Parse ``ACTION:``/``DECISION:`` lines into ActionItemCreate/DecisionCreate fields"""
+        items = {"action_items": [], "decisions": []}
+        for match in SummarizationService.EXTRACTION_LINE_PATTERN.finditer(output):
+            fields = [field.strip(" -*\n") for field in match.group(2).split("|")]
+            fields += [""] * (3 - len(fields))
+            text = fields[0]
+            if not text:
+                continue
+            if match.group(1).upper() == "ACTION":
+                items["action_items"].append({
+                    "title": text[:255],
+                    "description": text,
+                    "assignee": fields[1][:255],
+                    "due_date": SummarizationService._parse_due_date(fields[2])
+                })
+            else:
+                items["decisions"].append({
+                    "title": text[:255],
+                    "description": text,
+                    "decision_maker": fields[1][:255],
+                    "rationale": fields[2]
+                })
+        return items
+
+    @staticmethod
+    def _parse_due_date(value: str) -> Optional[str]:
+        try:
+            return datetime.fromisoformat(value).isoformat()
+        except ValueError:
+            return None
+
+    @staticmethod
+    def extract_meeting_items(text: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Extract action items and decisions, reusing the cached result for an unchanged transcript"""
+        if not text or not text.strip():
+            return {"action_items": [], "decisions": []}
+        params = {
+            "prompt": SummarizationService.EXTRACTION_PROMPT,
+            "chunk_tokens": settings.EXTRACTION_CHUNK_TOKENS,
+            "chunk_overlap": settings.EXTRACTION_CHUNK_OVERLAP,
+            "max_length": 256,
+            "precision": settings.SUMMARIZATION_PRECISION
+        }
+        return SummaryCacheService.get_or_compute(
+            "meeting_items", text, settings.EXTRACTION_MODEL, params,
+            lambda: SummarizationService._extract_uncached(text)
         )
-        result = SummarizationService._extractor(prompt, max_length=256, do_sample=False)
-        return result[0]['generated_text']
 
     @staticmethod
-    def extract_decisions(text: str):
-        prompt = (
-            "Extract all decisions made in the following meeting transcript. "
-            "List each decision as a bullet point:\n\n"
-            f"{text}\n\nDecisions:"
+    def _extract_uncached(text: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Extract action items and decisions together in one pass over the transcript.
+
+        Each chunk of the transcript is sent to the extractor once with a
+        prompt asking for both kinds of item; items repeated in the overlap
+        between chunks are dropped.
+        """
+        items = {"action_items": [], "decisions": []}
+        tokenizer = ModelRegistry.get("extractor").tokenizer
+        batch_size = max(1, settings.EXTRACTION_BATCH_SIZE)
+        chunks = SummarizationService._iter_chunks(
+            text, tokenizer, settings.EXTRACTION_CHUNK_TOKENS, settings.EXTRACTION_CHUNK_OVERLAP
         )
-        result = SummarizationService._extractor(prompt, max_length=256, do_sample=False)
-        return result[0]['generated_text'] 
\ No newline at end of file
+        
+        seen = set()
+        batch = []
+        for chunk in chunks:
+            batch.append(SummarizationService.EXTRACTION_PROMPT.format(transcript=chunk))
+            if len(batch) < batch_size:
+                continue
+            SummarizationService._collect_items(batch, items, seen)
+            batch = []
+        if batch:
+            SummarizationService._collect_items(batch, items, seen)
+        return items
+
+    @staticmethod
+    def _collect_items(prompts: List[str], items: Dict[str, List[Dict[str, Any]]], seen: set) -> None:
+        batcher = SummarizationService._get_batcher("extractor")
+        futures = [
+            batcher.submit(prompt, max_length=256, do_sample=False, truncation=True)
+            for prompt in prompts
+        ]
+        for output in batcher.wait(futures, timeout=settings.BATCH_RESULT_TIMEOUT_SECONDS):
+            parsed = SummarizationService._parse_extraction(output['generated_text'])
+            for kind, kind_items in parsed.items():
+                for item in kind_items:
+                    key = (kind, item["title"].lower())
+                    if key not in seen:
+                        seen.add(key)
+                        items[kind].append(item)
+
+ModelRegistry.register("summarizer", SummarizationService._load_summarizer)
+ModelRegistry.register("extractor", SummarizationService._load_extractor)
@@ -0,0 +1,147 @@
+from sqlalchemy import func
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.models import SummaryCacheEntry
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+import copy
+import hashlib
+import json
+import threading
+
+class SummaryCacheService:
+    """Two-tier cache for summarization and extraction results.
+
+    Results are keyed by the SHA-256 of the transcript, the model id and the
+    generation parameters. An in-memory LRU answers repeat calls in this
+    process; the ``summary_cache`` table keeps results across restarts and
+    worker processes.
+    """
+    _memory: "OrderedDict[str, Any]" = OrderedDict()
+    _memory_hits = 0
+    _disk_hits = 0
+    _misses = 0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def make_key(kind: str, text: str, model: str, params: Dict[str, Any]) -> str:
+        text_digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        material = json.dumps([kind, text_digest, model, params], sort_keys=True)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def _remember(cls, key: str, value: Any) -> None:
+        with cls._lock:
+            cls._memory[key] = value
+            cls._memory.move_to_end(key)
+            while len(cls._memory) > settings.SUMMARY_CACHE_MEMORY_ENTRIES:
+                cls._memory.popitem(last=False)
+
+    @classmethod
+    def get(cls, key: str) -> Optional[Any]:
+        """Look a result up in memory, then in the database"""
+        with cls._lock:
+            if key in cls._memory:
+                cls._memory.move_to_end(key)
+                cls._memory_hits += 1
+                return copy.deepcopy(cls._memory[key])
+
+        db = SessionLocal()
+        try:
+            entry = db.query(SummaryCacheEntry).filter(SummaryCacheEntry.key == key).first()
+            if entry is None:
+                with cls._lock:
+                    cls._misses += 1
+                return None
+            entry.last_accessed_at = datetime.utcnow()
+            db.commit()
+            value = json.loads(entry.value)
+        finally:
+            db.close()
+
+        with cls._lock:
+            cls._disk_hits += 1
+        cls._remember(key, value)
+        return copy.deepcopy(value)
+
+    @classmethod
+    def put(cls, key: str, kind: str, model: str, value: Any) -> None:
+        """Store a result in both tiers"""
+        cls._remember(key, copy.deepcopy(value))
+        db = SessionLocal()
+        try:
+            entry = db.query(SummaryCacheEntry).filter(SummaryCacheEntry.key == key).first()
+            if entry is None:
+                entry = SummaryCacheEntry(key=key)
+                db.add(entry)
+            entry.kind = kind
+            entry.model = model
+            entry.value = json.dumps(value)
+            entry.last_accessed_at = datetime.utcnow()
+            db.commit()
+            cls._evict(db)
+        finally:
+            db.close()
+
+    @staticmethod
+    def _evict(db) -> None:
+        excess = db.query(func.count(SummaryCacheEntry.key)).scalar() - settings.SUMMARY_CACHE_MAX_ENTRIES
+        if excess <= 0:
+            return
+        oldest = (
+            db.query(SummaryCacheEntry.key)
+            .order_by(SummaryCacheEntry.last_accessed_at.asc())
+            .limit(excess)
+            .subquery()
+        )
+        db.query(SummaryCacheEntry).filter(
+            SummaryCacheEntry.key.in_(oldest.select())
+        ).delete(synchronize_session=False)
+        db.commit()
+
+    @classmethod
+    def get_or_compute(cls, kind: str, text: str, model: str, params: Dict[str, Any], compute: Callable[[], Any]) -> Any:
+        """Return the cached result for ``text`` or compute and cache it"""
+        if not settings.SUMMARY_CACHE_ENABLED:
+            return compute()
+        key = cls.make_key(kind, text, model, params)
+        cached = cls.get(key)
+        if cached is not None:
+            return cached
+        value = compute()
+        cls.put(key, kind, model, value)
+        return value
+
+    @classmethod
+    def purge(cls) -> int:
+        """Delete every cached result from both tiers"""
+        with cls._lock:
+            cls._memory.clear()
+        db = SessionLocal()
+        try:
+            deleted = db.query(SummaryCacheEntry).delete(synchronize_session=False)
+            db.commit()
+            return deleted
+        finally:
+            db.close()
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """Hit/miss counters for this process and the size of each tier"""
+        db = SessionLocal()
+        try:
+            disk_entries = db.query(func.count(SummaryCacheEntry.key)).scalar()
+        finally:
+            db.close()
+        with cls._lock:
+            lookups = cls._memory_hits + cls._disk_hits + cls._misses
+            return {
+                "enabled": settings.SUMMARY_CACHE_ENABLED,
+                "memory_hits": cls._memory_hits,
+                "disk_hits": cls._disk_hits,
+                "misses": cls._misses,
+                "hit_rate": round((cls._memory_hits + cls._disk_hits) / lookups, 3) if lookups else 0.0,
+                "memory_entries": len(cls._memory),
+                "disk_entries": disk_entries
+            }
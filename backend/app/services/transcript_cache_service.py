@@ -0,0 +1,137 @@
+from sqlalchemy import func
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.models import TranscriptCacheEntry
+from datetime import datetime
+from typing import Any, Dict, Optional
+import hashlib
+import json
+import threading
+
+class TranscriptCacheService:
+    """Persistent transcript cache keyed by audio content and decode settings"""
+    _hits = 0
+    _misses = 0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def hash_file(file_path: str) -> str:
+        """SHA-256 of a file, read in chunks"""
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as audio_file:
+            for chunk in iter(lambda: audio_file.read(settings.UPLOAD_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def make_key(audio_sha256: str, model: str, options: Dict[str, Any]) -> str:
+        """Cache key for one audio file transcribed with one model and set of decode options"""
+        material = json.dumps([audio_sha256, model, options], sort_keys=True)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def _count(cls, hit: bool) -> None:
+        with cls._lock:
+            if hit:
+                cls._hits += 1
+            else:
+                cls._misses += 1
+
+    @classmethod
+    def get(cls, audio_sha256: str, model: str, options: Dict[str, Any]) -> Optional[str]:
+        """Return the cached transcript, or None on a miss"""
+        if not settings.TRANSCRIPT_CACHE_ENABLED:
+            return None
+        db = SessionLocal()
+        try:
+            entry = db.query(TranscriptCacheEntry).filter(
+                TranscriptCacheEntry.key == cls.make_key(audio_sha256, model, options)
+            ).first()
+            cls._count(entry is not None)
+            if entry is None:
+                return None
+            entry.last_accessed_at = datetime.utcnow()
+            db.commit()
+            return entry.transcript
+        finally:
+            db.close()
+
+    @classmethod
+    def put(cls, audio_sha256: str, model: str, options: Dict[str, Any], transcript: str) -> None:
+        """Store a transcript and evict the least recently used entries above the size limit"""
+        if not settings.TRANSCRIPT_CACHE_ENABLED:
+            return
+        db = SessionLocal()
+        try:
+            key = cls.make_key(audio_sha256, model, options)
+            entry = db.query(TranscriptCacheEntry).filter(TranscriptCacheEntry.key == key).first()
+            if entry is None:
+                entry = TranscriptCacheEntry(key=key)
+                db.add(entry)
+            entry.audio_sha256 = audio_sha256
+            entry.model = model
+            entry.options = json.dumps(options, sort_keys=True)
+            entry.transcript = transcript
+            entry.size_bytes = len(transcript.encode("utf-8"))
+            entry.last_accessed_at = datetime.utcnow()
+            db.commit()
+            cls._evict(db)
+        finally:
+            db.close()
+
+    @staticmethod
+    def _evict(db) -> None:
+        total = db.query(func.coalesce(func.sum(TranscriptCacheEntry.size_bytes), 0)).scalar()
+        if total <= settings.TRANSCRIPT_CACHE_MAX_BYTES:
+            return
+        
+        evict_keys = []
+        oldest_first = (
+            db.query(TranscriptCacheEntry.key, TranscriptCacheEntry.size_bytes)
+            .order_by(TranscriptCacheEntry.last_accessed_at.asc())
+            .all()
+        )
+        for key, size_bytes in oldest_first:
+            if total <= settings.TRANSCRIPT_CACHE_MAX_BYTES:
+                break
+            evict_keys.append(key)
+            total -= size_bytes
+        
+        db.query(TranscriptCacheEntry).filter(
+            TranscriptCacheEntry.key.in_(evict_keys)
+        ).delete(synchronize_session=False)
+        db.commit()
+
+    @classmethod
+    def purge(cls) -> int:
+        """Delete every cached transcript"""
+        db = SessionLocal()
+        try:
+            deleted = db.query(TranscriptCacheEntry).delete(synchronize_session=False)
+            db.commit()
+            return deleted
+        finally:
+            db.close()
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """Hit/miss counters for this process and the current size of the cache"""
+        db = SessionLocal()
+        try:
+            entries, total_bytes = db.query(
+                func.count(TranscriptCacheEntry.key),
+                func.coalesce(func.sum(TranscriptCacheEntry.size_bytes), 0)
+            ).one()
+        finally:
+            db.close()
+        with cls._lock:
+            lookups = cls._hits + cls._misses
+            return {
+                "enabled": settings.TRANSCRIPT_CACHE_ENABLED,
+                "hits": cls._hits,
+                "misses": cls._misses,
+                "hit_rate": round(cls._hits / lookups, 3) if lookups else 0.0,
+                "entries": entries,
+                "total_bytes": total_bytes,
+                "max_bytes": settings.TRANSCRIPT_CACHE_MAX_BYTES
+            }
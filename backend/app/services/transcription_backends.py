@@ -0,0 +1,149 @@
+from app.core.config import settings
+from app.core.model_registry import ModelRegistry
+from typing import Any, Callable, Dict, List, Optional
+import os
+import threading
+
+class FasterWhisperModel:
+    """Adapts a faster-whisper (CTranslate2) model to the openai-whisper ``transcribe`` interface"""
+
+    def __init__(self, model):
+        self.model = model
+
+    def transcribe(self, audio, initial_prompt: Optional[str] = None, task: str = "transcribe", **options) -> Dict[str, Any]:
+        segments, info = self.model.transcribe(audio, initial_prompt=initial_prompt, task=task, **options)
+        segments = [{"start": segment.start, "end": segment.end, "text": segment.text} for segment in segments]
+        return {
+            "text": "".join(segment["text"] for segment in segments),
+            "segments": segments,
+            "language": info.language
+        }
+
+class TranscriptionBackends:
+    """The engines TranscriptionService can transcribe with.
+
+    Every backend is a model in ModelRegistry (loaded on first use) whose
+    ``transcribe(audio, initial_prompt=..., **options)`` returns the
+    openai-whisper result format. Processing time per second of audio is
+    recorded per backend, so deployments can pick one by measured real-time
+    factor.
+    """
+    DESCRIPTIONS = {
+        "whisper": "openai-whisper, fp32 (fp16 on GPU)",
+        "whisper-int8": "openai-whisper on CPU with int8 dynamic quantization of the Linear layers",
+        "faster-whisper": "faster-whisper (CTranslate2) on CPU with int8 weights; requires the faster-whisper package"
+    }
+    # Provider names accepted for backwards compatibility
+    ALIASES = {"huggingface": "whisper"}
+
+    _loaders: Dict[str, Callable[[], Any]] = {}
+    _stats: Dict[str, Dict[str, float]] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _load_whisper():
+        """Load the Whisper model, on the GPU when available"""
+        # Imported here so processes that never transcribe do not pay for torch
+        import whisper
+        import torch
+
+        # Create cache directory if it doesn't exist
+        os.makedirs(settings.HUGGINGFACE_CACHE_DIR, exist_ok=True)
+
+        # Load model
+        model = whisper.load_model(settings.WHISPER_MODEL)
+
+        # Move model to GPU if available
+        if torch.cuda.is_available():
+            model = model.to("cuda")
+        return model
+
+    @staticmethod
+    def _load_whisper_int8():
+        """Load the Whisper model on CPU with int8 weights in its Linear layers"""
+        import whisper
+        import torch
+
+        model = whisper.load_model(settings.WHISPER_MODEL, device="cpu")
+        # whisper.model.Linear only overrides forward to cast weights to the input dtype,
+        # which is a no-op in fp32; quantize_dynamic only swaps exact nn.Linear modules
+        for module in model.modules():
+            if isinstance(module, torch.nn.Linear):
+                module.__class__ = torch.nn.Linear
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+    @staticmethod
+    def _load_faster_whisper():
+        """Load the faster-whisper model with int8 compute on CPU"""
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            raise RuntimeError("The faster-whisper backend requires the faster-whisper package (pip install faster-whisper)")
+
+        model = WhisperModel(
+            settings.WHISPER_MODEL,
+            device="cpu",
+            compute_type="int8",
+            download_root=settings.HUGGINGFACE_CACHE_DIR
+        )
+        return FasterWhisperModel(model)
+
+    @classmethod
+    def register(cls, name: str, loader: Callable[[], Any]) -> None:
+        """Register a backend and its model loader"""
+        cls._loaders[name] = loader
+        ModelRegistry.register(name, loader)
+
+    @classmethod
+    def names(cls) -> List[str]:
+        return list(cls._loaders)
+
+    @classmethod
+    def resolve(cls, provider: Optional[str] = None) -> str:
+        """Backend name for a requested provider (default: TRANSCRIPTION_PROVIDER)"""
+        name = provider or settings.TRANSCRIPTION_PROVIDER
+        name = cls.ALIASES.get(name, name)
+        if name not in cls._loaders:
+            raise ValueError(
+                f"Unknown transcription provider '{name}'. Available: {', '.join(cls.names())}"
+            )
+        return name
+
+    @classmethod
+    def load(cls, name: str):
+        """Load a backend's model outside the registry (e.g. in a pool worker process)"""
+        return cls._loaders[name]()
+
+    @classmethod
+    def record(cls, name: str, audio_seconds: float, processing_seconds: float) -> None:
+        """Record how long a backend took to transcribe some audio"""
+        if audio_seconds <= 0:
+            return
+        with cls._lock:
+            stats = cls._stats.setdefault(name, {"transcriptions": 0, "audio_seconds": 0.0, "processing_seconds": 0.0})
+            stats["transcriptions"] += 1
+            stats["audio_seconds"] += audio_seconds
+            stats["processing_seconds"] += processing_seconds
+            stats["last_real_time_factor"] = processing_seconds / audio_seconds
+
+    @classmethod
+    def stats(cls) -> Dict[str, Dict[str, Any]]:
+        """Real-time factor (processing seconds per second of audio) of each backend; lower is faster"""
+        default = cls.ALIASES.get(settings.TRANSCRIPTION_PROVIDER, settings.TRANSCRIPTION_PROVIDER)
+        with cls._lock:
+            report = {}
+            for name in cls._loaders:
+                stats = cls._stats.get(name)
+                report[name] = {
+                    "description": cls.DESCRIPTIONS.get(name),
+                    "default": name == default,
+                    "transcriptions": stats["transcriptions"] if stats else 0,
+                    "audio_seconds": round(stats["audio_seconds"], 1) if stats else 0.0,
+                    "real_time_factor": round(stats["processing_seconds"] / stats["audio_seconds"], 3) if stats else None,
+                    "last_real_time_factor": round(stats["last_real_time_factor"], 3) if stats else None
+                }
+            return report
+
+TranscriptionBackends.register("whisper", TranscriptionBackends._load_whisper)
+TranscriptionBackends.register("whisper-int8", TranscriptionBackends._load_whisper_int8)
+TranscriptionBackends.register("faster-whisper", TranscriptionBackends._load_faster_whisper)
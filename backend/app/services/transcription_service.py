@@ -1,78 +1,345 @@
 import os
 from fastapi import UploadFile, HTTPException
 import tempfile
+import uuid
 from app.core.config import settings
-import whisper
-import torch
 from app.core.process_manager import ProcessManager
+from app.core.inference import InferenceExecutor
+from app.core.model_registry import ModelRegistry
+from app.core.transcription_pool import TranscriptionPool
+from app.services.upload_service import UploadService
+from app.services.transcript_cache_service import TranscriptCacheService
+from app.services.vad_service import VADService
+from app.services.transcription_backends import TranscriptionBackends
+from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+import time
+from fastapi.concurrency import run_in_threadpool
 
 class TranscriptionService:
-    _model = None
+    @staticmethod
+    def _load_model(backend: str = "whisper"):
+        """Load or initialize the model of a transcription backend"""
+        try:
+            return ModelRegistry.get(backend)
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error loading {backend} model: {str(e)}"
+            )
 
     @staticmethod
-    def _load_model():
-        """Load or initialize the Whisper model"""
-        if TranscriptionService._model is None:
-            try:
-                # Create cache directory if it doesn't exist
-                os.makedirs(settings.HUGGINGFACE_CACHE_DIR, exist_ok=True)
-                
-                # Load model
-                TranscriptionService._model = whisper.load_model("base")
-                
-                # Move model to GPU if available
-                if torch.cuda.is_available():
-                    TranscriptionService._model = TranscriptionService._model.to("cuda")
-            except Exception as e:
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Error loading Whisper model: {str(e)}"
-                )
+    def _resolve_backend(provider: Optional[str]) -> str:
+        try:
+            return TranscriptionBackends.resolve(provider)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    @staticmethod
+    def _cache_model(backend: str) -> str:
+        """Model identifier in the transcript cache key; backends produce different transcripts"""
+        if backend == "whisper":
+            return settings.WHISPER_MODEL
+        return f"{backend}/{settings.WHISPER_MODEL}"
 
     @staticmethod
-    async def transcribe_audio(file: UploadFile, provider: str = "huggingface", process_id: str = None):
+    def _decode_options() -> Dict[str, Any]:
+        """Options passed to Whisper; part of the transcript cache key"""
+        return {"task": "transcribe"}
+
+    @staticmethod
+    def _cache_options() -> Dict[str, Any]:
+        """Everything besides the audio and model that changes the transcript"""
+        options = {**TranscriptionService._decode_options(), "window_seconds": settings.TRANSCRIPTION_WINDOW_SECONDS}
+        if settings.VAD_ENABLED:
+            options["vad"] = {
+                "frame_ms": settings.VAD_FRAME_MS,
+                "threshold_db": settings.VAD_THRESHOLD_DB,
+                "min_energy_db": settings.VAD_MIN_ENERGY_DB,
+                "min_speech_ms": settings.VAD_MIN_SPEECH_MS,
+                "min_silence_ms": settings.VAD_MIN_SILENCE_MS,
+                "padding_ms": settings.VAD_PADDING_MS
+            }
+        if settings.PARALLEL_TRANSCRIPTION_WORKERS > 0:
+            options["parallel"] = {
+                "chunk_seconds": settings.PARALLEL_CHUNK_SECONDS,
+                "overlap_seconds": settings.PARALLEL_OVERLAP_SECONDS,
+                "min_audio_seconds": settings.PARALLEL_MIN_AUDIO_SECONDS
+            }
+        return options
+
+    @staticmethod
+    def _check_cancelled(process_id: Optional[str]) -> None:
+        if process_id and ProcessManager.is_cancelled(process_id):
+            raise HTTPException(status_code=499, detail="Transcription cancelled by user")
+
+    @staticmethod
+    def _iter_windows(transcribe, audio, windows: List[Tuple[int, int]], sample_rate: int, decode_options: Dict[str, Any]):
+        """Transcribe windows in order, yielding (window end, segments, text) after each.
+
+        The text of each window is passed to the next as its prompt, and segment
+        timestamps are shifted onto the timeline of ``audio``.
         """
-        Transcribe audio file using OpenAI's Whisper model
+        previous_text = None
+        for start, end in windows:
+            result = transcribe(audio[start:end], initial_prompt=previous_text, **decode_options)
+            offset = start / sample_rate
+            segments = [
+                {
+                    "start": round(segment["start"] + offset, 2),
+                    "end": round(segment["end"] + offset, 2),
+                    "text": segment["text"].strip()
+                }
+                for segment in result.get("segments", [])
+            ]
+            text = result["text"].strip()
+            if text:
+                # Carry context across the window boundary
+                previous_text = text
+            yield end, segments, text
+
+    @staticmethod
+    def _plan_chunks(windows: List[Tuple[int, int]], sample_rate: int) -> List[Dict[str, Any]]:
+        """Group transcription windows into chunks for the worker pool.
+
+        A chunk is closed at the first silence (a gap between windows) after it
+        reaches PARALLEL_CHUNK_SECONDS. If the speech runs on for another half
+        chunk without a pause, the chunk is cut anyway and the next one starts
+        PARALLEL_OVERLAP_SECONDS early; ``cut`` records where the previous
+        chunk ended so the overlap can be de-duplicated when stitching.
         """
+        chunk_samples = max(1, int(settings.PARALLEL_CHUNK_SECONDS * sample_rate))
+        overlap = int(settings.PARALLEL_OVERLAP_SECONDS * sample_rate)
+        chunks: List[Dict[str, Any]] = []
+        for start, end in windows:
+            if chunks:
+                current = chunks[-1]["windows"]
+                span = current[-1][1] - current[0][0]
+                if span < chunk_samples:
+                    current.append((start, end))
+                    continue
+                if start > current[-1][1]:
+                    chunks.append({"windows": [(start, end)], "cut": None})
+                    continue
+                if span < chunk_samples * 1.5:
+                    current.append((start, end))
+                    continue
+                chunks.append({"windows": [(max(0, start - overlap), end)], "cut": start})
+            else:
+                chunks.append({"windows": [(start, end)], "cut": None})
+        return chunks
+
+    @staticmethod
+    def _transcribe_parallel(
+        backend: str, audio, chunks: List[Dict[str, Any]], sample_rate: int, total_seconds: float, process_id: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Transcribe chunks in the worker pool and stitch their segments back in order.
+
+        Segments whose midpoint lies before a chunk's ``cut`` were already
+        transcribed by the previous chunk and are dropped. Cancellation is
+        checked while waiting; chunks not yet started are cancelled, while a
+        chunk already running in a worker finishes in the background.
+        """
+        decode_options = TranscriptionService._decode_options()
+        futures = []
+        segments: List[Dict[str, Any]] = []
+        results: Dict[int, List] = {}
+        next_index = 0
+        pending = set()
         try:
-            if process_id:
-                ProcessManager.register_process(process_id)
-            
-            # Load model if not already loaded
-            TranscriptionService._load_model()
-            
-            # Save the uploaded file temporarily
-            temp_path = f"uploads/temp_{file.filename}"
-            with open(temp_path, "wb") as buffer:
-                content = await file.read()
-                buffer.write(content)
+            for chunk in chunks:
+                chunk_start = chunk["windows"][0][0]
+                chunk_end = chunk["windows"][-1][1]
+                relative = [(start - chunk_start, end - chunk_start) for start, end in chunk["windows"]]
+                future = TranscriptionPool.submit_chunk(
+                    backend, audio[chunk_start:chunk_end], relative, sample_rate, decode_options
+                )
+                futures.append(future)
+                pending.add(future)
             
-            try:
-                # Check for cancellation before starting transcription
-                if process_id and ProcessManager.is_cancelled(process_id):
-                    raise HTTPException(status_code=499, detail="Transcription cancelled by user")
-                
-                # Transcribe audio
-                result = TranscriptionService._model.transcribe(temp_path)
-                transcript = result["text"]
-                
-                # Check for cancellation after transcription
-                if process_id and ProcessManager.is_cancelled(process_id):
-                    raise HTTPException(status_code=499, detail="Transcription cancelled by user")
+            while pending:
+                done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                TranscriptionService._check_cancelled(process_id)
+                for future in done:
+                    results[futures.index(future)] = future.result()
                 
-                return transcript
-                
-            finally:
-                # Clean up temporary file
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
+                # Publish segments in timeline order as soon as the earliest outstanding chunk is done
+                while next_index in results:
+                    chunk = chunks[next_index]
+                    offset = chunk["windows"][0][0] / sample_rate
+                    cut = chunk["cut"] / sample_rate if chunk["cut"] is not None else None
+                    for window_segments, _ in results.pop(next_index):
+                        for segment in window_segments:
+                            shifted = {
+                                "start": round(segment["start"] + offset, 2),
+                                "end": round(segment["end"] + offset, 2),
+                                "text": segment["text"]
+                            }
+                            if cut is not None and (shifted["start"] + shifted["end"]) / 2 < cut:
+                                continue
+                            segments.append(shifted)
+                            if process_id:
+                                ProcessManager.publish_event(process_id, "segment", shifted)
+                    if process_id:
+                        ProcessManager.update_progress(
+                            process_id,
+                            stage="transcribing",
+                            processed_seconds=round(min(total_seconds, chunk["windows"][-1][1] / sample_rate), 1)
+                        )
+                    next_index += 1
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for running out of memory); the next job starts a fresh pool
+            TranscriptionPool.shutdown(backend)
+            raise
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+        return segments
+
+    @staticmethod
+    def _transcribe_windows(file_path: str, process_id: Optional[str], backend: str = "whisper") -> Dict[str, Any]:
+        """Transcribe decoded audio one window at a time.
+
+        With VAD_ENABLED, long silences are found first and never sent to
+        the model. Recordings with at least PARALLEL_MIN_AUDIO_SECONDS of speech
+        are split into chunks for the worker pool when
+        PARALLEL_TRANSCRIPTION_WORKERS is set. Cancellation is checked between
+        windows, so a cancelled job frees the Whisper pool after at most one
+        window, and progress is published to ProcessManager after each window
+        along with a ``segment`` event per transcribed segment. Segment
+        timestamps are shifted back onto the timeline of the whole recording.
+        """
+        import whisper
+        
+        audio = whisper.load_audio(file_path)
+        sample_rate = whisper.audio.SAMPLE_RATE
+        total_seconds = len(audio) / sample_rate
+        window = max(1, int(settings.TRANSCRIPTION_WINDOW_SECONDS * sample_rate))
+        
+        if settings.VAD_ENABLED:
+            regions = VADService.detect_speech(audio, sample_rate)
+        else:
+            regions = [(0, len(audio))]
+        windows = VADService.plan_windows(regions, window)
+        speech_seconds = sum(end - start for start, end in windows) / sample_rate
+        skipped_seconds = round(total_seconds - speech_seconds, 1)
+        
+        if process_id:
+            ProcessManager.update_progress(
+                process_id,
+                stage="transcribing",
+                processed_seconds=0.0,
+                total_seconds=round(total_seconds, 1),
+                skipped_seconds=skipped_seconds
+            )
+        
+        started = time.perf_counter()
+        chunks = []
+        if settings.PARALLEL_TRANSCRIPTION_WORKERS > 0 and speech_seconds >= settings.PARALLEL_MIN_AUDIO_SECONDS:
+            chunks = TranscriptionService._plan_chunks(windows, sample_rate)
+        
+        if len(chunks) > 1:
+            segments = TranscriptionService._transcribe_parallel(
+                backend, audio, chunks, sample_rate, total_seconds, process_id
+            )
+            text = " ".join(segment["text"] for segment in segments if segment["text"])
+        else:
+            TranscriptionService._check_cancelled(process_id)
+            # Only loaded here: in parallel mode the pool workers hold their own models
+            model = TranscriptionService._load_model(backend)
+            segments = []
+            texts = []
+            transcribe = partial(InferenceExecutor.call, "whisper", model.transcribe)
+            for end, window_segments, window_text in TranscriptionService._iter_windows(
+                transcribe, audio, windows, sample_rate, TranscriptionService._decode_options()
+            ):
+                for segment in window_segments:
+                    segments.append(segment)
+                    if process_id:
+                        ProcessManager.publish_event(process_id, "segment", segment)
+                if window_text:
+                    texts.append(window_text)
                 if process_id:
-                    ProcessManager.remove_process(process_id)
-                    
+                    ProcessManager.update_progress(
+                        process_id,
+                        stage="transcribing",
+                        processed_seconds=round(end / sample_rate, 1)
+                    )
+                TranscriptionService._check_cancelled(process_id)
+            text = " ".join(texts)
+        
+        TranscriptionBackends.record(backend, speech_seconds, time.perf_counter() - started)
+        if process_id:
+            # Trailing silence is never transcribed, so the last window may end before the audio does
+            ProcessManager.update_progress(process_id, processed_seconds=round(total_seconds, 1))
+        if skipped_seconds:
+            print(f"VAD skipped {skipped_seconds:.1f}s of {total_seconds:.1f}s of audio in {file_path}")
+        
+        return {
+            "text": text,
+            "segments": segments,
+            "duration": total_seconds,
+            "skipped_seconds": skipped_seconds
+        }
+
+    @staticmethod
+    def transcribe_file(file_path: str, provider: Optional[str] = None, process_id: str = None, audio_sha256: str = None) -> str:
+        """
+        Transcribe an audio file on disk with the backend named by ``provider``
+        (default: TRANSCRIPTION_PROVIDER).
+        Transcripts are cached by audio content, so a repeat run skips the model.
+        """
+        try:
+            backend = TranscriptionService._resolve_backend(provider)
+            cache_model = TranscriptionService._cache_model(backend)
+            options = TranscriptionService._cache_options()
+            if settings.TRANSCRIPT_CACHE_ENABLED:
+                audio_sha256 = audio_sha256 or TranscriptCacheService.hash_file(file_path)
+                cached = TranscriptCacheService.get(audio_sha256, cache_model, options)
+                if cached is not None:
+                    return cached
+            
+            # Transcribe audio
+            result = TranscriptionService._transcribe_windows(file_path, process_id, backend)
+            transcript = result["text"]
+            
+            if settings.TRANSCRIPT_CACHE_ENABLED:
+                TranscriptCacheService.put(audio_sha256, cache_model, options, transcript)
+            return transcript
+        except HTTPException:
+            raise
         except Exception as e:
-            if process_id:
-                ProcessManager.remove_process(process_id)
             raise HTTPException(
                 status_code=500,
                 detail=f"Transcription error: {str(e)}"
-            ) 
\ No newline at end of file
+            )
+
+    @staticmethod
+    async def transcribe_audio(file: UploadFile, provider: Optional[str] = None, process_id: str = None):
+        """
+        Transcribe an uploaded audio file with the backend named by ``provider``
+        """
+        if process_id:
+            ProcessManager.register_process(process_id)
+        
+        # Save the uploaded file temporarily
+        temp_path = f"uploads/temp_{uuid.uuid4().hex}_{os.path.basename(file.filename)}"
+        try:
+            saved = await UploadService.save_upload(file, temp_path)
+            
+            return await run_in_threadpool(
+                TranscriptionService.transcribe_file,
+                temp_path,
+                provider,
+                process_id=process_id,
+                audio_sha256=saved["sha256"]
+            )
+        finally:
+            # Clean up temporary file
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            if process_id:
+                ProcessManager.remove_process(process_id)
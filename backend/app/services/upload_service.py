@@ -0,0 +1,47 @@
+from fastapi import HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from typing import Any, BinaryIO, Dict
+from app.core.config import settings
+import hashlib
+import os
+
+class UploadService:
+    @staticmethod
+    def _copy_stream(source: BinaryIO, destination: str) -> Dict[str, Any]:
+        """Copy ``source`` to ``destination`` in fixed-size chunks, enforcing MAX_UPLOAD_BYTES.
+
+        The SHA-256 of the content is computed on the same pass.
+        """
+        size = 0
+        digest = hashlib.sha256()
+        try:
+            with open(destination, "wb") as buffer:
+                while True:
+                    chunk = source.read(settings.UPLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    if size > settings.MAX_UPLOAD_BYTES:
+                        raise HTTPException(
+                            status_code=413,
+                            detail=f"File exceeds the maximum upload size of {settings.MAX_UPLOAD_BYTES} bytes"
+                        )
+                    digest.update(chunk)
+                    buffer.write(chunk)
+        except BaseException:
+            # Never leave a partial file behind
+            if os.path.exists(destination):
+                os.remove(destination)
+            raise
+        return {"path": destination, "size": size, "sha256": digest.hexdigest()}
+
+    @staticmethod
+    async def save_upload(file: UploadFile, destination: str) -> Dict[str, Any]:
+        """Stream an uploaded file to disk without holding it in memory"""
+        if file.size is not None and file.size > settings.MAX_UPLOAD_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File exceeds the maximum upload size of {settings.MAX_UPLOAD_BYTES} bytes"
+            )
+        await file.seek(0)
+        return await run_in_threadpool(UploadService._copy_stream, file.file, destination)
@@ -0,0 +1,86 @@
+from app.core.config import settings
+from typing import List, Tuple
+import numpy as np
+
+class VADService:
+    """Energy-based voice activity detection on decoded audio"""
+
+    @staticmethod
+    def _runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Start and end (exclusive) indices of the runs of True in a boolean array"""
+        edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+        return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+    @staticmethod
+    def frame_energy_db(audio: np.ndarray, frame_samples: int) -> np.ndarray:
+        """RMS energy of consecutive non-overlapping frames in dBFS"""
+        frame_count = len(audio) // frame_samples
+        if frame_count == 0:
+            return np.empty(0, dtype=np.float32)
+        frames = audio[:frame_count * frame_samples].reshape(frame_count, frame_samples)
+        power = np.mean(np.square(frames, dtype=np.float32), axis=1)
+        return 10 * np.log10(power + 1e-10)
+
+    @staticmethod
+    def detect_speech(audio: np.ndarray, sample_rate: int) -> List[Tuple[int, int]]:
+        """Return the (start, end) sample ranges of the audio that contain speech.
+
+        A frame counts as speech when its energy is VAD_THRESHOLD_DB above the
+        recording's noise floor (its 10th percentile frame energy), or within
+        VAD_THRESHOLD_DB of its loudest frames, and above VAD_MIN_ENERGY_DB.
+        Pauses shorter than VAD_MIN_SILENCE_MS are bridged, bursts shorter than
+        VAD_MIN_SPEECH_MS are dropped and every region is padded by
+        VAD_PADDING_MS so word edges are not clipped.
+        """
+        frame_samples = max(1, int(sample_rate * settings.VAD_FRAME_MS / 1000))
+        energy = VADService.frame_energy_db(audio, frame_samples)
+        if energy.size == 0:
+            return []
+
+        noise_floor, loud = np.percentile(energy, [10, 95])
+        # When speech barely pauses the 10th percentile is speech itself; never put the
+        # threshold within VAD_THRESHOLD_DB of the loudest frames, so such audio is kept
+        threshold = min(noise_floor + settings.VAD_THRESHOLD_DB, loud - settings.VAD_THRESHOLD_DB)
+        threshold = max(threshold, settings.VAD_MIN_ENERGY_DB)
+        speech = energy > threshold
+
+        # Bridge short pauses inside speech
+        min_silence = int(np.ceil(settings.VAD_MIN_SILENCE_MS / settings.VAD_FRAME_MS))
+        starts, ends = VADService._runs(~speech)
+        interior = (starts > 0) & (ends < speech.size) & (ends - starts < min_silence)
+        for start, end in zip(starts[interior], ends[interior]):
+            speech[start:end] = True
+
+        # Drop clicks and other short bursts
+        min_speech = int(np.ceil(settings.VAD_MIN_SPEECH_MS / settings.VAD_FRAME_MS))
+        starts, ends = VADService._runs(speech)
+        keep = ends - starts >= min_speech
+
+        padding = int(sample_rate * settings.VAD_PADDING_MS / 1000)
+        regions: List[Tuple[int, int]] = []
+        for start, end in zip(starts[keep] * frame_samples, ends[keep] * frame_samples):
+            start = max(0, int(start) - padding)
+            end = min(len(audio), int(end) + padding)
+            if regions and start <= regions[-1][1]:
+                regions[-1] = (regions[-1][0], end)
+            else:
+                regions.append((start, end))
+        return regions
+
+    @staticmethod
+    def plan_windows(regions: List[Tuple[int, int]], window_samples: int) -> List[Tuple[int, int]]:
+        """Pack speech regions into transcription windows of at most ``window_samples``.
+
+        Whisper pads every call to 30 seconds, so a short region costs as much
+        as a full window. Neighbouring regions that fit in one window together
+        are merged (keeping the short pause between them); long regions are
+        split. Only silence that would have cost extra windows is skipped.
+        """
+        windows: List[Tuple[int, int]] = []
+        for start, end in regions:
+            if windows and end - windows[-1][0] <= window_samples:
+                windows[-1] = (windows[-1][0], end)
+                continue
+            for window_start in range(start, end, window_samples):
+                windows.append((window_start, min(end, window_start + window_samples)))
+        return windows
@@ -0,0 +1,98 @@
+"""Measure concurrent SQLite read/write throughput with default and tuned settings.
+
+Usage: python benchmark_db.py [--readers 8] [--writers 2] [--seconds 10]
+
+Runs reader threads (listing the latest meetings) and writer threads
+(inserting a meeting and committing, as the services do) against a fresh
+SQLite file, first with SQLAlchemy's defaults and rollback journal, then with
+the engine from app.core.database (WAL, synchronous=NORMAL, page cache, mmap,
+busy timeout and pool sizing), and prints the operations per second of each.
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from app.core.database import Base, create_db_engine
+from app.models.models import Meeting
+
+def run(db_engine, readers, writers, seconds):
+    Base.metadata.create_all(bind=db_engine)
+    Session = sessionmaker(bind=db_engine)
+    session = Session()
+    session.add_all(Meeting(title=f"Seed {i}", description="x" * 200) for i in range(1000))
+    session.commit()
+    session.close()
+
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+    deadline = time.monotonic() + seconds
+
+    def reader():
+        done = errors = 0
+        session = Session()
+        while time.monotonic() < deadline:
+            try:
+                session.query(Meeting).order_by(Meeting.id.desc()).limit(50).all()
+                session.rollback()
+                done += 1
+            except OperationalError:
+                session.rollback()
+                errors += 1
+        session.close()
+        with lock:
+            counts["reads"] += done
+            counts["errors"] += errors
+
+    def writer():
+        done = errors = 0
+        session = Session()
+        while time.monotonic() < deadline:
+            try:
+                session.add(Meeting(title="Benchmark", description="x" * 200))
+                session.commit()
+                done += 1
+            except OperationalError:
+                session.rollback()
+                errors += 1
+        session.close()
+        with lock:
+            counts["writes"] += done
+            counts["errors"] += errors
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer) for _ in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    db_engine.dispose()
+    return {name: value / seconds for name, value in counts.items()}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    results = {}
+    for label in ("default", "tuned"):
+        with tempfile.TemporaryDirectory() as directory:
+            url = f"sqlite:///{os.path.join(directory, 'benchmark.db')}"
+            if label == "default":
+                db_engine = create_engine(url, connect_args={"check_same_thread": False})
+            else:
+                db_engine = create_db_engine(url, sqlite_tuning=True)
+            results[label] = run(db_engine, args.readers, args.writers, args.seconds)
+            print(f"{label:<8} reads/s: {results[label]['reads']:>10,.0f}  writes/s: {results[label]['writes']:>8,.0f}  errors/s: {results[label]['errors']:>6,.1f}")
+
+    for name in ("reads", "writes"):
+        if results["default"][name]:
+            print(f"{name} speedup: {results['tuned'][name] / results['default'][name]:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Compare the memory of pre-forked API workers with independent processes.
+
+Usage: PRELOAD_MODELS=whisper,summarizer,extractor python benchmark_prefork_memory.py [--workers 4]
+
+Starts the API with one worker to measure a single process, then with
+API_WORKERS=N under the pre-fork launcher, and compares the summed PSS of the
+pre-fork group with N independent processes. Linux only.
+"""
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+def get_json(port, path):
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=5) as response:
+        return json.loads(response.read())
+
+def start_api(workers, port, timeout):
+    env = {**os.environ, "API_WORKERS": str(workers), "API_HOST": "127.0.0.1", "API_PORT": str(port)}
+    process = subprocess.Popen([sys.executable, "-m", "app.main"], env=env)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            memory = get_json(port, "/admin/memory")
+            # Under the pre-fork launcher, wait until every worker is up
+            if workers == 1 or memory.get("group", {}).get("processes") == workers + 1:
+                get_json(port, "/ready")
+                return process
+        except (urllib.error.URLError, ConnectionError):
+            pass
+        time.sleep(1)
+    process.kill()
+    raise SystemExit(f"API with {workers} worker(s) was not ready after {timeout}s")
+
+def stop_api(process):
+    process.send_signal(signal.SIGTERM)
+    process.wait(timeout=60)
+
+def mib(value):
+    return f"{value / 1024 / 1024:,.0f} MiB"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=int, default=600, help="seconds to wait for the models to load")
+    args = parser.parse_args()
+
+    if not os.environ.get("PRELOAD_MODELS"):
+        print("PRELOAD_MODELS is not set, so no model weights are shared; the comparison covers the bare API only")
+
+    process = start_api(1, args.port, args.timeout)
+    try:
+        single = get_json(args.port, "/admin/memory")["process"]["pss"]
+    finally:
+        stop_api(process)
+
+    process = start_api(args.workers, args.port, args.timeout)
+    try:
+        group = get_json(args.port, "/admin/memory")["group"]
+    finally:
+        stop_api(process)
+
+    independent = single * args.workers
+    rows = [
+        ("one process", mib(single)),
+        (f"{args.workers} independent processes (est.)", mib(independent)),
+        (f"pre-fork, {args.workers} workers + parent", f"{mib(group['pss'])} PSS ({mib(group['rss'])} RSS counting shared pages per process)"),
+        ("saved", f"{mib(independent - group['pss'])} ({1 - group['pss'] / independent:.0%})")
+    ]
+    for label, value in rows:
+        print(f"{label + ':':<36} {value}")
+
+if __name__ == "__main__":
+    main()
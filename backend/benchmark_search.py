@@ -0,0 +1,82 @@
+"""Measure full-text search latency over a large number of transcripts.
+
+Usage: python benchmark_search.py [--meetings 20000] [--words 1500] [--runs 20]
+
+Fills a fresh SQLite database with meetings whose transcripts are random
+text of --words words (plus an action item and a decision each), then runs
+GET /api/search queries for common, rare and multi-word terms through
+SearchService and prints the median and 95th percentile latency of each.
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+from sqlalchemy.orm import sessionmaker
+from app.core.database import Base, create_async_db_engine, create_db_engine
+from app.models.models import ActionItem, Decision, Meeting
+from app.services.search_service import SearchService
+from sqlalchemy.ext.asyncio import AsyncSession
+
+QUERIES = ["budget", "roadmap", "launch timeline", "customer churn retention", "kubernetes"]
+
+def vocabulary(size=5000):
+    rng = random.Random(1)
+    words = {"".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 9))) for _ in range(size)}
+    # Query terms occur at realistic rates: common, occasional and rare
+    return sorted(words), {"budget": 0.3, "roadmap": 0.05, "launch": 0.1, "timeline": 0.1,
+                           "customer": 0.2, "churn": 0.02, "retention": 0.05, "kubernetes": 0.001}
+
+def seed(db_engine, meetings, words):
+    Base.metadata.create_all(bind=db_engine)
+    session = sessionmaker(bind=db_engine)()
+    rng = random.Random(2)
+    common, terms = vocabulary()
+    for i in range(meetings):
+        transcript = [rng.choice(common) for _ in range(words)]
+        for term, rate in terms.items():
+            if rng.random() < rate:
+                transcript.insert(rng.randrange(len(transcript)), term)
+        meeting = Meeting(title=f"Meeting {i}", description="Weekly sync", transcript=" ".join(transcript), summary=" ".join(transcript[:60]))
+        meeting.action_items.append(ActionItem(title=f"Follow up {rng.choice(common)}", description=" ".join(transcript[:20]), assignee="someone"))
+        meeting.decisions.append(Decision(title=f"Decided {rng.choice(common)}", description=" ".join(transcript[20:40]), decision_maker="someone", rationale=""))
+        session.add(meeting)
+        if i % 1000 == 999:
+            session.commit()
+    session.commit()
+    session.close()
+
+async def measure(url, runs):
+    async_engine = create_async_db_engine(url)
+    Session = sessionmaker(async_engine, class_=AsyncSession)
+    async with Session() as db:
+        for query in QUERIES:
+            timings = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                results = await SearchService.search_async(db, query, limit=20)
+                timings.append((time.perf_counter() - start) * 1000)
+            p95 = sorted(timings)[int(len(timings) * 0.95) - 1]
+            print(f"{query!r:<30} results: {len(results):>3}  median: {statistics.median(timings):>8.2f} ms  p95: {p95:>8.2f} ms")
+    await async_engine.dispose()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--meetings", type=int, default=20000)
+    parser.add_argument("--words", type=int, default=1500)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        url = f"sqlite:///{os.path.join(directory, 'search.db')}"
+        db_engine = create_db_engine(url)
+        start = time.perf_counter()
+        seed(db_engine, args.meetings, args.words)
+        print(f"Indexed {args.meetings:,} transcripts of {args.words:,} words in {time.perf_counter() - start:.1f} s")
+        db_engine.dispose()
+        asyncio.run(measure(url, args.runs))
+
+if __name__ == "__main__":
+    main()
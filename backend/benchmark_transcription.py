@@ -0,0 +1,51 @@
+"""Measure wall-clock transcription time against the number of pool workers.
+
+Usage: python benchmark_transcription.py recording.mp3 [--workers 1,2,4,8] [--provider whisper-int8]
+
+Worker count 0 is the in-process baseline. The transcript cache is disabled
+and pool startup (model loading) is excluded from the timings.
+"""
+from app.core.config import settings
+from app.core.transcription_pool import TranscriptionPool
+from app.services.transcription_service import TranscriptionService
+from app.services.transcription_backends import TranscriptionBackends
+import argparse
+import time
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("audio_file")
+    parser.add_argument("--workers", default="1,2,4,8", help="comma-separated worker counts to compare")
+    parser.add_argument("--chunk-seconds", type=float, default=settings.PARALLEL_CHUNK_SECONDS)
+    parser.add_argument("--provider", default=None, help="transcription backend (default: TRANSCRIPTION_PROVIDER)")
+    args = parser.parse_args()
+
+    settings.TRANSCRIPT_CACHE_ENABLED = False
+    settings.PARALLEL_CHUNK_SECONDS = args.chunk_seconds
+    # Benchmark every recording in parallel mode, however short
+    settings.PARALLEL_MIN_AUDIO_SECONDS = 0
+
+    baseline = None
+    print(f"{'workers':>8} {'seconds':>10} {'speedup':>8} {'rtf':>8}")
+    backend = TranscriptionBackends.resolve(args.provider)
+    for workers in [0] + [int(count) for count in args.workers.split(",")]:
+        settings.PARALLEL_TRANSCRIPTION_WORKERS = workers
+        TranscriptionPool.shutdown()
+        if workers:
+            TranscriptionPool.warmup(backend)
+        else:
+            TranscriptionService._load_model(backend)
+
+        started = time.perf_counter()
+        TranscriptionService.transcribe_file(args.audio_file, backend)
+        elapsed = time.perf_counter() - started
+
+        baseline = baseline or elapsed
+        rtf = TranscriptionBackends.stats()[backend]["last_real_time_factor"]
+        print(f"{workers:>8} {elapsed:>10.1f} {baseline / elapsed:>7.2f}x {rtf:>8.3f}")
+
+    TranscriptionPool.shutdown()
+
+# Pool workers are spawned and re-import this module, so nothing may run at import time
+if __name__ == "__main__":
+    main()
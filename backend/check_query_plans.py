@@ -0,0 +1,133 @@
+"""Fail if a hot listing or lookup query falls back to a full table scan.
+
+Usage: python check_query_plans.py [--database-url sqlite:///./app.db]
+
+Builds the queries the services run (pages of the meeting listing with its
+status, date and participant filters, first and deep pages of the action
+item and decision listings, lookups by meeting, full-text search and the
+job queue queries), asks SQLite for
+their plans with EXPLAIN QUERY PLAN and exits with status 1 if any of them
+scans a whole table or, for filtered queries, does not search an index.
+Without --database-url the check runs on a fresh database created from the
+models and seeded with sample rows; pass the URL of a migrated database to
+check that its indexes are in place.
+"""
+import argparse
+import os
+import re
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from sqlalchemy import select, text
+from sqlalchemy.orm import sessionmaker
+from app.core.database import Base, create_db_engine
+from app.core.pagination import Keyset
+from app.models.models import ActionItem, Decision, Job, Meeting, MeetingParticipant
+from app.services.action_item_service import ActionItemService
+from app.services.decision_service import DecisionService
+from app.services.job_service import JobService
+from app.services.meeting_service import MeetingService
+from app.services.search_service import SearchService
+
+# "SCAN meetings" without "USING INDEX" reads every row of the table
+FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+
+def queries():
+    """(name, query, whether an index search is required) for every checked query"""
+    now = datetime(2026, 1, 1)
+    week = now + timedelta(days=7)
+    # A page deep into the listing, as a client following next_cursor would request it
+    cursor = Keyset.encode("2025-04-01 00:00:00.000000", 2000)
+    return [
+        ("meetings: newest first", MeetingService._page_query("sqlite"), False),
+        ("meetings: newest first, deep page", MeetingService._page_query("sqlite", after=cursor), True),
+        ("meetings: by status", MeetingService._page_query("sqlite", status="completed"), True),
+        ("meetings: by status, deep page", MeetingService._page_query("sqlite", after=cursor, status="completed"), True),
+        ("meetings: by date range", MeetingService._page_query("sqlite", date_from=now, date_to=week), True),
+        ("meetings: by status and date range", MeetingService._page_query("sqlite", status="completed", date_from=now, date_to=week), True),
+        ("meetings: by participant", MeetingService._page_query("sqlite", participant="person7@example.com"), True),
+        ("meetings: by participant, deep page", MeetingService._page_query("sqlite", after=cursor, participant="person7@example.com"), True),
+        ("meetings: by id", select(Meeting).where(Meeting.id == 1), True),
+        ("action items: newest first, deep page", ActionItemService._page_query("sqlite", after=cursor), True),
+        ("action items: of a meeting", ActionItemService._page_query("sqlite", meeting_id=1), True),
+        ("decisions: newest first, deep page", DecisionService._page_query("sqlite", after=cursor), True),
+        ("decisions: of a meeting", DecisionService._page_query("sqlite", meeting_id=1), True),
+        ("search", text(SearchService._sqlite_query()).bindparams(match=SearchService._sqlite_match(["follow"]), limit=20), True),
+        # The statements JobService runs to claim, look up and requeue jobs
+        ("jobs: next queued", select(Job.id).where(Job.status == JobService.QUEUED).order_by(Job.created_at.asc()).limit(1), True),
+        ("jobs: by id", select(Job).where(Job.id == "job-7"), True),
+        ("jobs: running in a worker", select(Job).where(Job.status == JobService.RUNNING, Job.worker_pid == 1234), True)
+    ]
+
+def seed(db_engine, meetings=5000):
+    """Fill a new database with rows so the planner sees realistic statistics"""
+    Base.metadata.create_all(bind=db_engine)
+    session = sessionmaker(bind=db_engine)()
+    start = datetime(2025, 1, 1)
+    statuses = ["scheduled", "in_progress", "completed", "cancelled", "archived"]
+    for i in range(meetings):
+        session.add(Meeting(
+            title=f"Meeting {i}",
+            status=statuses[i % len(statuses)],
+            date=start + timedelta(hours=i),
+            created_at=start + timedelta(hours=i)
+        ))
+    session.flush()
+    for i in range(meetings):
+        for person in {i % 200, (i * 7) % 200}:
+            session.add(MeetingParticipant(meeting_id=i + 1, participant=f"person{person}@example.com"))
+        created_at = start + timedelta(hours=i)
+        session.add(ActionItem(meeting_id=i + 1, title="Follow up", description="", assignee="someone", created_at=created_at))
+        session.add(Decision(meeting_id=i + 1, title="Decided", description="", decision_maker="someone", rationale="", created_at=created_at))
+        # Most jobs are finished; a few are still waiting or running
+        status = JobService.COMPLETED if i % 50 else (JobService.QUEUED, JobService.RUNNING)[i // 50 % 2]
+        session.add(Job(id=f"job-{i}", kind="summarize_meeting", status=status, created_at=created_at))
+    session.commit()
+    session.close()
+    with db_engine.begin() as connection:
+        connection.execute(text("ANALYZE"))
+
+def query_plan(connection, query):
+    """The steps of SQLite's plan for ``query``, e.g. ``SEARCH meetings USING INDEX ...``"""
+    sql = str(query.compile(connection.engine, compile_kwargs={"literal_binds": True}))
+    return [row[-1] for row in connection.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+
+def plan_problems(plan, needs_search):
+    """Why a plan is not acceptable: full table scans, or no index search where one is required"""
+    problems = [step for step in plan if FULL_SCAN.match(step)]
+    if needs_search and not any(step.startswith("SEARCH") for step in plan):
+        problems.append("no index search")
+    return problems
+
+def check(db_engine):
+    failures = 0
+    with db_engine.connect() as connection:
+        for name, query, needs_search in queries():
+            plan = query_plan(connection, query)
+            ok = not plan_problems(plan, needs_search)
+            failures += not ok
+            print(f"{'ok  ' if ok else 'FAIL'} {name}: {' | '.join(plan)}")
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", help="SQLite database to check instead of a seeded temporary one")
+    args = parser.parse_args()
+
+    if args.database_url:
+        db_engine = create_db_engine(args.database_url)
+        failures = check(db_engine)
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            db_engine = create_db_engine(f"sqlite:///{os.path.join(directory, 'plans.db')}")
+            seed(db_engine)
+            failures = check(db_engine)
+            db_engine.dispose()
+
+    if failures:
+        print(f"{failures} quer{'y' if failures == 1 else 'ies'} without a usable index")
+        sys.exit(1)
+    print("All queries use an index")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+from logging.config import fileConfig
+from alembic import context
+from app.core.config import settings
+from app.core.database import Base, create_db_engine
+import app.models  # noqa: F401 - registers the tables on Base.metadata
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+def run_migrations_offline() -> None:
+    """Emit the migration SQL without connecting to the database"""
+    context.configure(
+        url=settings.DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        render_as_batch=True
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online() -> None:
+    """Run the migrations against DATABASE_URL"""
+    connectable = create_db_engine(settings.DATABASE_URL)
+    with connectable.connect() as connection:
+        # Batch mode recreates SQLite tables for ALTERs SQLite does not support
+        context.configure(connection=connection, target_metadata=target_metadata, render_as_batch=True)
+        with context.begin_transaction():
+            context.run_migrations()
+    connectable.dispose()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,38 @@
+"""Reference uploaded audio by its blob hash
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+
+Tables are created by init_db() when the API starts; migrations bring
+databases created by older versions up to date and are no-ops on new ones.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+def _columns(table: str):
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return None
+    return {column["name"] for column in inspector.get_columns(table)}
+
+def upgrade() -> None:
+    columns = _columns("meetings")
+    if columns is None or "audio_sha256" in columns:
+        return
+    op.add_column("meetings", sa.Column("audio_sha256", sa.String(), nullable=True))
+    if op.get_bind().dialect.name != "sqlite":
+        # SQLite cannot add a constraint to an existing table (and does not enforce it by default)
+        op.create_foreign_key("fk_meetings_audio_sha256", "meetings", "audio_blobs", ["audio_sha256"], ["sha256"])
+
+def downgrade() -> None:
+    columns = _columns("meetings")
+    if columns is None or "audio_sha256" not in columns:
+        return
+    with op.batch_alter_table("meetings") as batch_op:
+        batch_op.drop_column("audio_sha256")
@@ -0,0 +1,39 @@
+"""Indexes for meeting listings and action item / decision lookups
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_meetings_created_at", "meetings", ["created_at"]),
+    ("ix_meetings_date", "meetings", ["date"]),
+    ("ix_meetings_status_created_at", "meetings", ["status", "created_at"]),
+    ("ix_action_items_meeting_id", "action_items", ["meeting_id"]),
+    ("ix_decisions_meeting_id", "decisions", ["meeting_id"])
+]
+
+def _existing_indexes(table: str):
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return None
+    return {index["name"] for index in inspector.get_indexes(table)}
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        existing = _existing_indexes(table)
+        if existing is not None and name not in existing:
+            op.create_index(name, table, columns)
+
+def downgrade() -> None:
+    for name, table, columns in reversed(INDEXES):
+        existing = _existing_indexes(table)
+        if existing is not None and name in existing:
+            op.drop_index(name, table_name=table)
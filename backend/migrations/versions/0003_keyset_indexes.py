@@ -0,0 +1,54 @@
+"""Indexes for cursor pagination of action items and decisions
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+
+Listings are ordered by (created_at, id); the meeting_id indexes are
+replaced by (meeting_id, created_at), which also serves the foreign key.
+The meetings indexes from 0002 already end in created_at.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+CREATED = [
+    ("ix_action_items_created_at", "action_items", ["created_at"]),
+    ("ix_action_items_meeting_id_created_at", "action_items", ["meeting_id", "created_at"]),
+    ("ix_decisions_created_at", "decisions", ["created_at"]),
+    ("ix_decisions_meeting_id_created_at", "decisions", ["meeting_id", "created_at"])
+]
+REPLACED = [
+    ("ix_action_items_meeting_id", "action_items", ["meeting_id"]),
+    ("ix_decisions_meeting_id", "decisions", ["meeting_id"])
+]
+
+def _existing_indexes(table: str):
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return None
+    return {index["name"] for index in inspector.get_indexes(table)}
+
+def _create(indexes) -> None:
+    for name, table, columns in indexes:
+        existing = _existing_indexes(table)
+        if existing is not None and name not in existing:
+            op.create_index(name, table, columns)
+
+def _drop(indexes) -> None:
+    for name, table, columns in indexes:
+        existing = _existing_indexes(table)
+        if existing is not None and name in existing:
+            op.drop_index(name, table_name=table)
+
+def upgrade() -> None:
+    _create(CREATED)
+    _drop(REPLACED)
+
+def downgrade() -> None:
+    _create(REPLACED)
+    _drop(CREATED)
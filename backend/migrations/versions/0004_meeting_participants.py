@@ -0,0 +1,85 @@
+"""Store participants as JSON and index them in meeting_participants
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+
+meetings.participants becomes a JSON column (on SQLite it stays TEXT, the
+stored JSON strings are read as they are). Every participant of existing
+meetings is copied, lowercased, into meeting_participants, which serves
+the ?participant= filter of the meeting listing. The table may already
+exist, empty, if the API was started before migrating.
+"""
+from alembic import op
+import sqlalchemy as sa
+import json
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+def _has_table(table: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(table)
+
+def _decode(participants):
+    """Participants of a row as a list; None for empty or unreadable values"""
+    if isinstance(participants, str):
+        try:
+            participants = json.loads(participants)
+        except ValueError:
+            return None
+    if not isinstance(participants, list):
+        return None
+    return [str(participant) for participant in participants]
+
+def upgrade() -> None:
+    if not _has_table("meetings"):
+        return
+    bind = op.get_bind()
+    if not _has_table("meeting_participants"):
+        op.create_table(
+            "meeting_participants",
+            sa.Column("meeting_id", sa.Integer(), sa.ForeignKey("meetings.id", ondelete="CASCADE"), primary_key=True),
+            sa.Column("participant", sa.String(length=255), primary_key=True)
+        )
+        op.create_index(
+            "ix_meeting_participants_participant_meeting_id", "meeting_participants", ["participant", "meeting_id"]
+        )
+
+    meetings = sa.table("meetings", sa.column("id", sa.Integer), sa.column("participants", sa.Text))
+    participant_rows = sa.table(
+        "meeting_participants", sa.column("meeting_id", sa.Integer), sa.column("participant", sa.String)
+    )
+    existing = set(bind.execute(sa.select(participant_rows.c.meeting_id, participant_rows.c.participant)))
+    rows = []
+    for meeting_id, participants in bind.execute(
+        sa.select(meetings.c.id, meetings.c.participants).where(meetings.c.participants.isnot(None))
+    ):
+        decoded = _decode(participants)
+        if decoded is None:
+            # Not valid JSON: the old code returned [] for these, so drop the value
+            bind.execute(meetings.update().where(meetings.c.id == meeting_id).values(participants=None))
+            continue
+        for name in dict.fromkeys(participant.strip().lower() for participant in decoded):
+            if name and (meeting_id, name) not in existing:
+                rows.append({"meeting_id": meeting_id, "participant": name})
+    if rows:
+        op.bulk_insert(participant_rows, rows)
+
+    if bind.dialect.name != "sqlite":
+        op.alter_column(
+            "meetings", "participants",
+            type_=sa.JSON(), existing_type=sa.Text(), postgresql_using="participants::json"
+        )
+
+def downgrade() -> None:
+    if not _has_table("meetings"):
+        return
+    if op.get_bind().dialect.name != "sqlite":
+        op.alter_column(
+            "meetings", "participants",
+            type_=sa.Text(), existing_type=sa.JSON(), postgresql_using="participants::text"
+        )
+    if _has_table("meeting_participants"):
+        op.drop_table("meeting_participants")
@@ -0,0 +1,34 @@
+"""Full-text search index over meetings, action items and decisions
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+
+Creates the index described in app.models.search_index (FTS5 tables and
+triggers on SQLite, GIN tsvector indexes on PostgreSQL) and, on SQLite,
+indexes the rows that already exist. The API creates an empty index at
+startup if it is missing; this migration is what fills it for old rows.
+"""
+from alembic import op
+from app.models.search_index import drop_search_index_ddl, rebuild_search_index_ddl, search_index_ddl
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+def _has_tables() -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return all(inspector.has_table(table) for table in ("meetings", "action_items", "decisions"))
+
+def upgrade() -> None:
+    if not _has_tables():
+        return
+    dialect_name = op.get_bind().dialect.name
+    for statement in search_index_ddl(dialect_name) + rebuild_search_index_ddl(dialect_name):
+        op.execute(statement)
+
+def downgrade() -> None:
+    for statement in drop_search_index_ddl(op.get_bind().dialect.name):
+        op.execute(statement)
@@ -0,0 +1,35 @@
+"""Record the process running each job
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+
+The pre-fork supervisor requeues the jobs of a worker that died, which it
+finds by the worker's PID.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+def _columns(table: str):
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return None
+    return {column["name"] for column in inspector.get_columns(table)}
+
+def upgrade() -> None:
+    columns = _columns("jobs")
+    if columns is None or "worker_pid" in columns:
+        return
+    op.add_column("jobs", sa.Column("worker_pid", sa.Integer(), nullable=True))
+
+def downgrade() -> None:
+    columns = _columns("jobs")
+    if columns is None or "worker_pid" not in columns:
+        return
+    with op.batch_alter_table("jobs") as batch_op:
+        batch_op.drop_column("worker_pid")
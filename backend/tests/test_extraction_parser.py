@@ -0,0 +1,90 @@
+"""Parsing of the extractor's ACTION:/DECISION: output"""
+import pytest
+from app.services.summarization_service import SummarizationService
+
+parse = SummarizationService._parse_extraction
+
+def test_parses_complete_lines():
+    items = parse(
+        "ACTION: Fix the crash bugs | Bob | 2026-03-06\n"
+        "DECISION: Move the launch to March 10th | Alice | Two crash bugs in the payment screen"
+    )
+    assert items == {
+        "action_items": [{
+            "title": "Fix the crash bugs",
+            "description": "Fix the crash bugs",
+            "assignee": "Bob",
+            "due_date": "2026-03-06T00:00:00"
+        }],
+        "decisions": [{
+            "title": "Move the launch to March 10th",
+            "description": "Move the launch to March 10th",
+            "decision_maker": "Alice",
+            "rationale": "Two crash bugs in the payment screen"
+        }]
+    }
+
+def test_items_on_one_line_and_any_case():
+    items = parse("action: Update release notes | Carol | none ACTION: Tell marketing | Carol DECISION: Ship it")
+    assert [item["title"] for item in items["action_items"]] == ["Update release notes", "Tell marketing"]
+    assert [item["title"] for item in items["decisions"]] == ["Ship it"]
+
+def test_missing_assignee_and_due_date():
+    items = parse("ACTION: Run the regression suite\nDECISION: Keep the old API")
+    assert items["action_items"] == [{
+        "title": "Run the regression suite",
+        "description": "Run the regression suite",
+        "assignee": "",
+        "due_date": None
+    }]
+    assert items["decisions"][0]["decision_maker"] == ""
+    assert items["decisions"][0]["rationale"] == ""
+
+def test_missing_due_date_keeps_assignee():
+    items = parse("ACTION: Book the room | Dana |")
+    assert items["action_items"][0]["assignee"] == "Dana"
+    assert items["action_items"][0]["due_date"] is None
+
+def test_malformed_lines():
+    items = parse(
+        "ACTION:\n"
+        "ACTION: | Bob | 2026-01-01\n"
+        "DECISION:   -  \n"
+        "ACTION: - Send the invoice * | Erin | next Friday | extra | fields\n"
+    )
+    # Items without a task are dropped; extra fields are ignored and an unreadable date is left empty
+    assert items["decisions"] == []
+    assert items["action_items"] == [{
+        "title": "Send the invoice",
+        "description": "Send the invoice",
+        "assignee": "Erin",
+        "due_date": None
+    }]
+
+def test_lines_without_a_known_prefix_are_ignored():
+    items = parse(
+        "Here are the items from the meeting:\n"
+        "TODO: Clean up the backlog | Frank | 2026-02-01\n"
+        "TRANSACTION: Refund the customer | Grace | 2026-02-02\n"
+        "- Decided to hire two engineers"
+    )
+    assert items == {"action_items": [], "decisions": []}
+
+def test_long_titles_are_truncated():
+    task = "x" * 300
+    item = parse(f"ACTION: {task} | {'y' * 300}")["action_items"][0]
+    assert len(item["title"]) == 255
+    assert item["description"] == task
+    assert len(item["assignee"]) == 255
+
+@pytest.mark.parametrize("value, expected", [
+    ("2026-03-10", "2026-03-10T00:00:00"),
+    ("2026-03-10T09:30", "2026-03-10T09:30:00"),
+    ("none", None),
+    ("", None),
+    ("next Friday", None),
+    ("2026-02-30", None),
+    ("10/03/2026", None)
+])
+def test_parse_due_date(value, expected):
+    assert SummarizationService._parse_due_date(value) == expected
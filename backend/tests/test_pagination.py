@@ -0,0 +1,90 @@
+"""Keyset cursors and paging through the listing endpoints"""
+import base64
+import json
+from datetime import datetime, timedelta
+import pytest
+from app.core.pagination import Keyset
+from app.models.models import ActionItem, Meeting
+
+def raw_cursor(value) -> str:
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).decode().rstrip("=")
+
+def test_round_trip():
+    created_at = datetime(2026, 3, 10, 9, 30, 15, 123456)
+    cursor = Keyset.encode(created_at, 42)
+    assert "=" not in cursor
+    assert Keyset.decode(cursor, "postgresql") == (created_at, 42)
+    # SQLite compares the stored text, so the value stays a string
+    assert Keyset.decode(cursor, "sqlite") == ("2026-03-10T09:30:15.123456", 42)
+    assert Keyset.decode(Keyset.encode("2026-03-10 09:30:15", 7), "sqlite") == ("2026-03-10 09:30:15", 7)
+    assert Keyset.decode(Keyset.encode(None, 3), "postgresql") == (None, 3)
+
+MALFORMED_CURSORS = [
+    "not a cursor!",
+    "%%%",
+    "YQ",
+    base64.urlsafe_b64encode(b"\xff\xfe\xfd").decode(),
+    raw_cursor({"created_at": "2026-01-01", "id": 1}),
+    raw_cursor(["2026-01-01"]),
+    raw_cursor(["2026-01-01", 1, 2]),
+    raw_cursor("ab"),
+    raw_cursor(["2026-01-01", "1"]),
+    raw_cursor(["2026-01-01", 1.5]),
+    raw_cursor(["2026-01-01", True]),
+    raw_cursor(["2026-01-01", 10 ** 30]),
+    raw_cursor([["2026-01-01"], 1]),
+    raw_cursor([{"a": 1}, 1]),
+    raw_cursor("[" * 5000),
+    Keyset.encode("2026-01-01", 1) + "A" * 300
+]
+
+@pytest.mark.parametrize("cursor", MALFORMED_CURSORS)
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError):
+        Keyset.decode(cursor, "sqlite")
+
+def test_cursor_with_invalid_date_is_rejected():
+    with pytest.raises(ValueError):
+        Keyset.decode(Keyset.encode("yesterday", 1), "postgresql")
+
+@pytest.mark.parametrize("path", ["/api/meetings/", "/api/action-items/", "/api/decisions/"])
+@pytest.mark.parametrize("cursor", MALFORMED_CURSORS)
+def test_malformed_cursor_is_a_bad_request(client, path, cursor):
+    response = client.get(path, params={"after": cursor})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid pagination cursor"
+
+def pages(client, path, **params):
+    ids, cursor = [], None
+    while True:
+        response = client.get(path, params={**params, "after": cursor} if cursor else params)
+        assert response.status_code == 200
+        body = response.json()
+        ids += [item["id"] for item in body["items"]]
+        cursor = body["next_cursor"]
+        if not cursor:
+            return ids
+
+def test_ties_on_created_at_are_broken_by_id(client, db):
+    same_second = datetime(2026, 2, 1, 12, 0, 0)
+    created = [same_second + timedelta(hours=1), same_second - timedelta(hours=1)] + [same_second] * 7
+    meetings = [Meeting(title=f"Tie {i}", status="tie-test", created_at=at) for i, at in enumerate(created)]
+    db.add_all(meetings)
+    db.commit()
+    expected = [meeting.id for meeting in sorted(meetings, key=lambda m: (m.created_at, m.id), reverse=True)]
+
+    # Pages of two split the rows sharing a timestamp; none may be repeated or skipped
+    for limit in (1, 2, 3, 100):
+        assert pages(client, "/api/meetings/", status="tie-test", limit=limit) == expected
+
+def test_action_items_with_the_same_created_at_are_all_listed(client, db):
+    meeting = Meeting(title="Items", status="tie-items")
+    created_at = datetime(2026, 2, 2, 8, 0, 0)
+    meeting.action_items = [
+        ActionItem(title=f"Item {i}", description="", assignee="", created_at=created_at) for i in range(5)
+    ]
+    db.add(meeting)
+    db.commit()
+    expected = sorted((item.id for item in meeting.action_items), reverse=True)
+
+    assert pages(client, "/api/action-items/", meeting_id=meeting.id, limit=2) == expected
@@ -0,0 +1,18 @@
+"""The listing, pagination, search and job queue queries must not scan whole tables"""
+import pytest
+from app.core.database import create_db_engine
+from check_query_plans import plan_problems, queries, query_plan, seed
+
+@pytest.fixture(scope="module")
+def connection(tmp_path_factory):
+    db_engine = create_db_engine(f"sqlite:///{tmp_path_factory.mktemp('plans') / 'plans.db'}")
+    seed(db_engine)
+    with db_engine.connect() as connection:
+        yield connection
+    db_engine.dispose()
+
+@pytest.mark.parametrize("name, query, needs_search", queries(), ids=[name for name, _, _ in queries()])
+def test_query_uses_an_index(connection, name, query, needs_search):
+    plan = query_plan(connection, query)
+    # "SCAN meetings USING INDEX" walks an index in order and stops after the page; only a bare SCAN reads every row
+    assert not plan_problems(plan, needs_search), " | ".join(plan)
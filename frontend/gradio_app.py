@@ -49,41 +49,105 @@ def cancel_process():
             return f"Error cancelling process: {str(e)}"
     return "No active process to cancel"
 
+def _format_action_items(action_items):
+    """Format extracted action items as one bullet per item"""
+    lines = []
+    for item in action_items or []:
+        line = f"- {item.get('title', '')}"
+        if item.get("assignee"):
+            line += f" (Owner: {item['assignee']})"
+        if item.get("due_date"):
+            line += f" - due {item['due_date'][:10]}"
+        lines.append(line)
+    return "\n".join(lines) if lines else "No Action Items found"
+
+def _format_decisions(decisions):
+    """Format extracted decisions as one bullet per decision"""
+    lines = []
+    for decision in decisions or []:
+        line = f"- {decision.get('title', '')}"
+        if decision.get("decision_maker"):
+            line += f" (By: {decision['decision_maker']})"
+        if decision.get("rationale"):
+            line += f" - {decision['rationale']}"
+        lines.append(line)
+    return "\n".join(lines) if lines else "No Decisions made"
+
+def _iter_progress_events(process_id):
+    """Yield (event, data) pairs from the server-sent progress stream of a process"""
+    with requests.get(f"{BACKEND_URL}/api/meetings/progress/{process_id}", stream=True) as response:
+        if response.status_code != 200:
+            yield "error", _format_error_message(response.status_code, response.text)
+            return
+        event, data_lines = "message", []
+        for line in response.iter_lines(decode_unicode=True):
+            if line:
+                if line.startswith("event:"):
+                    event = line[len("event:"):].strip()
+                elif line.startswith("data:"):
+                    data_lines.append(line[len("data:"):].strip())
+                continue
+            # A blank line ends an event; comment-only keep-alives carry no data
+            if data_lines:
+                yield event, json.loads("\n".join(data_lines))
+            event, data_lines = "message", []
+
+def _format_progress(progress):
+    """Describe the current processing stage for the summary box"""
+    stage = progress.get("stage", "processing")
+    if stage == "transcribing" and progress.get("total_seconds"):
+        return f"Transcribing... {progress.get('processed_seconds', 0):.0f}s / {progress['total_seconds']:.0f}s"
+    return f"{stage.capitalize()}..."
+
 # Function to handle audio upload and processing
 def process_audio(audio_file):
+    """Upload the audio and update the outputs as progress events arrive"""
     global current_process_id, cancellation_event
     
     if audio_file is None:
-        return "No file uploaded.", "", "No Action Items found", "No Decisions made"
+        yield "No file uploaded.", "", "No Action Items found", "No Decisions made"
+        return
     
     try:
         # Reset cancellation event
         cancellation_event.clear()
         process_id = str(uuid.uuid4())
         current_process_id = process_id  # Set immediately so cancel works
+        yield "", "Uploading...", "No Action Items found", "No Decisions made"
         
         with open(audio_file, "rb") as f:
             files = {"file": (audio_file, f, "audio/mpeg")}
             data = {"transcribe": "true", "summarize": "true", "process_id": process_id}
             
             response = requests.post(f"{BACKEND_URL}/api/meetings/upload-direct", files=files, data=data)
-            
-            if response.status_code == 200:
-                result = response.json()
-                transcript = result.get("transcript", "")
-                summary = result.get("summary", "")
-                action_items = result.get("action_items", "")
-                decisions = result.get("decisions", "")
+        
+        if response.status_code != 202:
+            yield _format_error_message(response.status_code, response.text), "", "No Action Items found", "No Decisions made"
+            return
 
-                action_items_str = action_items if action_items else "No Action Items found"
-                decisions_str = decisions if decisions else "No Decisions made"
-                return transcript, summary, action_items_str, decisions_str
-            elif response.status_code == 499:
-                return "Process cancelled by user", "", "No Action Items found", "No Decisions made"
-            else:
-                return _format_error_message(response.status_code, response.text), "", "No Action Items found", "No Decisions made"
+        segments = []
+        for event, data in _iter_progress_events(response.json()["job_id"]):
+            if event == "error":
+                yield data, "", "No Action Items found", "No Decisions made"
+            elif event == "progress":
+                yield " ".join(segments), _format_progress(data), "No Action Items found", "No Decisions made"
+            elif event == "segment":
+                segments.append(data["text"])
+                yield " ".join(segments), "Transcribing...", "No Action Items found", "No Decisions made"
+            elif event == "cancelled":
+                yield "Process cancelled by user", "", "No Action Items found", "No Decisions made"
+            elif event == "failed":
+                yield f"Error: {data.get('error')}", "", "No Action Items found", "No Decisions made"
+            elif event == "completed":
+                result = data.get("result") or {}
+                yield (
+                    result.get("transcript", ""),
+                    result.get("summary", ""),
+                    _format_action_items(result.get("action_items")),
+                    _format_decisions(result.get("decisions"))
+                )
     except Exception as e:
-        return f"Exception: {str(e)}", "", "No Action Items found", "No Decisions made"
+        yield f"Exception: {str(e)}", "", "No Action Items found", "No Decisions made"
     finally:
         current_process_id = None
 
@@ -124,17 +188,24 @@ def schedule_meeting(title, description, start_time, end_time, attendees):
 
 def get_all_meetings():
     try:
-        response = requests.get(f"{BACKEND_URL}/api/meetings/")
-        if response.status_code == 200:
-            meetings = response.json()
-            if not meetings:
-                return "No meetings found."
-            out = ""
-            for m in meetings:
-                out += f"ID: {m['id']}\n"
-            return out
-        else:
-            return _format_error_message(response.status_code, response.text)
+        meetings = []
+        params = {}
+        # The listing is paginated; follow next_cursor until the last page
+        while True:
+            response = requests.get(f"{BACKEND_URL}/api/meetings/", params=params)
+            if response.status_code != 200:
+                return _format_error_message(response.status_code, response.text)
+            page = response.json()
+            meetings.extend(page["items"])
+            if not page.get("next_cursor"):
+                break
+            params["after"] = page["next_cursor"]
+        if not meetings:
+            return "No meetings found."
+        out = ""
+        for m in meetings:
+            out += f"ID: {m['id']}\n"
+        return out
     except Exception as e:
         return f"Exception: {str(e)}"
 
@@ -322,4 +393,6 @@ with gr.Blocks(title="AI Meeting Summarizer") as demo:
                     delete_btn.click(fn=delete_meeting, inputs=delete_meeting_id_input, outputs=delete_result)
 
 if __name__ == "__main__":
+    # Queuing is required for process_audio to stream updates
+    demo.queue()
     demo.launch() 
\ No newline at end of file